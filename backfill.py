@@ -0,0 +1,49 @@
+"""
+Job Backfill Entry Point
+Re-derives technologies, category and seniority for jobs already in the database
+"""
+
+import argparse
+
+from database.backfill import backfill_derived_fields
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="Refresh derived job columns after the technology taxonomy or categorizer changes"
+    )
+    parser.add_argument(
+        "--start-id", type=int, metavar="ID",
+        help="First job id to process (use the id printed by an interrupted run to resume)"
+    )
+    parser.add_argument(
+        "--end-id", type=int, metavar="ID",
+        help="Last job id to process (default: all remaining jobs)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, metavar="N",
+        help="Number of processes used for technology extraction"
+    )
+    parser.add_argument(
+        "--seniority", action="store_true",
+        help="Also re-derive seniority_level for platforms where it comes from the job text alone"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Count the rows that would change without writing them"
+    )
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    print("Backfilling derived job columns...")
+    result = backfill_derived_fields(
+        start_id=args.start_id,
+        end_id=args.end_id,
+        workers=args.workers,
+        seniority=args.seniority,
+        dry_run=args.dry_run
+    )
+    if result is None:
+        print("Backfill did not complete. Please check your PostgreSQL connection.")
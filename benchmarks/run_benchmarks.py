@@ -0,0 +1,227 @@
+"""
+Text Analytics Benchmarks
+Throughput, latency and allocations of the text functions over a fixed job corpus
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Run as a script (python benchmarks/run_benchmarks.py), only benchmarks/
+# is on sys.path; the repository root is needed for the package imports
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.categorizer import categorize_cache_clear, categorize_job_title
+from utils.date_utils import parse_posted_date
+from utils.tech_extractor import extract_technologies
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+CORPUS_PATH = os.path.join(DATA_DIR, 'corpus.json')
+GOLDEN_PATH = os.path.join(DATA_DIR, 'golden.json')
+BASELINE_PATH = os.path.join(DATA_DIR, 'baseline.json')
+
+# Output fields checked against the golden file, in report order
+GOLDEN_FIELDS = ('technologies', 'category', 'posted_date')
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_json(path, data):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+def get_benchmarks(reference_time):
+    """
+    name -> (function called once per corpus job, setup run before every pass).
+    Each function builds its input the way the scrapers do.
+    """
+    return {
+        'extract_technologies': (
+            lambda job: extract_technologies(f"{job['job_title']} {job['description']}"), None
+        ),
+        'categorize_job_title': (
+            lambda job: categorize_job_title(job['job_title']), categorize_cache_clear
+        ),
+        'parse_posted_date': (
+            lambda job: parse_posted_date(job['posted_text'], reference_time), None
+        ),
+    }
+
+def compute_outputs(jobs, reference_time):
+    """The golden fields for every job, keyed by job id"""
+    return {
+        str(job['id']): {
+            'technologies': extract_technologies(f"{job['job_title']} {job['description']}"),
+            'category': categorize_job_title(job['job_title']),
+            'posted_date': parse_posted_date(job['posted_text'], reference_time),
+        }
+        for job in jobs
+    }
+
+def check_golden(outputs, golden):
+    """Return a list of (job id, field, expected, actual) differences"""
+    differences = []
+    for job_id, expected in golden.items():
+        actual = outputs.get(job_id, {})
+        for field in GOLDEN_FIELDS:
+            if actual.get(field) != expected.get(field):
+                differences.append((job_id, field, expected.get(field), actual.get(field)))
+    return differences
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def run_benchmark(function, setup, jobs, repeat):
+    """
+    Time one function over the corpus. Every pass starts from setup; the
+    first pass only warms up. Latency percentiles cover every timed call;
+    docs/sec uses the fastest pass, the one least disturbed by the machine.
+    A last pass runs under tracemalloc for peak and retained memory, since
+    tracing slows the timed passes.
+    """
+    latencies = []
+    pass_times = []
+    clock = time.perf_counter_ns
+
+    for pass_number in range(repeat + 1):
+        if setup:
+            setup()
+        pass_start = clock()
+        for job in jobs:
+            start = clock()
+            function(job)
+            latencies.append(clock() - start)
+        if pass_number == 0:
+            latencies.clear()
+        else:
+            pass_times.append(clock() - pass_start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for job in jobs:
+            function(job)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'docs_per_sec': round(len(jobs) / (min(pass_times) / 1e9), 1),
+        'p50_us': round(percentile(latencies, 0.50) / 1e3, 2),
+        'p99_us': round(percentile(latencies, 0.99) / 1e3, 2),
+        'peak_kib': round((peak - before) / 1024, 1),
+        'retained_kib': round((after - before) / 1024, 1),
+    }
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Print each result next to the baseline; return the names that got slower than tolerance allows"""
+    regressions = []
+    print(f"\n{'benchmark':<24}{'docs/sec':>12}{'baseline':>12}{'change':>9}{'p50 us':>10}{'p99 us':>10}{'peak KiB':>10}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base:
+            change = result['docs_per_sec'] / base['docs_per_sec'] - 1
+            flag = ''
+            if change < -tolerance:
+                flag = '  SLOWER'
+                regressions.append(name)
+            baseline_text, change_text = f"{base['docs_per_sec']:.1f}", f"{change:+.0%}"
+        else:
+            flag, baseline_text, change_text = '', '-', '-'
+        print(f"{name:<24}{result['docs_per_sec']:>12.1f}{baseline_text:>12}{change_text:>9}"
+              f"{result['p50_us']:>10.2f}{result['p99_us']:>10.2f}{result['peak_kib']:>10.1f}{flag}")
+    return regressions
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the technology extractor, categorizer and date parser against a fixed corpus"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=10, metavar="N",
+        help="Timed passes over the corpus per benchmark"
+    )
+    parser.add_argument(
+        "--only", action="append", metavar="NAME",
+        help="Run only this benchmark (can be given more than once)"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, metavar="FRACTION",
+        help="Allowed drop in docs/sec before a benchmark counts as slower than the baseline"
+    )
+    parser.add_argument(
+        "--update-golden", action="store_true",
+        help="Rewrite the golden outputs from the current code (after an intended change in results)"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="Store this run's numbers as the new baseline"
+    )
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    corpus = load_json(CORPUS_PATH)
+    jobs = corpus['jobs']
+    reference_time = datetime.fromisoformat(corpus['reference_time'])
+    print(f"Corpus: {len(jobs)} jobs, reference time {corpus['reference_time']}")
+
+    # Results first: a faster function that answers differently is a bug
+    outputs = compute_outputs(jobs, reference_time)
+    if args.update_golden:
+        save_json(GOLDEN_PATH, outputs)
+        print(f"Golden outputs written to {GOLDEN_PATH}")
+        golden_ok = True
+    else:
+        differences = check_golden(outputs, load_json(GOLDEN_PATH))
+        golden_ok = not differences
+        if golden_ok:
+            print(f"Golden outputs: all {len(jobs)} jobs match")
+        else:
+            print(f"Golden outputs: {len(differences)} differences")
+            for job_id, field, expected, actual in differences[:20]:
+                print(f"  job {job_id} {field}: expected {expected!r}, got {actual!r}")
+
+    benchmarks = get_benchmarks(reference_time)
+    names = args.only or list(benchmarks)
+    unknown = [name for name in names if name not in benchmarks]
+    if unknown:
+        print(f"Unknown benchmark: {', '.join(unknown)} (choose from {', '.join(benchmarks)})")
+        return 2
+
+    results = {}
+    for name in names:
+        function, setup = benchmarks[name]
+        results[name] = run_benchmark(function, setup, jobs, args.repeat)
+
+    baseline = load_json(BASELINE_PATH) if os.path.exists(BASELINE_PATH) else {}
+    regressions = compare_to_baseline(results, baseline.get('benchmarks', {}), args.tolerance)
+
+    if args.update_baseline:
+        save_json(BASELINE_PATH, {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'benchmarks': {**baseline.get('benchmarks', {}), **results},
+        })
+        print(f"\nBaseline written to {BASELINE_PATH}")
+    elif regressions:
+        print(f"\nSlower than the baseline by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        if baseline.get('python') != platform.python_version():
+            print(f"(baseline was recorded on Python {baseline.get('python')}, this is {platform.python_version()})")
+
+    return 0 if golden_ok and (args.update_baseline or not regressions) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
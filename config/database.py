@@ -12,6 +12,39 @@ DATABASE_CONFIG = {
     'port': 5432
 }
 
+# Connection pool settings shared by every scraper in the process
+DB_POOL_CONFIG = {
+    'min_connections': 1,
+    'max_connections': 10,
+    'health_check_interval': 30  # seconds a connection may sit idle before it is pinged
+}
+
+# Buffered job writer settings
+JOB_WRITER_CONFIG = {
+    'batch_size': 100,     # rows buffered before a flush
+    'max_latency': 10      # seconds a row may wait in the buffer before a flush
+}
+
+# Incremental runs: postings not seen for this many runs of their platform
+# (and search keyword) are marked inactive instead of being deleted
+INCREMENTAL_CONFIG = {
+    'max_missed_runs': 3
+}
+
+# In-memory duplicate index preloaded at the start of a run
+DEDUP_INDEX_CONFIG = {
+    'bloom_threshold': 1000000,  # switch from exact sets to a Bloom filter above this many rows
+    'bloom_error_rate': 0.001,   # false-positive rate; positives are confirmed against the database
+    'load_batch_size': 10000     # rows fetched per round trip by the server-side cursor
+}
+
+# Backfill of derived columns (technologies, category, seniority_level)
+BACKFILL_CONFIG = {
+    'fetch_batch_size': 2000,    # rows fetched per round trip by the server-side cursor
+    'update_batch_size': 500,    # changed rows written (and committed) per UPDATE
+    'extract_chunksize': 200     # descriptions sent to a worker process at a time
+}
+
 # Database table schema
 CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS scraped_jobs (
@@ -20,6 +53,7 @@ CREATE TABLE IF NOT EXISTS scraped_jobs (
     company_name VARCHAR(300),
     location VARCHAR(200),
     job_url TEXT,
+    canonical_url TEXT,
     employment_type VARCHAR(50),
     remote_option VARCHAR(20),
     posted_date DATE,
@@ -31,6 +65,29 @@ CREATE TABLE IF NOT EXISTS scraped_jobs (
     qualifications TEXT,
     qualifications_hash VARCHAR(32),
     category VARCHAR(100),
-    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    first_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    missed_runs INTEGER DEFAULT 0,
+    is_active BOOLEAN DEFAULT TRUE
 );
+"""
+
+# Schema changes applied to tables created by older versions
+MIGRATE_TABLE_SQL = """
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS canonical_url TEXT;
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS first_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS missed_runs INTEGER DEFAULT 0;
+ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE;
+"""
+
+# Unique indexes backing duplicate detection (INSERT ... ON CONFLICT)
+CREATE_INDEXES_SQL = """
+CREATE UNIQUE INDEX IF NOT EXISTS scraped_jobs_qualifications_hash_key
+    ON scraped_jobs (qualifications_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS scraped_jobs_canonical_url_key
+    ON scraped_jobs (canonical_url);
+CREATE INDEX IF NOT EXISTS scraped_jobs_platform_last_seen_idx
+    ON scraped_jobs (platform, last_seen_at) WHERE is_active;
 """
\ No newline at end of file
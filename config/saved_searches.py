@@ -0,0 +1,62 @@
+"""
+Saved Search Configuration
+Search definitions that replace the manual filter setup for unattended runs
+"""
+
+# Each saved search opens a platform's results without operator input
+# (python main.py --saved-search NAME, or orchestrator.py). Keys:
+#   platform        scraper it belongs to (orchestrator platform name)
+#   start_url       page loaded first, usually a results URL with the query
+#                   and filters as parameters; without it the actions start
+#                   on the platform's homepage
+#   actions         filter steps replayed in order after start_url, for
+#                   filters that are not in the URL. One step per dict:
+#                     {'click': css}             click the element
+#                     {'click_text': text}       click the element showing text
+#                     {'type': css, 'text': t}   type t into the field
+#                                                ('submit': True presses Enter)
+#                     {'wait_for': css}          wait until the element exists
+#   ready_selector  results are loaded once this matches (comma = any of)
+#   keyword         stored in the keyword column, as entered in manual mode;
+#                   Kalibrr and JobStreet store their fixed keyword
+SAVED_SEARCHES = {
+    'indeed-it': {
+        'platform': 'indeed',
+        'start_url': 'https://ph.indeed.com/jobs?q=IT&l=Philippines',
+        'ready_selector': '.job_seen_beacon, [data-jk]',
+        'keyword': 'IT'
+    },
+    'kalibrr-it-and-software': {
+        'platform': 'kalibrr',
+        'actions': [
+            {'click_text': 'Filter'},
+            {'click_text': 'Job function'},
+            {'click_text': 'IT and Software'},
+            {'click_text': 'Search'}
+        ],
+        'ready_selector': 'a.k-text-black[itemprop="name"]'
+    },
+    'jobstreet-it': {
+        'platform': 'jobstreet',
+        'start_url': 'https://ph.jobstreet.com/jobs-in-information-communication-technology',
+        'ready_selector': 'a[data-automation="jobTitle"]'
+    },
+    'linkedin-it': {
+        'platform': 'linkedin',
+        'start_url': 'https://www.linkedin.com/jobs/search/?keywords=Information%20Technology&location=Philippines',
+        'ready_selector': '.base-card',
+        'keyword': 'Information Technology'
+    },
+    'foundit-software-developer': {
+        'platform': 'foundit',
+        'start_url': 'https://www.foundit.com.ph/srp/results?query=software%20developer&locations=Philippines',
+        'ready_selector': '.flex.flex-col.gap-4.rounded-2xl',
+        'keyword': 'software developer'
+    },
+    'foundit-data-analyst': {
+        'platform': 'foundit',
+        'start_url': 'https://www.foundit.com.ph/srp/results?query=data%20analyst&locations=Philippines',
+        'ready_selector': '.flex.flex-col.gap-4.rounded-2xl',
+        'keyword': 'data analyst'
+    }
+}
@@ -0,0 +1,70 @@
+"""
+Scraper Configuration
+Contains browser and scraping settings shared by all platform scrapers
+"""
+
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Parallel detail-page processing
+SCRAPER_CONFIG = {
+    'detail_workers': 0,          # Chrome instances for detail pages, next to the listing's (0 = sequential on the main driver)
+    'pipeline_queue_size': 50,    # collected job URLs waiting for a detail worker before the listing pauses
+    'page_ready_timeout': 15,     # seconds to wait for a detail page's readiness selectors
+    'page_ready_poll': 0.25,      # seconds between readiness checks
+    'action_pause': (1, 2),       # random pause (seconds) after each replayed saved-search step
+    'politeness_jitter': (0.5, 1.5)  # random pause (seconds) after each detail page
+}
+
+# Resources blocked on detail pages (Chrome DevTools Network.setBlockedURLs).
+# None of them are used by the extractors; platforms can allow a group back
+# with RESOURCE_ALLOWLIST on their scraper class.
+RESOURCE_BLOCKING = {
+    'enabled': True,
+    'blocked_resources': {
+        'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico'],
+        'fonts': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+        'media': ['*.mp4', '*.webm', '*.mp3', '*.m4a', '*.ogg'],
+        'trackers': [
+            '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+            '*googlesyndication.com*', '*connect.facebook.net*', '*hotjar.com*',
+            '*clarity.ms*', '*segment.io*', '*segment.com*', '*newrelic.com*',
+            '*nr-data.net*', '*tiktok.com*', '*ads.linkedin.com*', '*bat.bing.com*'
+        ]
+    }
+}
+
+# Technology taxonomy used by utils/tech_extractor.py. The compiled matcher
+# is cached in cache_dir, keyed by the data file's hash.
+TECH_TAXONOMY_CONFIG = {
+    'path': os.path.join(PROJECT_ROOT, 'utils', 'data', 'technologies.json'),
+    'cache_dir': os.path.join(PROJECT_ROOT, '.cache', 'tech_taxonomy')
+}
+
+# Per-run checkpoints (utils/checkpoint.py) for resuming interrupted runs
+# with --resume RUN_ID; a run that finishes without failures deletes its own
+CHECKPOINT_CONFIG = {
+    'dir': os.path.join(PROJECT_ROOT, 'checkpoints'),
+    'save_interval': 15  # seconds between checkpoint writes while detail pages are processed
+}
+
+# Job categorizer (utils/categorizer.py)
+CATEGORIZER_CONFIG = {
+    'cache_size': 4096  # distinct cleaned titles kept in the LRU cache
+}
+
+# Process-level orchestrator (orchestrator.py). Every platform scraper runs
+# in its own process with its own browsers, connection pool and job writer.
+ORCHESTRATOR_CONFIG = {
+    'max_processes': 5,               # platform scrapers running at the same time
+    'platform_workers': {             # detail browsers per platform; --workers cannot exceed these
+        'indeed': 2,
+        'kalibrr': 2,
+        'jobstreet': 2,
+        'linkedin': 1,
+        'foundit': 2
+    },
+    'db_connections_per_process': 4,  # max_connections of each process's pool (DB_POOL_CONFIG is per process)
+    'progress_interval': 30           # seconds between aggregated progress lines
+}
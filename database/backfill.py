@@ -0,0 +1,99 @@
+"""
+Backfill Module
+Re-derives technologies, category and seniority level for stored jobs
+"""
+
+import itertools
+
+from psycopg2.extras import execute_values
+from config.database import BACKFILL_CONFIG
+from database.connection import pooled_connection, safe_rollback
+from utils.categorizer import categorize_cache_info, categorize_job_title
+from utils.seniority import TEXT_SENIORITY_PLATFORMS, infer_seniority_level
+from utils.tech_extractor import extract_technologies_many
+from utils.text_analysis import AnalyzedJobText
+
+BACKFILL_SELECT_SQL = """
+    SELECT id, platform, job_title, qualifications, technologies, category, seniority_level
+    FROM scraped_jobs
+    WHERE id >= %s AND (%s IS NULL OR id <= %s)
+    ORDER BY id
+"""
+
+BACKFILL_UPDATE_SQL = """
+    UPDATE scraped_jobs AS j
+    SET technologies = v.technologies, category = v.category, seniority_level = v.seniority_level
+    FROM (VALUES %s) AS v(id, technologies, category, seniority_level)
+    WHERE j.id = v.id
+"""
+
+def backfill_derived_fields(start_id=None, end_id=None, workers=1, seniority=False, dry_run=False):
+    """
+    Re-run technology extraction and categorization (and, with seniority,
+    the text-only seniority rule) over stored jobs with ids in
+    [start_id, end_id], updating only rows whose values changed.
+    Rows are streamed through a server-side cursor and changes are committed
+    in batches, so memory stays flat and an interrupted run can be resumed
+    from the id it reports.
+    Returns (rows scanned, rows changed), or None if the run did not finish.
+    """
+    with pooled_connection() as read_conn, pooled_connection() as write_conn:
+        if not read_conn or not write_conn:
+            return None
+
+        # The named cursor lives in read_conn's transaction; updates are
+        # committed on write_conn so they don't close it
+        stream = read_conn.cursor(name='derived_fields_backfill')
+        stream.itersize = BACKFILL_CONFIG['fetch_batch_size']
+        stream.execute(BACKFILL_SELECT_SQL, (start_id or 0, end_id, end_id))
+
+        # tee buffers only the rows whose chunks are in flight in the pool
+        rows, text_rows = itertools.tee(stream)
+        texts = (f"{job_title or ''} {qualifications or ''}" for _, _, job_title, qualifications, *_ in text_rows)
+        results = extract_technologies_many(texts, workers=workers, chunksize=BACKFILL_CONFIG['extract_chunksize'])
+
+        scanned = changed = 0
+        updates = []
+        resume_id = start_id or 0
+        try:
+            for row, technologies in zip(rows, results):
+                job_id, platform, job_title, qualifications, old_technologies, old_category, old_seniority = row
+                scanned += 1
+
+                analyzed = AnalyzedJobText(job_title, qualifications) if job_title else None
+                category = categorize_job_title(analyzed) if analyzed else None
+                seniority_level = old_seniority
+                if seniority and platform in TEXT_SENIORITY_PLATFORMS and analyzed:
+                    seniority_level = infer_seniority_level(analyzed)
+
+                if (technologies, category, seniority_level) != (old_technologies, old_category, old_seniority):
+                    updates.append((job_id, technologies, category, seniority_level))
+
+                if len(updates) >= BACKFILL_CONFIG['update_batch_size']:
+                    changed += _write_updates(write_conn, updates, dry_run)
+                    updates = []
+                    resume_id = job_id + 1
+                    print(f"Backfilled through id {job_id}: {scanned} scanned, {changed} changed")
+
+            changed += _write_updates(write_conn, updates, dry_run)
+            print(f"Backfill finished: {scanned} scanned, {changed} changed" + (" (dry run)" if dry_run else ""))
+            cache = categorize_cache_info()
+            print(f"Category cache: {cache.hits} hits, {cache.misses} misses")
+            return scanned, changed
+        except Exception as e:
+            safe_rollback(write_conn)
+            print(f"Backfill stopped: {e}")
+            print(f"Resume with --start-id {resume_id}")
+            return None
+        finally:
+            results.close()
+            stream.close()
+            read_conn.commit()
+
+def _write_updates(conn, updates, dry_run):
+    """Apply one batch of changed rows and commit it"""
+    if updates and not dry_run:
+        cur = conn.cursor()
+        execute_values(cur, BACKFILL_UPDATE_SQL, updates, page_size=len(updates))
+        conn.commit()
+    return len(updates)
@@ -3,12 +3,27 @@ Database Connection Module
 Handles PostgreSQL connections and basic database operations
 """
 
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from config.database import DATABASE_CONFIG, CREATE_TABLE_SQL
+from psycopg2 import extensions, pool
+from psycopg2.extras import RealDictCursor, execute_values
+from config.database import (
+    DATABASE_CONFIG, DB_POOL_CONFIG, INCREMENTAL_CONFIG,
+    CREATE_TABLE_SQL, MIGRATE_TABLE_SQL, CREATE_INDEXES_SQL
+)
+from utils.url_utils import canonicalize_url
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_slots = threading.BoundedSemaphore(DB_POOL_CONFIG['max_connections'])
+_last_used = {}
 
 def get_db_connection():
-    """Create and return database connection"""
+    """Create and return a standalone (unpooled) database connection"""
     try:
         conn = psycopg2.connect(**DATABASE_CONFIG)
         return conn
@@ -16,37 +31,237 @@ def get_db_connection():
         print(f"Database connection error: {e}")
         return None
 
-def create_jobs_table():
-    """Create the jobs table if it doesn't exist"""
-    conn = get_db_connection()
-    if not conn:
+def get_connection_pool():
+    """Return the process-wide connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pool.ThreadedConnectionPool(
+                    DB_POOL_CONFIG['min_connections'],
+                    DB_POOL_CONFIG['max_connections'],
+                    **DATABASE_CONFIG
+                )
+    return _pool
+
+def configure_connection_pool(**settings):
+    """
+    Override DB_POOL_CONFIG settings for this process before the pool is
+    first used; returns False if the pool already exists
+    """
+    global _pool_slots
+    with _pool_lock:
+        if _pool is not None:
+            print("Connection pool already in use - keeping its settings")
+            return False
+        DB_POOL_CONFIG.update(settings)
+        _pool_slots = threading.BoundedSemaphore(DB_POOL_CONFIG['max_connections'])
+        return True
+
+def close_connection_pool():
+    """Close every pooled connection"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+            _last_used.clear()
+
+atexit.register(close_connection_pool)
+
+def _is_healthy(conn):
+    """Check that a pooled connection is still usable"""
+    if conn.closed:
+        return False
+    if conn.info.transaction_status == extensions.TRANSACTION_STATUS_UNKNOWN:
         return False
-    
+
+    # Only ping connections that have been idle for a while
+    idle_for = time.monotonic() - _last_used.get(id(conn), 0)
+    if idle_for < DB_POOL_CONFIG['health_check_interval']:
+        return True
+
     try:
-        cur = conn.cursor()
-        cur.execute(CREATE_TABLE_SQL)
-        conn.commit()
-        print("Jobs table created/verified successfully")
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
         return True
-    except Exception as e:
-        print(f"Error creating table: {e}")
+    except psycopg2.Error:
         return False
-    finally:
-        conn.close()
 
-def clear_scraped_jobs():
-    """Clear all scraped jobs from database"""
-    conn = get_db_connection()
-    if not conn:
+def _checkout():
+    """Borrow a healthy connection, replacing broken ones"""
+    db_pool = get_connection_pool()
+    for _ in range(DB_POOL_CONFIG['max_connections'] + 1):
+        conn = db_pool.getconn()
+        if _is_healthy(conn):
+            return conn
+        print("Discarding broken pooled database connection")
+        _last_used.pop(id(conn), None)
+        db_pool.putconn(conn, close=True)
+    raise pool.PoolError("could not obtain a healthy database connection")
+
+def _checkin(conn, broken=False):
+    """Return a connection to the pool, closing it if it is broken"""
+    db_pool = get_connection_pool()
+    if broken or conn.closed:
+        _last_used.pop(id(conn), None)
+        db_pool.putconn(conn, close=True)
         return
-    
+
     try:
-        cur = conn.cursor()
-        cur.execute("DELETE FROM scraped_jobs")
-        deleted_count = cur.rowcount
-        conn.commit()
-        print(f"Cleared {deleted_count} existing job entries from the database.")
-    except Exception as e:
-        print(f"Failed to clear job data: {e}")
+        # Never hand out a connection with an open transaction
+        if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+        _last_used[id(conn)] = time.monotonic()
+        db_pool.putconn(conn)
+    except psycopg2.Error:
+        _last_used.pop(id(conn), None)
+        db_pool.putconn(conn, close=True)
+
+def safe_rollback(conn):
+    """
+    Roll back after a failed statement without hiding the original error.
+    A connection too broken to roll back is closed when it goes back to the
+    pool (_checkin), instead of being handed out again.
+    """
+    try:
+        conn.rollback()
+    except psycopg2.Error as e:
+        print(f"Rollback failed: {e}")
+
+@contextmanager
+def pooled_connection():
+    """
+    Borrow a connection from the process-wide pool.
+    Yields None if no connection could be established. Blocks while all
+    pooled connections are in use, so it is safe to call from worker threads.
+    """
+    _pool_slots.acquire()
+    try:
+        try:
+            conn = _checkout()
+        except Exception as e:
+            print(f"Database connection error: {e}")
+            conn = None
+
+        if conn is None:
+            yield None
+            return
+
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            _checkin(conn, broken=broken)
     finally:
-        conn.close()
\ No newline at end of file
+        _pool_slots.release()
+
+def create_jobs_table():
+    """Create the jobs table and its duplicate-detection indexes if they don't exist"""
+    with pooled_connection() as conn:
+        if not conn:
+            return False
+
+        try:
+            cur = conn.cursor()
+            cur.execute(CREATE_TABLE_SQL)
+            cur.execute(MIGRATE_TABLE_SQL)
+            conn.commit()
+            print("Jobs table created/verified successfully")
+        except Exception as e:
+            safe_rollback(conn)
+            print(f"Error creating table: {e}")
+            return False
+
+        try:
+            _backfill_canonical_urls(conn)
+            cur = conn.cursor()
+            cur.execute(CREATE_INDEXES_SQL)
+            conn.commit()
+            print("Duplicate-detection indexes created/verified successfully")
+        except Exception as e:
+            safe_rollback(conn)
+            print(f"Error creating unique indexes (existing duplicate rows?): {e}")
+        return True
+
+def _backfill_canonical_urls(conn):
+    """
+    Fill canonical_url for rows saved before the column existed, and
+    refresh keys made by an older canonical form (e.g. Indeed redirect URLs)
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT canonical_url FROM scraped_jobs WHERE canonical_url IS NOT NULL")
+    seen = {row[0] for row in cur.fetchall()}
+
+    cur.execute("SELECT id, job_url, canonical_url FROM scraped_jobs WHERE job_url IS NOT NULL ORDER BY id")
+    updates = []
+    for job_id, job_url, stored_url in cur.fetchall():
+        canonical_url = canonicalize_url(job_url)
+        # Older duplicates keep their old (or NULL) key so the unique index holds
+        if canonical_url and canonical_url != stored_url and canonical_url not in seen:
+            seen.add(canonical_url)
+            updates.append((job_id, canonical_url))
+
+    if updates:
+        execute_values(cur, """
+            UPDATE scraped_jobs AS j SET canonical_url = v.canonical_url
+            FROM (VALUES %s) AS v(id, canonical_url)
+            WHERE j.id = v.id
+        """, updates)
+        print(f"Backfilled canonical URLs for {len(updates)} existing jobs")
+
+def clear_scraped_jobs():
+    """Clear all scraped jobs from database"""
+    with pooled_connection() as conn:
+        if not conn:
+            return
+
+        try:
+            cur = conn.cursor()
+            cur.execute("DELETE FROM scraped_jobs")
+            deleted_count = cur.rowcount
+            conn.commit()
+            print(f"Cleared {deleted_count} existing job entries from the database.")
+        except Exception as e:
+            safe_rollback(conn)
+            print(f"Failed to clear job data: {e}")
+
+def mark_unseen_jobs(platform, run_started_at, keyword=None):
+    """
+    Record that active postings of a platform (and search keyword) were not
+    seen by the run that started at run_started_at, and mark postings missed
+    by max_missed_runs consecutive runs as inactive
+    """
+    max_missed_runs = INCREMENTAL_CONFIG['max_missed_runs']
+    scope_sql = "platform = %s AND is_active"
+    scope_params = [platform]
+    if keyword:
+        scope_sql += " AND keyword = %s"
+        scope_params.append(keyword)
+
+    with pooled_connection() as conn:
+        if not conn:
+            return
+
+        try:
+            cur = conn.cursor()
+            cur.execute(f"""
+                UPDATE scraped_jobs SET missed_runs = missed_runs + 1
+                WHERE {scope_sql} AND last_seen_at < %s
+            """, scope_params + [run_started_at])
+            missed_count = cur.rowcount
+
+            cur.execute(f"""
+                UPDATE scraped_jobs SET is_active = FALSE
+                WHERE {scope_sql} AND missed_runs >= %s
+            """, scope_params + [max_missed_runs])
+            inactive_count = cur.rowcount
+            conn.commit()
+            print(f"{missed_count} {platform} jobs not seen this run; {inactive_count} marked inactive")
+        except Exception as e:
+            safe_rollback(conn)
+            print(f"Failed to mark unseen jobs: {e}")
@@ -0,0 +1,166 @@
+"""
+Duplicate Index Module
+In-memory index of jobs already stored in scraped_jobs, loaded once per run
+"""
+
+import hashlib
+import math
+import threading
+
+import psycopg2
+from config.database import DEDUP_INDEX_CONFIG
+from database.connection import pooled_connection, safe_rollback
+from utils.url_utils import canonicalize_url
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 16-byte digests"""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, digest):
+        # Double hashing: the two halves of the digest give every probe
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, digest):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+class DedupIndex:
+    """
+    Known qualifications hashes, canonical job URLs and scraper-specific keys,
+    stored as 16-byte MD5 digests.
+    Small tables are held in exact sets. Tables above bloom_threshold rows are
+    held in Bloom filters; a positive is then confirmed with one indexed query
+    so a false positive never drops a new job.
+    """
+
+    KINDS = ('hash', 'url', 'key')
+
+    def __init__(self, expected_rows=0, bloom_threshold=None, error_rate=None):
+        bloom_threshold = bloom_threshold or DEDUP_INDEX_CONFIG['bloom_threshold']
+        error_rate = error_rate or DEDUP_INDEX_CONFIG['bloom_error_rate']
+        self.use_bloom = expected_rows > bloom_threshold
+        self._lock = threading.Lock()
+        # Items added during this run are always kept exactly
+        self._exact = {kind: set() for kind in self.KINDS}
+        self._bloom = {kind: BloomFilter(expected_rows, error_rate) for kind in ('hash', 'url')} if self.use_bloom else {}
+
+    @staticmethod
+    def hash_digest(qualifications_hash):
+        return bytes.fromhex(qualifications_hash)
+
+    @staticmethod
+    def url_digest(canonical_url):
+        return hashlib.md5(canonical_url.encode('utf-8')).digest()
+
+    @staticmethod
+    def key_digest(key):
+        return hashlib.md5(key.encode('utf-8')).digest()
+
+    def _add(self, kind, digest, preloaded=False):
+        with self._lock:
+            if preloaded and kind in self._bloom:
+                self._bloom[kind].add(digest)
+            else:
+                self._exact[kind].add(digest)
+
+    def _contains(self, kind, digest, confirm=None):
+        with self._lock:
+            if digest in self._exact[kind]:
+                return True
+            maybe = kind in self._bloom and digest in self._bloom[kind]
+        return bool(maybe and confirm and confirm())
+
+    def add_hash(self, qualifications_hash):
+        self._add('hash', self.hash_digest(qualifications_hash))
+
+    def add_url(self, job_url):
+        self._add('url', self.url_digest(canonicalize_url(job_url)))
+
+    def add_key(self, key):
+        self._add('key', self.key_digest(key))
+
+    def contains_hash(self, qualifications_hash):
+        return self._contains('hash', self.hash_digest(qualifications_hash),
+                              lambda: _exists_in_db('qualifications_hash', qualifications_hash))
+
+    def contains_url(self, job_url):
+        canonical_url = canonicalize_url(job_url)
+        return self._contains('url', self.url_digest(canonical_url),
+                              lambda: _exists_in_db('canonical_url', canonical_url))
+
+    def contains_key(self, key):
+        return self._contains('key', self.key_digest(key))
+
+    def __len__(self):
+        return sum(len(items) for items in self._exact.values())
+
+def _exists_in_db(column, value):
+    """Confirm a Bloom filter positive with an indexed lookup"""
+    with pooled_connection() as conn:
+        if not conn:
+            # Without a database we cannot confirm; treat as duplicate
+            return True
+        try:
+            cur = conn.cursor()
+            cur.execute(f"SELECT 1 FROM scraped_jobs WHERE {column} = %s LIMIT 1", (value,))
+            return cur.fetchone() is not None
+        except psycopg2.Error as e:
+            # A failed lookup must not drop a new job; the unique index still guards the insert
+            safe_rollback(conn)
+            print(f"Error confirming a duplicate {column}: {e}")
+            return False
+
+def load_dedup_index():
+    """Build a DedupIndex from every stored qualifications hash and canonical URL"""
+    with pooled_connection() as conn:
+        if not conn:
+            print("No database connection available - starting with an empty duplicate index")
+            return DedupIndex()
+
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT count(*) FROM scraped_jobs")
+            row_count = cur.fetchone()[0]
+            index = DedupIndex(expected_rows=row_count)
+
+            # Server-side cursor keeps memory flat while streaming the table
+            stream = conn.cursor(name='dedup_index_loader')
+            stream.itersize = DEDUP_INDEX_CONFIG['load_batch_size']
+            stream.execute("SELECT qualifications_hash, canonical_url FROM scraped_jobs")
+            for qualifications_hash, canonical_url in stream:
+                if qualifications_hash:
+                    index._add('hash', index.hash_digest(qualifications_hash), preloaded=True)
+                if canonical_url:
+                    index._add('url', index.url_digest(canonical_url), preloaded=True)
+            stream.close()
+            conn.commit()
+
+            mode = "Bloom filter" if index.use_bloom else "exact sets"
+            print(f"Loaded duplicate index for {row_count} stored jobs ({mode})")
+            return index
+        except Exception as e:
+            safe_rollback(conn)
+            print(f"Error loading duplicate index: {e}")
+            return DedupIndex()
+
+_dedup_index = None
+_dedup_index_lock = threading.Lock()
+
+def get_dedup_index():
+    """Return the process-wide duplicate index, loading it on first use"""
+    global _dedup_index
+    if _dedup_index is None:
+        with _dedup_index_lock:
+            if _dedup_index is None:
+                _dedup_index = load_dedup_index()
+    return _dedup_index
@@ -0,0 +1,260 @@
+"""
+Job Writer Module
+Buffers scraped jobs and writes them to PostgreSQL in batches
+"""
+
+import atexit
+import threading
+import time
+
+from psycopg2 import errors
+from psycopg2.extras import execute_values
+from config.database import JOB_WRITER_CONFIG
+from database.connection import pooled_connection, safe_rollback
+
+# Columns written for every job; missing values are stored as NULL
+JOB_COLUMNS = (
+    'job_title', 'company_name', 'location', 'job_url', 'canonical_url', 'employment_type',
+    'remote_option', 'posted_date', 'platform', 'keyword', 'seniority_level',
+    'salary', 'technologies', 'qualifications', 'qualifications_hash',
+    'category', 'scraped_at', 'first_seen_at', 'last_seen_at'
+)
+
+# Columns refreshed when a posting is seen again
+UPDATE_COLUMNS = tuple(column for column in JOB_COLUMNS if column not in ('canonical_url', 'first_seen_at'))
+
+UPSERT_SQL = f"""
+    INSERT INTO scraped_jobs ({', '.join(JOB_COLUMNS)}) VALUES %s
+    ON CONFLICT (canonical_url) DO UPDATE SET
+        {', '.join(f'{column} = EXCLUDED.{column}' for column in UPDATE_COLUMNS)},
+        missed_runs = 0,
+        is_active = TRUE
+    RETURNING (xmax = 0) AS inserted
+"""
+
+# Stored owners of qualifications hashes; the upsert only resolves URL
+# conflicts, so rows whose hash belongs to another URL are dropped first
+HASH_OWNERS_SQL = "SELECT qualifications_hash, canonical_url FROM scraped_jobs WHERE qualifications_hash = ANY(%s)"
+
+TOUCH_SQL = """
+    UPDATE scraped_jobs AS j
+    SET last_seen_at = v.seen_at, missed_runs = 0, is_active = TRUE
+    FROM (VALUES %s) AS v(canonical_url, seen_at)
+    WHERE j.canonical_url = v.canonical_url
+"""
+
+class JobWriter:
+    """
+    Thread-safe buffered sink for the scraped_jobs table.
+    Rows are flushed with a single multi-row INSERT (execute_values) and one
+    commit once batch_size rows are buffered or the oldest buffered row is
+    older than max_latency seconds. Both flushes run on the writer's own
+    thread, so scrapers keep working while a batch is written; only a
+    buffer that reaches twice batch_size is flushed by the adding thread.
+    Rows are upserted on canonical_url: a posting seen again refreshes its
+    data and last_seen_at instead of creating a new row. A row whose
+    qualifications_hash belongs to a different URL is skipped as a duplicate
+    before the insert, so it does not abort the rest of its batch.
+    """
+
+    def __init__(self, batch_size=None, max_latency=None):
+        self.batch_size = batch_size or JOB_WRITER_CONFIG['batch_size']
+        self.max_latency = max_latency or JOB_WRITER_CONFIG['max_latency']
+        self.saved_count = 0
+        self.updated_count = 0
+        self.duplicate_count = 0
+        self.failed_count = 0
+        self._buffer = []
+        self._touches = {}
+        self._oldest_at = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._due = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def add(self, job):
+        """Buffer a job (dict of column values); a full batch wakes the flusher"""
+        row = tuple(job.get(column) for column in JOB_COLUMNS)
+        with self._lock:
+            self._buffer.append(row)
+            if self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+            pending = len(self._buffer)
+        self._batch_added(pending)
+
+    def touch(self, canonical_url, seen_at):
+        """Buffer a last_seen_at refresh for a stored posting that was not re-scraped"""
+        with self._lock:
+            self._touches[canonical_url] = seen_at
+            if self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+            pending = len(self._touches)
+        self._batch_added(pending)
+
+    def _batch_added(self, pending):
+        """Wake the flusher for a full batch; past two batches the database is behind, so flush here"""
+        if pending >= 2 * self.batch_size:
+            self.flush()
+        elif pending >= self.batch_size:
+            self._due.set()
+
+    def flush(self):
+        """Write all buffered jobs and last-seen refreshes to the database"""
+        # Flushes write one at a time, in order; the buffer lock is only held
+        # while taking the rows, so add() doesn't wait for the database
+        with self._write_lock:
+            with self._lock:
+                touches = list(self._touches.items())
+                rows = self._buffer
+                self._touches = {}
+                self._buffer = []
+                self._oldest_at = None
+
+            if touches:
+                self._write_touches(touches)
+            if not rows:
+                return 0
+
+            # Rows repeating a URL of the same batch are duplicates, not failures
+            unique = _unique_by_url(rows)
+            inserted, updated, duplicates = self._write_rows(unique)
+            failed = len(unique) - inserted - updated - duplicates
+            duplicates += len(rows) - len(unique)
+            self.saved_count += inserted
+            self.updated_count += updated
+            self.duplicate_count += duplicates
+            self.failed_count += failed
+            print(f"Flushed {len(rows)} jobs to the database: {inserted} new, {updated} updated, "
+                  f"{duplicates} duplicates skipped, {failed} failed")
+            return inserted + updated
+
+    def close(self):
+        """Flush remaining jobs and stop the background flusher"""
+        self._stop.set()
+        self._due.set()
+        self.flush()
+
+    def _write_rows(self, rows):
+        """
+        Upsert rows in one statement, falling back to row by row on failure.
+        Rows whose qualifications are already stored, or earlier in the
+        batch, under another URL are left out of the statement as duplicates.
+        Returns (inserted, updated, duplicates).
+        """
+        with pooled_connection() as conn:
+            if not conn:
+                print(f"No database connection available - {len(rows)} jobs not saved")
+                return 0, 0, 0
+
+            try:
+                cur = conn.cursor()
+                batch, duplicates = _drop_hash_duplicates(cur, rows)
+                results = execute_values(cur, UPSERT_SQL, batch, page_size=self.batch_size, fetch=True) if batch else []
+                conn.commit()
+                inserted = sum(1 for (was_inserted,) in results if was_inserted)
+                return inserted, len(results) - inserted, duplicates
+            except Exception as e:
+                safe_rollback(conn)
+                print(f"Batch upsert failed, retrying row by row: {e}")
+
+            # One bad row must not sink the whole batch
+            inserted = updated = duplicates = 0
+            for row in rows:
+                try:
+                    cur = conn.cursor()
+                    ((was_inserted,),) = execute_values(cur, UPSERT_SQL, [row], fetch=True)
+                    conn.commit()
+                    if was_inserted:
+                        inserted += 1
+                    else:
+                        updated += 1
+                except errors.UniqueViolation:
+                    # Same qualifications already stored under another URL
+                    safe_rollback(conn)
+                    duplicates += 1
+                except Exception as e:
+                    safe_rollback(conn)
+                    print(f"Database save error: {e}")
+                    print(f"Data: {dict(zip(JOB_COLUMNS, row))}")
+            return inserted, updated, duplicates
+
+    def _write_touches(self, touches):
+        """Refresh last_seen_at for known postings in one statement"""
+        with pooled_connection() as conn:
+            if not conn:
+                print(f"No database connection available - {len(touches)} last-seen updates lost")
+                return
+
+            try:
+                cur = conn.cursor()
+                execute_values(cur, TOUCH_SQL, touches, page_size=self.batch_size)
+                conn.commit()
+                print(f"Refreshed last-seen time for {len(touches)} known jobs")
+            except Exception as e:
+                safe_rollback(conn)
+                print(f"Failed to refresh last-seen times: {e}")
+
+    def _flush_periodically(self):
+        """Flush when a batch is full or buffered rows have waited longer than max_latency"""
+        while not self._stop.is_set():
+            batch_due = self._due.wait(self.max_latency / 2)
+            self._due.clear()
+            with self._lock:
+                late = self._oldest_at is not None and time.monotonic() - self._oldest_at >= self.max_latency
+            if (batch_due or late) and not self._stop.is_set():
+                self.flush()
+
+def _unique_by_url(rows):
+    """Keep the latest row per canonical URL; one upsert cannot touch a row twice"""
+    url_position = JOB_COLUMNS.index('canonical_url')
+    latest = {}
+    for position, row in enumerate(rows):
+        key = row[url_position] or position
+        latest[key] = row
+    return list(latest.values())
+
+def _drop_hash_duplicates(cur, rows):
+    """
+    Rows whose qualifications_hash is free or already belongs to their own
+    URL, and how many were dropped; within the batch, the first row with a
+    hash keeps it
+    """
+    hash_position = JOB_COLUMNS.index('qualifications_hash')
+    url_position = JOB_COLUMNS.index('canonical_url')
+    hashes = list({row[hash_position] for row in rows if row[hash_position]})
+    owners = {}
+    if hashes:
+        cur.execute(HASH_OWNERS_SQL, (hashes,))
+        owners = dict(cur.fetchall())
+
+    kept = []
+    for row in rows:
+        qualifications_hash = row[hash_position]
+        if qualifications_hash and owners.setdefault(qualifications_hash, row[url_position]) != row[url_position]:
+            continue
+        kept.append(row)
+    return kept, len(rows) - len(kept)
+
+_job_writer = None
+_job_writer_lock = threading.Lock()
+
+def get_job_writer():
+    """Return the process-wide job writer shared by all scrapers"""
+    global _job_writer
+    if _job_writer is None:
+        with _job_writer_lock:
+            if _job_writer is None:
+                _job_writer = JobWriter()
+    return _job_writer
+
+def close_job_writer():
+    """Flush and close the shared job writer"""
+    global _job_writer
+    with _job_writer_lock:
+        if _job_writer is not None:
+            _job_writer.close()
+            _job_writer = None
+
+atexit.register(close_job_writer)
@@ -3,41 +3,108 @@ Job Scraper Main Entry Point
 Clean, organized job scraping system for Philippine IT jobs
 """
 
+import argparse
+
+from config.saved_searches import SAVED_SEARCHES
 from database.connection import create_jobs_table, clear_scraped_jobs
-# from scrapers.indeed_scraper import IndeedScraper
+from orchestrator import SCRAPERS
+from scrapers.indeed_scraper import IndeedScraper
 from scrapers.kalibrr_scraper import KalibrrScraper
 from scrapers.jobstreet_scraper import JobstreetScraper
 from scrapers.linkedin_scraper import LinkedinScraper
 from scrapers.foundit_scraper import FounditScraper
+from utils.checkpoint import RunCheckpoint
 
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Scrape Philippine IT job postings")
+    parser.add_argument(
+        "--full-refresh", action="store_true",
+        help="Delete all stored jobs before scraping instead of updating them incrementally"
+    )
+    parser.add_argument(
+        "--refresh-older-than", type=float, metavar="DAYS",
+        help="Re-visit stored jobs whose details were scraped more than DAYS ago (default: never)"
+    )
+    parser.add_argument(
+        "--workers", type=int, metavar="N",
+        help="Number of Chrome instances used to process job detail pages in parallel, besides the "
+             "listing's; they get a copy of its cookies (default 0 = one by one on the listing's browser "
+             "after the listing)"
+    )
+    parser.add_argument(
+        "--no-block-resources", action="store_true",
+        help="Load images, fonts, media and trackers on detail pages"
+    )
+    parser.add_argument(
+        "--saved-search", action="append", default=[], metavar="NAME",
+        help="Run only this saved search (config/saved_searches.py) unattended; can be repeated"
+    )
+    parser.add_argument(
+        "--resume", metavar="RUN_ID",
+        help="Continue an interrupted run from its checkpoint (the run id is printed when a run starts)"
+    )
+    args = parser.parse_args()
+    if args.resume and args.full_refresh:
+        parser.error("--resume cannot be combined with --full-refresh")
+    unknown = [name for name in args.saved_search if name not in SAVED_SEARCHES]
+    if unknown:
+        parser.error(f"unknown saved search: {', '.join(unknown)} (choose from {', '.join(SAVED_SEARCHES)})")
+    args.resumed_platform = None
+    if args.resume:
+        checkpoint = RunCheckpoint.load(args.resume)
+        if checkpoint is None:
+            parser.error(f"cannot resume run {args.resume}")
+        args.resumed_platform = checkpoint.state['platform'].lower()
+    return args
 
 if __name__ == "__main__":
+    args = parse_args()
+
     # Initialize database
     print("Initializing PostgreSQL database connection...")
     if create_jobs_table():
         print("Database setup successful!")
-        
-        # Uncomment the scrapers you want to run:
-        clear_scraped_jobs()
-
-        # Run individual scrapers
-        scraper = IndeedScraper()
-        scraper.scrape("software developer")
-        
-        scraper = KalibrrScraper()
-        scraper.scrape_manual()
-        
-        scraper = JobstreetScraper()  
-        scraper.scrape_manual()
-
-        scraper = LinkedinScraper()
-        scraper.scrape_manual()
-
-        scraper = FounditScraper()
-        scraper.scrape_manual()
-
-        
-        print("Job scraper ready to run!")
-        print("Uncomment the scraper functions you want to use.")
+
+        # Incremental by default: stored jobs are upserted and jobs not seen
+        # for several runs are marked inactive instead of being deleted
+        if args.full_refresh:
+            clear_scraped_jobs()
+
+        options = {
+            'refresh_older_than': args.refresh_older_than,
+            'workers': args.workers,
+            'block_resources': not args.no_block_resources
+        }
+
+        if args.resume:
+            scraper = SCRAPERS[args.resumed_platform](resume=args.resume, **options)
+            scraper.scrape_manual()
+        # Saved searches run unattended, in the order given
+        elif args.saved_search:
+            for name in args.saved_search:
+                scraper = SCRAPERS[SAVED_SEARCHES[name]['platform']](saved_search=name, **options)
+                scraper.scrape_manual()
+        else:
+            # Uncomment the scrapers you want to run:
+            # Run individual scrapers
+            scraper = IndeedScraper(**options)
+            scraper.scrape_manual()
+
+            scraper = KalibrrScraper(**options)
+            scraper.scrape_manual()
+
+            scraper = JobstreetScraper(**options)
+            scraper.scrape_manual()
+
+            scraper = LinkedinScraper(**options)
+            scraper.scrape_manual()
+
+            scraper = FounditScraper(**options)
+            scraper.scrape_manual()
+
+
+            print("Job scraper ready to run!")
+            print("Uncomment the scraper functions you want to use.")
     else:
         print("Database setup failed! Please check your PostgreSQL connection.")
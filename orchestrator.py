@@ -0,0 +1,387 @@
+"""
+Job Scraper Orchestrator
+Runs the selected platform scrapers at the same time, one process per platform
+"""
+
+import argparse
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+
+from config.database import DB_POOL_CONFIG, JOB_WRITER_CONFIG
+from config.saved_searches import SAVED_SEARCHES
+from config.scraper import ORCHESTRATOR_CONFIG
+from database.connection import create_jobs_table, clear_scraped_jobs, configure_connection_pool, close_connection_pool
+from database.job_writer import close_job_writer
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.kalibrr_scraper import KalibrrScraper
+from scrapers.jobstreet_scraper import JobstreetScraper
+from scrapers.linkedin_scraper import LinkedinScraper
+from scrapers.foundit_scraper import FounditScraper
+from utils.browser import set_launch_lock
+from utils.checkpoint import RunCheckpoint
+
+# Platforms the orchestrator can run, in the order main.py runs them
+SCRAPERS = {
+    'indeed': IndeedScraper,
+    'kalibrr': KalibrrScraper,
+    'jobstreet': JobstreetScraper,
+    'linkedin': LinkedinScraper,
+    'foundit': FounditScraper,
+}
+
+# Counters reported for every platform, in summary column order
+COUNT_FIELDS = ('jobs', 'new', 'updated', 'duplicates', 'failed')
+
+class _PrefixedOutput:
+    """
+    Stream wrapper that starts every line with the platform name. Only whole
+    lines are written, so output of different processes does not mix
+    within a line.
+    """
+
+    def __init__(self, stream, prefix):
+        self.stream = stream
+        self.prefix = prefix
+        self._partial = ""
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        with self._lock:
+            *lines, self._partial = (self._partial + text).split('\n')
+            if lines:
+                self.stream.write(''.join(f"{self.prefix}{line}\n" for line in lines))
+                self.stream.flush()
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _counts(scraper, earlier_jobs=0):
+    """Progress counters of a scraper and its process's job writer"""
+    writer = scraper.writer
+    return {
+        'jobs': earlier_jobs + scraper.jobs_seen,
+        'new': writer.saved_count,
+        'updated': writer.updated_count,
+        'duplicates': writer.duplicate_count,
+        'failed': writer.failed_count,
+    }
+
+def _run_platform(name, options, runs, settings, events, replies, launch_lock):
+    """
+    Child process body: run one platform's scrape_manual once per entry of
+    runs, the scraper options of each run (saved_search or resume), one
+    after another so a platform is never scraped twice at the same time;
+    without runs it runs once in manual mode.
+    Prompts are sent to the parent, which owns the console, and answered
+    on replies; progress and the final result go to events. launch_lock
+    is shared by all platform processes, so only one launches Chrome at a
+    time.
+    """
+    sys.stdout = _PrefixedOutput(sys.stdout, f"[{name}] ")
+    sys.stderr = _PrefixedOutput(sys.stderr, f"[{name}] ")
+    set_launch_lock(launch_lock)
+    configure_connection_pool(**settings['db_pool'])
+    JOB_WRITER_CONFIG.update(settings['job_writer'])
+
+    def prompt(message=""):
+        events.put(('prompt', name, message))
+        return replies.get()
+
+    scraper = None
+    earlier_jobs = 0
+    stop = threading.Event()
+
+    def report_progress():
+        while not stop.wait(settings['progress_interval']):
+            if scraper is not None:
+                events.put(('progress', name, _counts(scraper, earlier_jobs)))
+
+    reporter = threading.Thread(target=report_progress, daemon=True)
+    reporter.start()
+    result = {'status': 'finished', 'error': None}
+    empty_searches = []
+    try:
+        for run in runs or [{}]:
+            if scraper is not None:
+                earlier_jobs += scraper.jobs_seen
+            scraper = SCRAPERS[name](prompt=prompt, **run, **options)
+            scraper.scrape_manual()
+            if run.get('saved_search') and not scraper.jobs_seen:
+                empty_searches.append(run['saved_search'])
+    except KeyboardInterrupt:
+        result['status'] = 'interrupted'
+    except Exception as e:
+        print(f"Scraper failed: {e}")
+        result.update(status='failed', error=str(e))
+    finally:
+        stop.set()
+        # Final flush first, so the counts include every buffered job
+        close_job_writer()
+        close_connection_pool()
+        if scraper is not None:
+            result.update(_counts(scraper, earlier_jobs))
+        if result['status'] == 'finished' and not result.get('jobs'):
+            result['status'] = 'no jobs'
+        # An unattended search that sees no jobs at all most likely failed to load
+        if empty_searches:
+            result['error'] = f"saved searches without jobs: {', '.join(empty_searches)}"
+        events.put(('done', name, result))
+
+def run_platforms(names, options, max_processes=None, workers=None, runs=None):
+    """
+    Run the named platforms' scrapers concurrently, each in its own process,
+    and return {platform: result} with the final counts and status.
+    runs maps a platform to the scraper options of each of its runs, in
+    order, e.g. [{'saved_search': name}, {'resume': run_id}]; platforms
+    without runs use manual setup.
+    At most max_processes run at once; the rest start as others finish.
+    Each platform gets its own detail browsers (workers, capped by its
+    platform_workers limit), connection pool and job writer, all built
+    from the same settings. The parent answers every prompt, one at a time
+    in the order they arrive, so manual setup happens platform by platform
+    while the platforms already set up keep scraping.
+    """
+    max_processes = max(1, max_processes or ORCHESTRATOR_CONFIG['max_processes'])
+    limits = ORCHESTRATOR_CONFIG['platform_workers']
+    settings = {
+        'db_pool': {
+            'max_connections': ORCHESTRATOR_CONFIG['db_connections_per_process'],
+            'min_connections': min(DB_POOL_CONFIG['min_connections'], ORCHESTRATOR_CONFIG['db_connections_per_process']),
+        },
+        'job_writer': dict(JOB_WRITER_CONFIG),
+        'progress_interval': ORCHESTRATOR_CONFIG['progress_interval'],
+    }
+
+    events = multiprocessing.Queue()
+    launch_lock = multiprocessing.Lock()
+    pending = list(names)
+    running = {}  # name -> (process, replies, started at)
+    progress = {name: {} for name in names}
+    results = {}
+
+    def handle(event, interrupted=False):
+        kind, name, payload = event
+        if kind == 'prompt':
+            # After an interrupt, prompts get an empty answer instead of waiting on the console
+            answer = "" if interrupted else input(f"[{name}] {payload}")
+            running[name][1].put(answer)
+        elif kind == 'progress':
+            progress[name] = payload
+        elif kind == 'done':
+            process, _, started = running.pop(name)
+            process.join()
+            payload['elapsed'] = time.monotonic() - started
+            results[name] = payload
+            print(f"[{name}] {payload['status']} after {_format_elapsed(payload['elapsed'])}")
+
+    def drain(interrupted=False):
+        try:
+            while True:
+                handle(events.get_nowait(), interrupted)
+        except queue.Empty:
+            pass
+
+    last_report = time.monotonic()
+    try:
+        while pending or running:
+            while pending and len(running) < max_processes:
+                name = pending.pop(0)
+                limit = limits.get(name, 1)
+                platform_options = {**options, 'workers': limit if workers is None else min(workers, limit)}
+                replies = multiprocessing.Queue()
+                process = multiprocessing.Process(
+                    target=_run_platform, name=f"scraper-{name}",
+                    args=(name, platform_options, (runs or {}).get(name), settings, events, replies, launch_lock)
+                )
+                process.start()
+                running[name] = (process, replies, time.monotonic())
+                print(f"Started {name} scraper (pid {process.pid}, {platform_options['workers']} detail workers)")
+
+            try:
+                handle(events.get(timeout=1))
+            except queue.Empty:
+                pass
+
+            # A process that died without reporting (e.g. killed) is recorded as crashed
+            for name, (process, _, started) in list(running.items()):
+                if not process.is_alive():
+                    drain()
+                    if name in running:
+                        running.pop(name)
+                        results[name] = {
+                            **progress[name], 'status': 'crashed',
+                            'error': f"exit code {process.exitcode}",
+                            'elapsed': time.monotonic() - started
+                        }
+
+            if time.monotonic() - last_report >= settings['progress_interval']:
+                last_report = time.monotonic()
+                print(_format_progress(progress, running, results))
+    except KeyboardInterrupt:
+        # The children received the interrupt too; let them flush their writers
+        print("\nInterrupted - waiting for the platform scrapers to stop...")
+        for name, (process, _, started) in list(running.items()):
+            process.join(timeout=60)
+            if process.is_alive():
+                process.terminate()
+        drain(interrupted=True)
+        for name, (process, _, started) in running.items():
+            results[name] = {**progress[name], 'status': 'interrupted', 'error': None,
+                             'elapsed': time.monotonic() - started}
+        for name in pending:
+            results[name] = {'status': 'not started', 'error': None, 'elapsed': 0}
+
+    return {name: results[name] for name in names if name in results}
+
+def _format_elapsed(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m {seconds:02d}s"
+
+def _format_progress(progress, running, results):
+    """One line with every platform's latest counts"""
+    parts = []
+    for name, counts in progress.items():
+        if name in results:
+            state = results[name]['status']
+        elif name in running:
+            state = f"{counts.get('jobs', 0)} jobs, {counts.get('new', 0)} new" if counts else "setting up"
+        else:
+            state = "waiting"
+        parts.append(f"{name}: {state}")
+    return "Progress - " + " | ".join(parts)
+
+def print_summary(results):
+    """Print the combined per-platform summary; return True if every platform finished without errors"""
+    print("\n" + "="*98)
+    print("SCRAPING SUMMARY")
+    print("="*98)
+    print(f"{'platform':<12}{'status':<14}" + "".join(f"{field:>12}" for field in COUNT_FIELDS) + f"{'time':>12}")
+    totals = dict.fromkeys(COUNT_FIELDS, 0)
+    for name, result in results.items():
+        counts = [result.get(field, 0) for field in COUNT_FIELDS]
+        for field, count in zip(COUNT_FIELDS, counts):
+            totals[field] += count
+        print(f"{name:<12}{result['status']:<14}" + "".join(f"{count:>12}" for count in counts)
+              + f"{_format_elapsed(result['elapsed']):>12}")
+    print(f"{'total':<26}" + "".join(f"{totals[field]:>12}" for field in COUNT_FIELDS))
+
+    for name, result in results.items():
+        if result.get('error'):
+            print(f"{name}: {result['error']}")
+    return all(result['status'] in ('finished', 'no jobs') and not result.get('error') for result in results.values())
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="Scrape Philippine IT job postings from several platforms in parallel"
+    )
+    parser.add_argument(
+        "platforms", nargs="*", metavar="PLATFORM",
+        help=f"Platforms to scrape: {', '.join(SCRAPERS)} plus those of any --saved-search or --resume (default: all)"
+    )
+    parser.add_argument(
+        "--saved-search", action="append", default=[], metavar="NAME",
+        help="Run this saved search (config/saved_searches.py) unattended instead of manual setup; can be repeated"
+    )
+    parser.add_argument(
+        "--unattended", action="store_true",
+        help="Run every saved search of the selected platforms, with no manual setup"
+    )
+    parser.add_argument(
+        "--resume", action="append", default=[], metavar="RUN_ID",
+        help="Continue an interrupted run from its checkpoint before the platform's other runs; can be repeated"
+    )
+    parser.add_argument(
+        "--max-processes", type=int, metavar="N",
+        help="Number of platform scrapers running at the same time (default: ORCHESTRATOR_CONFIG)"
+    )
+    parser.add_argument(
+        "--full-refresh", action="store_true",
+        help="Delete all stored jobs before scraping instead of updating them incrementally"
+    )
+    parser.add_argument(
+        "--refresh-older-than", type=float, metavar="DAYS",
+        help="Re-visit stored jobs whose details were scraped more than DAYS ago (default: never)"
+    )
+    parser.add_argument(
+        "--workers", type=int, metavar="N",
+        help="Chrome instances per platform for job detail pages, capped by each platform's limit"
+    )
+    parser.add_argument(
+        "--no-block-resources", action="store_true",
+        help="Load images, fonts, media and trackers on detail pages"
+    )
+    args = parser.parse_args()
+    unknown = [name for name in args.platforms if name not in SCRAPERS]
+    if unknown:
+        parser.error(f"unknown platform: {', '.join(unknown)} (choose from {', '.join(SCRAPERS)})")
+    unknown = [name for name in args.saved_search if name not in SAVED_SEARCHES]
+    if unknown:
+        parser.error(f"unknown saved search: {', '.join(unknown)} (choose from {', '.join(SAVED_SEARCHES)})")
+    if args.resume and args.full_refresh:
+        parser.error("--resume cannot be combined with --full-refresh")
+    args.resumed = {}
+    for run_id in args.resume:
+        checkpoint = RunCheckpoint.load(run_id)
+        if checkpoint is None:
+            parser.error(f"cannot resume run {run_id}")
+        args.resumed[run_id] = checkpoint.state['platform'].lower()
+    return args
+
+def plan_runs(args):
+    """
+    Selected platforms and {platform: scraper options of each run}, from
+    the command line: resumed runs first, then saved searches
+    """
+    platforms = list(dict.fromkeys(
+        args.platforms
+        + list(args.resumed.values())
+        + [SAVED_SEARCHES[name]['platform'] for name in args.saved_search]
+        or SCRAPERS
+    ))
+    runs = {}
+    for run_id, platform in args.resumed.items():
+        runs.setdefault(platform, []).append({'resume': run_id})
+    names = list(SAVED_SEARCHES) if args.unattended else args.saved_search
+    for name in dict.fromkeys(names):
+        platform = SAVED_SEARCHES[name]['platform']
+        if platform in platforms:
+            runs.setdefault(platform, []).append({'saved_search': name})
+    return platforms, runs
+
+if __name__ == "__main__":
+    args = parse_args()
+    platforms, runs = plan_runs(args)
+    if args.unattended and len(runs) < len(platforms):
+        missing = [platform for platform in platforms if platform not in runs]
+        print(f"No saved search for {', '.join(missing)} - add one to config/saved_searches.py")
+        sys.exit(2)
+
+    # The table is set up once here; each platform process opens its own pool
+    print("Initializing PostgreSQL database connection...")
+    if not create_jobs_table():
+        print("Database setup failed! Please check your PostgreSQL connection.")
+        sys.exit(1)
+    if args.full_refresh:
+        clear_scraped_jobs()
+    close_connection_pool()
+
+    options = {
+        'refresh_older_than': args.refresh_older_than,
+        'block_resources': not args.no_block_resources
+    }
+    for platform in platforms:
+        labels = [run.get('saved_search') or f"resume {run['resume']}" for run in runs.get(platform, [])]
+        print(f"{platform}: {', '.join(labels) or 'manual setup'}")
+    results = run_platforms(
+        platforms, options, max_processes=args.max_processes,
+        workers=args.workers, runs=runs
+    )
+    sys.exit(0 if print_summary(results) else 1)
@@ -4,71 +4,593 @@ Contains common functionality for all scrapers
 """
 
 import hashlib
-from datetime import datetime
-from database.connection import get_db_connection
+import queue
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from config.saved_searches import SAVED_SEARCHES
+from config.scraper import SCRAPER_CONFIG
+from database.connection import pooled_connection, mark_unseen_jobs
+from database.job_writer import get_job_writer
+from database.dedup_index import get_dedup_index
 from utils.categorizer import categorize_job_title
-from utils.browser import get_chrome_driver
+from utils.browser import get_chrome_driver, get_blocked_url_patterns, set_request_blocking, browser_session, BrowserPool
+from utils.checkpoint import RunCheckpoint
+from utils.date_utils import set_run_clock
+from utils.url_utils import canonicalize_url
+
+# Shared helpers prepended to every DETAIL_EXTRACT_SCRIPT. text() and
+# joinedText() read the same text nodes BeautifulSoup does, so both paths
+# produce identical strings (and qualifications hashes).
+EXTRACT_HELPERS_JS = """
+function textNodes(el) {
+    var parts = [];
+    var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT, {
+        acceptNode: function (node) {
+            var parent = node.parentNode.nodeName;
+            return parent === 'SCRIPT' || parent === 'STYLE' ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT;
+        }
+    });
+    while (walker.nextNode()) parts.push(walker.currentNode.nodeValue);
+    return parts;
+}
+function text(el) {
+    return el ? textNodes(el).join('') : null;
+}
+function joinedText(el) {
+    if (!el) return null;
+    return textNodes(el).map(function (s) { return s.trim(); }).filter(Boolean).join(' ').replace(/\\s+/g, ' ');
+}
+function string(el) {
+    while (el && el.childNodes.length === 1) {
+        el = el.firstChild;
+        if (el.nodeType === Node.TEXT_NODE) return el.nodeValue;
+    }
+    return null;
+}
+function first(selectors, root) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = (root || document).querySelector(selectors[i]);
+        if (el) return el;
+    }
+    return null;
+}
+function findAll(selector, predicate, root) {
+    return Array.prototype.filter.call((root || document).querySelectorAll(selector), predicate);
+}
+"""
+
+def _xpath_literal(text):
+    """text as an XPath string literal"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat('" + "', \"'\", '".join(text.split("'")) + "')"
 
 class BaseScraper:
     """Base class for all job scrapers"""
     
-    def __init__(self, platform_name):
+    # CSS selectors that must all be present before a detail page is parsed;
+    # comma-separated alternatives inside one entry mean "any of these"
+    DETAIL_READY_SELECTORS = ()
+    
+    # Random pause after each detail page; None uses SCRAPER_CONFIG
+    POLITENESS_JITTER = None
+    
+    # JavaScript run once per detail page that returns every raw field as a
+    # plain object (see extract_detail_fields); None means parse page_source
+    DETAIL_EXTRACT_SCRIPT = None
+    
+    # Resource groups or URL patterns a platform needs on detail pages;
+    # everything else in RESOURCE_BLOCKING is blocked
+    RESOURCE_ALLOWLIST = ()
+    
+    # Handler and save_job result for a job left out on purpose (duplicate
+    # or invalid posting); the checkpoint records it as processed, not failed
+    SKIPPED = 'skipped'
+    
+    def __init__(self, platform_name, refresh_older_than=None, workers=None, block_resources=True,
+                 prompt=None, saved_search=None, resume=None):
+        self._thread_state = threading.local()
         self.platform_name = platform_name
+        self.refresh_older_than = refresh_older_than  # days; re-visit stored jobs scraped before this
+        self.workers = SCRAPER_CONFIG['detail_workers'] if workers is None else workers
+        self.blocked_url_patterns = get_blocked_url_patterns(self.RESOURCE_ALLOWLIST) if block_resources else []
+        self.prompt = prompt or input  # asks the operator during manual setup; the orchestrator routes it to its console
+        self.saved_search = self._find_saved_search(saved_search) if saved_search else None
+        self.checkpoint = self._resume_checkpoint(resume) if resume else None  # created on entry for a new run
+        self.listing_start_page = 1  # number of the first listing page read; later for a resumed run
+        self.listing_capped = False  # set by a listing that stopped at max_jobs or its page limit
         self.driver = None
+        self.writer = get_job_writer()
+        self.dedup = get_dedup_index()
+        self.current_keyword = None
+        self.run_started_at = None
+        self.jobs_seen = 0
+        self._jobs_seen_lock = threading.Lock()  # detail workers count jobs concurrently
     
-    def save_job(self, **kwargs):
-        """Save job to PostgreSQL database"""
-        conn = get_db_connection()
-        if not conn:
-            print("No database connection available")
-            return
+    def _find_saved_search(self, name):
+        """The SAVED_SEARCHES entry called name, which must belong to this platform"""
+        search = SAVED_SEARCHES.get(name)
+        if search is None or search['platform'] != self.platform_name.lower():
+            raise ValueError(f"No saved search '{name}' for {self.platform_name}")
+        return {'name': name, **search}
+    
+    def _resume_checkpoint(self, run_id):
+        """Checkpoint of the interrupted run run_id, which must belong to this platform"""
+        checkpoint = RunCheckpoint.load(run_id)
+        if checkpoint is None or checkpoint.state['platform'] != self.platform_name:
+            raise ValueError(f"No resumable {self.platform_name} run '{run_id}'")
+        if not self.saved_search and checkpoint.state['saved_search']:
+            self.saved_search = self._find_saved_search(checkpoint.state['saved_search'])
+        return checkpoint
+    
+    def setup_search(self):
+        """
+        Bring the main browser to the filtered search results: replay the
+        saved search if one was given, otherwise wait for the operator
+        (manual_setup). Returns False if the saved search failed.
+        A resumed run goes straight back to the listing page it was reading,
+        unless its filters are saved-search actions the URL does not keep.
+        """
+        cursor = self.checkpoint.cursor if self.checkpoint else {}
+        if cursor.get('url') and not (self.saved_search and self.saved_search.get('actions')):
+            print(f"Resuming at listing page {cursor['page']}: {cursor['url']}")
+            self.driver.get(cursor['url'])
+            self.listing_start_page = cursor['page']
+            return True
+        if self.saved_search:
+            return self.apply_saved_search()
+        self.manual_setup()
+        return True
+    
+    def manual_setup(self):
+        """
+        Let the operator set the search filters by hand. Platforms override
+        this with their own steps; the default gives generic ones.
+        """
+        print("\n" + "="*60)
+        print("MANUAL SETUP REQUIRED")
+        print("="*60)
+        print(f"Please set up the {self.platform_name} search manually in the browser:")
+        print("1. Enter IT-related search terms and apply any filters you want")
+        print("2. Wait for the results to load")
+        print("3. Make sure you can see the job listings")
+        print("="*60)
+        print("When you're ready for scraping to begin, press ENTER...")
         
+        # Wait for user confirmation
+        self.prompt()
+    
+    def apply_saved_search(self):
+        """
+        Open the saved search's results without operator input: load its
+        start_url, replay its filter actions in order and wait for its
+        ready_selector. Returns False if a step fails or no results appear,
+        so an unattended run stops instead of scraping an unfiltered page.
+        """
+        search = self.saved_search
+        print(f"Applying saved search '{search['name']}'...")
         try:
+            if search.get('start_url'):
+                self.driver.get(search['start_url'])
+            for step in search.get('actions', ()):
+                self.replay_action(step)
+        except Exception as e:
+            print(f"Saved search '{search['name']}' failed: {e}")
+            return False
+        
+        if search.get('ready_selector') and not self.wait_for_page([search['ready_selector']]):
+            print(f"Saved search '{search['name']}' showed no results")
+            return False
+        
+        if search.get('keyword'):
+            self.current_keyword = search['keyword']
+            print(f"Using keyword: '{search['keyword']}'")
+        return True
+    
+    def replay_action(self, step):
+        """Perform one saved-search filter step (see config/saved_searches.py)"""
+        wait = WebDriverWait(self.driver, SCRAPER_CONFIG['page_ready_timeout'])
+        if 'click' in step:
+            wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, step['click']))).click()
+        elif 'click_text' in step:
+            # Innermost element showing the text, not the containers around it
+            text = _xpath_literal(step['click_text'])
+            xpath = f"//*[normalize-space()={text} and not(*[normalize-space()={text}])]"
+            wait.until(EC.element_to_be_clickable((By.XPATH, xpath))).click()
+        elif 'type' in step:
+            field = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, step['type'])))
+            field.clear()
+            field.send_keys(step['text'] + (Keys.ENTER if step.get('submit') else ''))
+        elif 'wait_for' in step:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, step['wait_for'])))
+        else:
+            raise ValueError(f"Unknown saved search step: {step}")
+        time.sleep(random.uniform(*SCRAPER_CONFIG['action_pause']))
+    
+    def save_job(self, **kwargs):
+        """
+        Queue job for a batched upsert into the PostgreSQL database.
+        A job whose URL is already stored refreshes that row and its
+        last_seen_at. A job whose qualifications are already stored under
+        another URL is skipped; the in-memory duplicate index catches this
+        without a query and the unique indexes catch it on flush.
+        Pass analyzed (the job's AnalyzedJobText) to reuse it for the category.
+        Returns True if the job was queued, SKIPPED for a duplicate and False
+        on error.
+        """
+        try:
+            analyzed = kwargs.pop('analyzed', None)
+            
             # Extract qualifications text for duplicate checking
             qualifications = kwargs.get('qualifications', '')
             job_title = kwargs.get('job_title', '')
             
             if job_title:
-                category = categorize_job_title(job_title)
+                category = categorize_job_title(analyzed or job_title)
                 kwargs['category'] = category
                 print(f"Category: {category}")
             
+            job_url = kwargs.get('job_url')
+            kwargs['canonical_url'] = canonicalize_url(job_url)
+            known_url = bool(job_url) and self.dedup.contains_url(job_url)
+            
             # Check for duplicates
             if qualifications:
                 qualifications_hash = hashlib.md5(qualifications.strip().encode('utf-8')).hexdigest()
                 kwargs['qualifications_hash'] = qualifications_hash
                 
-                cur = conn.cursor()
-                cur.execute("SELECT job_title, company_name FROM scraped_jobs WHERE qualifications_hash = %s LIMIT 1", 
-                           (qualifications_hash,))
-                existing_job = cur.fetchone()
-                
-                if existing_job:
+                if not known_url and self.dedup.contains_hash(qualifications_hash):
                     print(f"Duplicate job skipped (same qualifications): {kwargs['job_title']} at {kwargs['company_name']}")
-                    print(f"Original job: {existing_job[0]} at {existing_job[1]}")
-                    conn.close()
-                    return
+                    return self.SKIPPED
             
-            # Insert new job
-            cur = conn.cursor()
-            columns = list(kwargs.keys())
-            placeholders = ', '.join(['%s'] * len(kwargs))
-            columns_str = ', '.join(columns)
-            values = list(kwargs.values())
+            seen_at = kwargs.get('scraped_at') or datetime.now()
+            kwargs['first_seen_at'] = seen_at
+            kwargs['last_seen_at'] = seen_at
             
-            insert_query = f"INSERT INTO scraped_jobs ({columns_str}) VALUES ({placeholders})"
-            cur.execute(insert_query, values)
-            conn.commit()
+            # Buffer job; the writer flushes in batches
+            self.writer.add(kwargs)
+            self._count_seen()
+            if qualifications:
+                self.dedup.add_hash(qualifications_hash)
+            if job_url:
+                self.dedup.add_url(job_url)
             
-            print(f"Saved new job: {kwargs['job_title']} at {kwargs['company_name']}")
+            action = "Queued update for known job" if known_url else "Queued new job"
+            print(f"{action}: {kwargs['job_title']} at {kwargs['company_name']}")
             if kwargs.get('technologies'):
                 print(f"Technologies: {kwargs['technologies']}")
+            return True
                 
         except Exception as e:
             print(f"Database save error: {e}")
             print(f"Data: {kwargs}")
-        finally:
-            conn.close()
+            return False
+    
+    def filter_known_urls(self, items, key=None):
+        """
+        Drop job URLs that are already stored so their detail pages are not
+        fetched again, refreshing their last_seen_at instead.
+        Known URLs are found in the in-memory duplicate index without a query;
+        with refresh_older_than set, one bulk lookup on the indexed
+        canonical_url column keeps stale ones for a re-visit.
+        """
+        items = list(items)
+        urls = [key(item) if key else item for item in items]
+        known = {canonicalize_url(url) for url in urls if self.dedup.contains_url(url)}
+        stale = self._find_stale_urls(known) if known and self.refresh_older_than is not None else set()
+        
+        to_visit = []
+        for item, url in zip(items, urls):
+            canonical_url = canonicalize_url(url)
+            if canonical_url in known and canonical_url not in stale:
+                self.mark_seen(url)
+            else:
+                to_visit.append(item)
+        
+        skipped = len(items) - len(to_visit)
+        if skipped:
+            print(f"Skipping {skipped} already stored jobs ({len(stale)} stale jobs will be refreshed)")
+        return to_visit
+    
+    def _find_stale_urls(self, canonical_urls):
+        """Return the stored URLs whose details were scraped before the refresh cutoff"""
+        cutoff = datetime.now() - timedelta(days=self.refresh_older_than)
+        with pooled_connection() as conn:
+            if not conn:
+                return set()
+            
+            try:
+                cur = conn.cursor()
+                cur.execute(
+                    "SELECT canonical_url FROM scraped_jobs WHERE canonical_url = ANY(%s) AND scraped_at < %s",
+                    (list(canonical_urls), cutoff)
+                )
+                return {row[0] for row in cur.fetchall()}
+            except Exception as e:
+                print(f"Error looking up stale jobs: {e}")
+                return set()
+    
+    def mark_seen(self, job_url):
+        """Record that a stored job was seen again without re-scraping it"""
+        self.writer.touch(canonicalize_url(job_url), datetime.now())
+        self._count_seen()
+    
+    def _count_seen(self):
+        """Count one more job seen by this run"""
+        with self._jobs_seen_lock:
+            self.jobs_seen += 1
+    
+    def wait_for_page(self, selectors=None, timeout=None):
+        """
+        Wait until the page is ready instead of sleeping a fixed time.
+        Ready means every selector (default: DETAIL_READY_SELECTORS) matches,
+        checked in one script round trip per poll. Returns False on timeout;
+        callers then parse whatever has rendered.
+        """
+        selectors = list(selectors if selectors is not None else self.DETAIL_READY_SELECTORS)
+        timeout = timeout or SCRAPER_CONFIG['page_ready_timeout']
+        script = (
+            "return document.readyState !== 'loading' && "
+            "arguments[0].every(function (s) { return document.querySelector(s) !== null; });"
+        )
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=SCRAPER_CONFIG['page_ready_poll']).until(
+                lambda driver: driver.execute_script(script, selectors)
+            )
+            return True
+        except TimeoutException:
+            print(f"Page not ready after {timeout}s - parsing what has loaded")
+            return False
+    
+    def extract_detail_fields(self, *args):
+        """
+        Read the current detail page's fields in one execute_script round
+        trip instead of transferring and parsing the whole page source.
+        args are passed to the script as arguments[0], arguments[1], ...
+        Returns None if the platform has no script or it fails; callers then
+        fall back to BeautifulSoup.
+        """
+        if not self.DETAIL_EXTRACT_SCRIPT:
+            return None
+        
+        try:
+            fields = self.driver.execute_script(EXTRACT_HELPERS_JS + self.DETAIL_EXTRACT_SCRIPT, *args)
+            return fields or None
+        except Exception as e:
+            print(f"In-page extraction failed - falling back to page source: {e}")
+            return None
+    
+    @staticmethod
+    def soup_text(elem):
+        """BeautifulSoup counterpart of the extraction script's text()"""
+        return elem.get_text() if elem else None
+    
+    @staticmethod
+    def soup_joined_text(elem):
+        """BeautifulSoup counterpart of the extraction script's joinedText()"""
+        if not elem:
+            return None
+        return re.sub(r'\s+', ' ', elem.get_text(separator=' ', strip=True))
+    
+    @staticmethod
+    def clean_text(value, default="N/A"):
+        """Strip an extracted string, or return default if the element was missing"""
+        return value.strip() if value is not None else default
+    
+    def block_resources(self):
+        """
+        Stop the main browser loading images, fonts, media and trackers.
+        Called once manual filter setup is done, so the user still sees the
+        full page while choosing filters.
+        """
+        if self.blocked_url_patterns and self._driver:
+            set_request_blocking(self._driver, self.blocked_url_patterns)
+    
+    def polite_pause(self):
+        """Random pause between requests, independent of page load time"""
+        low, high = self.POLITENESS_JITTER or SCRAPER_CONFIG['politeness_jitter']
+        time.sleep(random.uniform(low, high))
+    
+    @property
+    def driver(self):
+        """The calling worker thread's pooled driver, or the main driver"""
+        return getattr(self._thread_state, 'driver', None) or self._driver
+    
+    @driver.setter
+    def driver(self, value):
+        self._driver = value
+    
+    def process_detail_pages(self, items, handler, key=None):
+        """
+        Run handler on every collected item (job URL or tuple) and return how
+        many jobs it saved. Items are not filtered; see run_pipeline.
+        """
+        items = list(items)
+        # The listing is already read, so a single worker uses the main browser
+        workers = min(self.workers, len(items)) if self.workers > 1 else 0
+        return self.run_pipeline([items], handler, key, filter_known=False, workers=workers)
+    
+    def run_pipeline(self, pages, handler, key=None, filter_known=True, workers=None):
+        """
+        Staged detail scraping; returns how many jobs the handler saved.
+        handler returns True once its job is saved (save_job's result),
+        SKIPPED for a job left out on purpose and False on error; only
+        errors are recorded as failed in the checkpoint.
+        pages is the listing producer: an iterable that drives the main
+        browser and yields each listing page's new items (job URL or tuple)
+        as soon as the page is read. Already stored jobs are filtered out
+        page by page and the rest go on a bounded queue. Detail workers, each
+        borrowing a browser from a BrowserPool, run handler on them (fetch
+        and enrichment); inside handler, self.driver is the worker's own
+        browser and saved jobs go to the shared job writer, which writes to
+        the database from its own thread.
+        Detail pages are therefore scraped while later listing pages are
+        still being read, and a full queue pauses the listing; this holds
+        for a single worker too, which gets its own pooled browser. Pooled
+        browsers start with a copy of the main browser's cookies. With
+        workers=0 there is only the main browser, so the listing is read
+        first and the items are processed in order on it.
+        workers defaults to the scraper's detail_workers setting.
+        """
+        workers = self.workers if workers is None else workers
+        
+        def record(item, error=None):
+            if self.checkpoint:
+                url = key(item) if key else item
+                if error:
+                    self.checkpoint.mark_failed(url, error)
+                else:
+                    self.checkpoint.mark_processed(url)
+                self.save_checkpoint()
+        
+        def run(position, item, total=None):
+            url = key(item) if key else item
+            progress = f"{position}/{total}" if total else position
+            print(f"\nProcessing job {progress}: {url}")
+            try:
+                result = handler(item)
+                error = None if result is True or result == self.SKIPPED else "job detail not scraped"
+            except Exception as e:
+                print(f"Error processing job detail: {e}")
+                result, error = False, str(e)
+            record(item, error)
+            return result is True
+        
+        pages = self._listing_items(pages, key, filter_known)
+        if workers < 1:
+            items = []
+            try:
+                for page in pages:
+                    items.extend(page)
+            except Exception as e:
+                print(f"Error collecting job URLs - processing the {len(items)} already collected: {e}")
+            self.block_resources()
+            return sum(run(position, item, len(items)) for position, item in enumerate(items, 1))
+        
+        work = queue.Queue(maxsize=SCRAPER_CONFIG['pipeline_queue_size'])
+        driver_options = {
+            # Pooled browsers get the main browser's cookies: login, bot
+            # clearance and filters set during manual setup
+            'load_cookies_from': browser_session(self._driver),
+            'blocked_url_patterns': self.blocked_url_patterns,
+            'block_images': bool(self.blocked_url_patterns) and 'images' not in self.RESOURCE_ALLOWLIST
+        }
+        with BrowserPool(workers, **driver_options) as pool:
+            def work_loop():
+                succeeded = 0
+                # None marks the end of the listing. A worker that cannot
+                # borrow a browser keeps draining the queue, recording its
+                # items as failed, so the listing never blocks on a full queue
+                for position, item in iter(work.get, None):
+                    try:
+                        with pool.driver() as driver:
+                            self._thread_state.driver = driver
+                            try:
+                                succeeded += run(position, item)
+                            finally:
+                                self._thread_state.driver = None
+                    except Exception as e:
+                        print(f"No browser for job {position}: {e}")
+                        record(item, f"no browser: {e}")
+                return succeeded
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(work_loop) for _ in range(workers)]
+                queued = 0
+                try:
+                    for page in pages:
+                        for item in page:
+                            queued += 1
+                            work.put((queued, item))
+                    print(f"Listing finished: {queued} jobs queued for detail scraping")
+                except Exception as e:
+                    print(f"Error collecting job URLs - finishing the {queued} already queued: {e}")
+                except BaseException:
+                    # Interrupted: drop what is queued so workers stop after their current page
+                    try:
+                        while True:
+                            work.get_nowait()
+                    except queue.Empty:
+                        pass
+                    raise
+                finally:
+                    for _ in futures:
+                        work.put(None)
+                return sum(future.result() for future in futures)
+    
+    def _listing_items(self, pages, key=None, filter_known=True):
+        """
+        Items of each listing page that still need their detail page, with
+        already stored jobs filtered out (filter_known) and counted as
+        processed. Every collected item and the listing cursor go into the
+        run's checkpoint. A resumed run first gets the items collected
+        before the interruption that were not processed, failed ones
+        included; items collected again are dropped.
+        """
+        checkpoint = self.checkpoint
+        
+        def collected():
+            if checkpoint is None:
+                yield from pages
+                return
+            pending = checkpoint.pending()
+            if pending:
+                print(f"Resuming {len(pending)} jobs collected before the interruption")
+                yield pending
+            for number, page in enumerate(pages, self.listing_start_page):
+                checkpoint.set_cursor(page=number, url=self._current_listing_url())
+                yield checkpoint.add_items(page)
+            checkpoint.complete_listing(capped=self.listing_capped)
+        
+        for items in collected():
+            to_visit = self.filter_known_urls(items, key) if filter_known else items
+            if checkpoint:
+                visiting = {key(item) if key else item for item in to_visit}
+                for item in items:
+                    url = key(item) if key else item
+                    if url not in visiting:
+                        checkpoint.mark_processed(url)
+                self.save_checkpoint(force=True)
+            yield to_visit
+    
+    def _current_listing_url(self):
+        """URL of the main browser's page, or None if the browser is gone"""
+        try:
+            return self._driver.current_url
+        except Exception:
+            return None
+    
+    def save_checkpoint(self, force=False):
+        """
+        Write the run's checkpoint once its save_interval has passed, or now
+        with force. Buffered jobs are flushed first, so every job the
+        checkpoint lists as processed is in the database.
+        """
+        if self.checkpoint and (force or self.checkpoint.due()):
+            self.writer.flush()
+            self.checkpoint.save(keyword=self.current_keyword)
+    
+    def _close_checkpoint(self, finished):
+        """Delete the checkpoint of a run that finished everything, otherwise save it for --resume"""
+        checkpoint = self.checkpoint
+        if finished and checkpoint.is_complete() and not checkpoint.failed:
+            checkpoint.remove()
+            return
+        checkpoint.save(keyword=self.current_keyword)
+        print(f"Run {checkpoint.run_id} stopped early or had {len(checkpoint.failed)} failed jobs - "
+              f"continue it with --resume {checkpoint.run_id}")
     
     def setup_driver(self):
         """Initialize Chrome driver"""
@@ -84,9 +606,31 @@ class BaseScraper:
     
     def __enter__(self):
         """Context manager entry"""
+        self.run_started_at = set_run_clock()
+        self.jobs_seen = 0
+        if self.checkpoint is None:
+            saved_search = self.saved_search['name'] if self.saved_search else None
+            self.checkpoint = RunCheckpoint.create(self.platform_name, self.run_started_at, saved_search)
+            print(f"Run id: {self.checkpoint.run_id}")
+        else:
+            # A resumed run continues the interrupted one: postings seen by
+            # either part count as seen by the run
+            self.run_started_at = datetime.fromisoformat(self.checkpoint.state['started_at'])
+            self.current_keyword = self.checkpoint.state['keyword']
+            print(f"Resuming run {self.checkpoint.run_id}")
         self.setup_driver()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.close_driver()
\ No newline at end of file
+        """Context manager exit - also runs on KeyboardInterrupt"""
+        try:
+            self.writer.flush()
+            # Only a run that read its whole listing and saw jobs may age out the
+            # others; a listing cut off at max_jobs never saw the rest
+            state = self.checkpoint.state
+            finished = exc_type is None and state['listing_complete']
+            if finished and not state.get('listing_capped') and self.jobs_seen:
+                mark_unseen_jobs(self.platform_name, self.run_started_at, self.current_keyword)
+            self._close_checkpoint(finished)
+        finally:
+            self.close_driver()
\ No newline at end of file
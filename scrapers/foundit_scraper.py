@@ -18,17 +18,43 @@ import re
 
 from scrapers.base_scraper import BaseScraper
 from utils.tech_extractor import extract_technologies
+from utils.text_analysis import AnalyzedJobText
+from utils.keyword_matcher import KeywordMatcher
 from utils.date_utils import convert_posted_date_foundit
 
 
+# Remote option keywords, checked in this order; default is Not Specified
+REMOTE_OPTION_MATCHER = KeywordMatcher({
+    'Hybrid': ['hybrid'],
+    'Remote': ['remote', 'wfh', 'work from home'],
+    'Onsite': ['onsite'],
+})
+
+# Seniority indicators, senior ones first; the first one found decides
+SENIOR_INDICATORS = ['senior', 'lead', 'principal', 'manager', 'supervisor', 'head of', 'director', 'architect']
+ENTRY_INDICATORS = ['fresh graduate', 'new graduate', 'entry level', 'junior developer', 'junior engineer']
+SENIORITY_MATCHER = KeywordMatcher(SENIOR_INDICATORS + ENTRY_INDICATORS)
+
+# Experience requirements in the page text, checked in this order
+EXPERIENCE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'(\d+)-(\d+)\s*(?:years?|yrs?)',  # "5-15 Years"
+    r'(\d+)\+\s*(?:years?|yrs?)',      # "5+ Years"
+    r'(\d+)\s*to\s*(\d+)\s*(?:years?|yrs?)',  # "5 to 10 years"
+    r'minimum\s*(\d+)\s*(?:years?|yrs?)',     # "minimum 3 years"
+    r'at\s*least\s*(\d+)\s*(?:years?|yrs?)'   # "at least 2 years"
+]]
+
 class FounditScraper(BaseScraper):
     """Foundit job scraper implementation with click-based navigation"""
     
-    def __init__(self):
-        super().__init__("Foundit")
+    DETAIL_READY_SELECTORS = (
+        'h1',
+        'div.break-words, .job-description, .qualifications, [data-testid="job-description"], .job-details, .description',
+    )
+    
+    def __init__(self, **options):
+        super().__init__("Foundit", **options)
         self.base_url = "https://www.foundit.com.ph"
-        self.scraped_jobs = set()  # Track scraped jobs by hash
-        self.scraped_urls = set()  # Track scraped URLs
     
     def scrape_manual(self, max_jobs=20):
         """Scrape Foundit with manual filter setup"""
@@ -43,42 +69,20 @@ class FounditScraper(BaseScraper):
                 self.driver.get(self.base_url)
                 time.sleep(random.uniform(3, 5))
                 
-                # Manual setup instructions
-                print("\n" + "="*60)
-                print("MANUAL SETUP REQUIRED")
-                print("="*60)
-                print("Please do the following manually in the browser:")
-                print("1. Enter IT-related search terms (e.g., 'software developer', 'data analyst')")
-                print("2. Set Location to 'Philippines' if not already set")
-                print("3. Use any additional filters you want:")
-                print("   - Experience level")
-                print("   - Company type")
-                print("   - Salary range")
-                print("   - Date posted")
-                print("4. Click 'Search' and wait for results to load")
-                print("5. Make sure you can see job listings")
-                print("="*60)
-                
-                # NEW: Capture the search keyword from user
-                search_keyword = input("Please enter the search terms you used (this will be stored in the keyword column): ").strip()
-                if not search_keyword:
-                    search_keyword = "Manual Search"
-                
-                # Store the keyword in the instance for use during scraping
-                self.current_keyword = search_keyword
-                print(f"Using keyword: '{search_keyword}'")
-                
-                print("When you're ready for scraping to begin, press ENTER...")
-                input()
+                if not self.setup_search():
+                    return
                 
                 print("Starting automated scraping process...")
+                # Listing and detail pages share this browser; block from here on
+                self.block_resources()
                 
-                # Process jobs page by page
-                page = 1
+                # Process jobs page by page (a resumed run continues at its page)
+                page = self.listing_start_page
                 consecutive_empty_pages = 0
                 
                 while jobs_processed < max_jobs:
                     print(f"\n=== Processing page {page} ===")
+                    self.checkpoint.set_cursor(page=page, url=self._current_listing_url())
                     time.sleep(random.uniform(2, 4))
                     
                     # Get all job card info on this page at once
@@ -106,19 +110,27 @@ class FounditScraper(BaseScraper):
                         if jobs_processed >= max_jobs:
                             break
                         
-                        # Skip if we've already processed this job
-                        if job_info['hash'] in self.scraped_jobs:
+                        # Skip if we've already processed this job (in this run or the one it resumes)
+                        if self.dedup.contains_key(job_info['hash']) or self.checkpoint.is_processed(job_info['hash']):
                             print(f"Skipping already processed: {job_info['title']}")
                             continue
                         
                         print(f"\nJob {jobs_processed + 1}/{max_jobs} (Page {page}, Card {i+1})")
                         print(f"Processing: {job_info['title']} at {job_info['company']}")
                         
-                        # Process this specific job card efficiently
-                        if self._process_job_card_fast(i, job_info):
+                        # Process this specific job card efficiently; cards
+                        # skipped on purpose count as processed, not failed
+                        result = self._process_job_card_fast(i, job_info)
+                        if result is True:
                             jobs_processed += 1
                             jobs_processed_this_page += 1
-                            self.scraped_jobs.add(job_info['hash'])
+                            self.dedup.add_key(job_info['hash'])
+                            self.checkpoint.mark_processed(job_info['hash'])
+                        elif result == self.SKIPPED:
+                            self.checkpoint.mark_processed(job_info['hash'])
+                        else:
+                            self.checkpoint.mark_failed(job_info['hash'], "job detail not scraped")
+                        self.save_checkpoint()
                         
                         # Short delay between jobs
                         time.sleep(random.uniform(0.5, 1.5))
@@ -130,6 +142,8 @@ class FounditScraper(BaseScraper):
                         print("No more pages available")
                         break
                     page += 1
+                
+                self.checkpoint.complete_listing(capped=jobs_processed >= max_jobs)
                     
             except Exception as e:
                 print(f"Error during Foundit scraping: {e}")
@@ -139,6 +153,36 @@ class FounditScraper(BaseScraper):
             print(f"\nFoundit scraping completed!")
             print(f"Total jobs processed: {jobs_processed}")
     
+    def manual_setup(self):
+        """Let the operator search and filter in the browser and enter the keyword used"""
+        # Manual setup instructions
+        print("\n" + "="*60)
+        print("MANUAL SETUP REQUIRED")
+        print("="*60)
+        print("Please do the following manually in the browser:")
+        print("1. Enter IT-related search terms (e.g., 'software developer', 'data analyst')")
+        print("2. Set Location to 'Philippines' if not already set")
+        print("3. Use any additional filters you want:")
+        print("   - Experience level")
+        print("   - Company type")
+        print("   - Salary range")
+        print("   - Date posted")
+        print("4. Click 'Search' and wait for results to load")
+        print("5. Make sure you can see job listings")
+        print("="*60)
+        
+        # NEW: Capture the search keyword from user
+        search_keyword = self.prompt("Please enter the search terms you used (this will be stored in the keyword column): ").strip()
+        if not search_keyword:
+            search_keyword = "Manual Search"
+        
+        # Store the keyword in the instance for use during scraping
+        self.current_keyword = search_keyword
+        print(f"Using keyword: '{search_keyword}'")
+        
+        print("When you're ready for scraping to begin, press ENTER...")
+        self.prompt()
+    
     def _get_all_job_cards_info_fast(self):
         """Get all job card info quickly without detailed clicking analysis"""
         try:
@@ -356,8 +400,6 @@ class FounditScraper(BaseScraper):
     def _process_current_job_page(self):
         """Process the current job detail page"""
         try:
-            # Wait for page to load
-            time.sleep(random.uniform(3, 5))
             current_url = self.driver.current_url
             
             print(f"Processing job page: {current_url}")
@@ -368,10 +410,14 @@ class FounditScraper(BaseScraper):
                 print(f"URL indicates search page, not job detail: {current_url}")
                 return False
             
-            # Skip if this URL was already processed
-            if current_url in self.scraped_urls:
+            # Skip already stored URLs before waiting for the page to load
+            if not self.filter_known_urls([current_url]):
                 print(f"Skipping already processed URL: {current_url}")
-                return False
+                return self.SKIPPED
+            
+            # Wait for page to load
+            self.wait_for_page()
+            self.polite_pause()
             
             soup = BeautifulSoup(self.driver.page_source, "html.parser")
             
@@ -379,17 +425,20 @@ class FounditScraper(BaseScraper):
             external_platforms = ['indeed.com', 'kalibrr.com', 'linkedin.com', 'jobstreet.com']
             if any(platform in current_url.lower() for platform in external_platforms):
                 print(f"Skipping external job from: {current_url}")
-                return False
+                return self.SKIPPED
             
-            # Extract job details
+            # Extract job details; the title, description and page text are
+            # read once and shared by the checks that need them
             job_title = self._extract_job_title(soup)
             company_name = self._extract_company_name(soup)
             location = self._extract_location(soup)
             posted_date = self._extract_posted_date(soup)
-            seniority_level = self._extract_seniority_level(soup)
-            employment_type = self._extract_employment_type(soup)
-            salary = self._extract_salary(soup)
             qualifications_text = self._extract_qualifications(soup)
+            analyzed = AnalyzedJobText(job_title, qualifications_text, location)
+            page_text = soup.get_text()
+            seniority_level = self._extract_seniority_level(soup, analyzed, page_text)
+            employment_type = self._extract_employment_type(page_text)
+            salary = self._extract_salary(page_text)
             
             # Debug output
             print(f"Extracted data:")
@@ -398,14 +447,14 @@ class FounditScraper(BaseScraper):
             print(f"  Location: {location}")
             print(f"  Qualifications length: {len(qualifications_text)}")
             
-            technologies = self._extract_technologies_from_text(job_title, qualifications_text)
-            remote_option = self._determine_remote_option(job_title, location, qualifications_text)
+            technologies = self._extract_technologies_from_text(analyzed)
+            remote_option = self._determine_remote_option(analyzed)
             
-            # More strict validation
+            # More strict validation; a page that did not render is a failure to retry, not a skip
             if (job_title == "N/A" or 
-                any(bad_word in job_title.lower() for bad_word in ['showing', 'results', 'search', 'found']) or
+                any(bad_word in analyzed.title for bad_word in ['showing', 'results', 'search', 'found']) or
                 len(qualifications_text) < 20):
-                print("Could not extract valid job info - skipping")
+                print("Could not extract valid job info")
                 print(f"Title: {job_title}")
                 print(f"Qualifications length: {len(qualifications_text)}")
                 return False
@@ -413,15 +462,15 @@ class FounditScraper(BaseScraper):
             # Create a unique identifier for this job
             job_hash = hashlib.md5(f"{job_title}|{company_name}|{qualifications_text[:100]}".encode()).hexdigest()
             
-            if job_hash in self.scraped_jobs:
+            if self.dedup.contains_key(job_hash):
                 print("Job already processed (duplicate content) - skipping")
-                return False
+                return self.SKIPPED
             
             # Use the captured keyword, with fallback
             keyword_to_use = getattr(self, 'current_keyword', 'Manual Search')
             
             # Save job to database
-            self.save_job(
+            saved = self.save_job(
                 job_title=job_title,
                 company_name=company_name,
                 location=location,
@@ -435,15 +484,15 @@ class FounditScraper(BaseScraper):
                 salary=salary,
                 technologies=technologies,
                 qualifications=qualifications_text,
-                scraped_at=datetime.now()
+                scraped_at=datetime.now(),
+                analyzed=analyzed
             )
             
-            # Track this job as processed
-            self.scraped_jobs.add(job_hash)
-            self.scraped_urls.add(current_url)
+            # Track this job as processed (save_job records its URL)
+            self.dedup.add_key(job_hash)
             
             print(f"Successfully processed: {job_title} at {company_name}")
-            return True
+            return saved
             
         except Exception as e:
             print(f"Error processing job detail: {e}")
@@ -701,20 +750,13 @@ class FounditScraper(BaseScraper):
             print(f"Error extracting posted date: {e}")
             return None
     
-    def _extract_seniority_level(self, soup):
+    def _extract_seniority_level(self, soup, analyzed, page_text):
         """Extract seniority level from the page with strict priority logic"""
         try:
             print("=== SENIORITY LEVEL EXTRACTION DEBUG ===")
             
-            # Get job description and title for analysis using existing method
-            job_desc_text = self._extract_qualifications(soup)
-            job_title = self._extract_job_title(soup)
-            combined_text = f"{job_title.lower()} {job_desc_text.lower()}"
-            
-            print(f"Job title: {job_title}")
-            
             # PRIORITY 1: Check for "internship" anywhere (highest priority)
-            if any(term in combined_text for term in ['internship']):
+            if 'internship' in analyzed.text:
                 print("FOUND INTERNSHIP - Returning 'Internship'")
                 return "Internship"
             
@@ -740,22 +782,12 @@ class FounditScraper(BaseScraper):
             
             # PRIORITY 3: Check for experience requirements (this should override fresher if present)
             print("Checking for experience requirements...")
-            import re
             
             # Look for experience patterns in the visible text
-            page_text = soup.get_text()
-            experience_patterns = [
-                r'(\d+)-(\d+)\s*(?:years?|yrs?)',  # "5-15 Years"
-                r'(\d+)\+\s*(?:years?|yrs?)',      # "5+ Years"  
-                r'(\d+)\s*to\s*(\d+)\s*(?:years?|yrs?)',  # "5 to 10 years"
-                r'minimum\s*(\d+)\s*(?:years?|yrs?)',     # "minimum 3 years"
-                r'at\s*least\s*(\d+)\s*(?:years?|yrs?)'   # "at least 2 years"
-            ]
-            
-            for pattern in experience_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
+            for pattern in EXPERIENCE_PATTERNS:
+                matches = pattern.findall(page_text)
                 if matches:
-                    print(f"Found experience pattern: {pattern} -> {matches}")
+                    print(f"Found experience pattern: {pattern.pattern} -> {matches}")
                     
                     # Extract minimum years from the match
                     if isinstance(matches[0], tuple):
@@ -773,19 +805,15 @@ class FounditScraper(BaseScraper):
                         print(f"Experience requirement {min_years} year(s) - Returning 'Entry Level'")
                         return "Entry Level"
             
-            # PRIORITY 4: Check for senior level indicators in title and description
-            senior_indicators = ['senior', 'lead', 'principal', 'manager', 'supervisor', 'head of', 'director', 'architect']
-            for indicator in senior_indicators:
-                if indicator in combined_text:
-                    print(f"FOUND senior indicator '{indicator}' - Returning 'Non-Entry Level'")
-                    return "Non-Entry Level"
-            
-            # PRIORITY 5: Check for other entry level indicators ONLY in job description
-            entry_indicators = ['fresh graduate', 'new graduate', 'entry level', 'junior developer', 'junior engineer']
-            for indicator in entry_indicators:
-                if indicator in combined_text:
-                    print(f"FOUND entry level indicator '{indicator}' - Returning 'Entry Level'")
-                    return "Entry Level"
+            # PRIORITY 4 and 5: senior level indicators, then entry level
+            # indicators, in title and description
+            indicator = analyzed.first_label(SENIORITY_MATCHER)
+            if indicator in SENIOR_INDICATORS:
+                print(f"FOUND senior indicator '{indicator}' - Returning 'Non-Entry Level'")
+                return "Non-Entry Level"
+            if indicator in ENTRY_INDICATORS:
+                print(f"FOUND entry level indicator '{indicator}' - Returning 'Entry Level'")
+                return "Entry Level"
             
             # DEFAULT: If no specific indicators found, return Non-Entry Level
             print("NO SPECIFIC INDICATORS FOUND - Returning 'Non-Entry Level'")
@@ -798,10 +826,10 @@ class FounditScraper(BaseScraper):
             return "Non-Entry Level"
 
     
-    def _extract_employment_type(self, soup):
-        """Extract employment type from the page"""
+    def _extract_employment_type(self, page_text):
+        """Extract employment type from the page text"""
         # Look for employment type indicators in the page
-        page_text = soup.get_text().lower()
+        page_text = page_text.lower()
         
         if 'full time' in page_text or 'full-time' in page_text:
             return "Full-time"
@@ -816,10 +844,9 @@ class FounditScraper(BaseScraper):
         
         return "Not specified"
     
-    def _extract_salary(self, soup):
-        """Extract salary from the page"""
+    def _extract_salary(self, page_text):
+        """Extract salary from the page text"""
         # Look for salary patterns in the page text
-        page_text = soup.get_text()
         salary_patterns = [
             r'₱[\d,]+(?:\s*-\s*₱[\d,]+)?',
             r'PHP\s*[\d,]+(?:\s*-\s*PHP\s*[\d,]+)?',
@@ -855,27 +882,16 @@ class FounditScraper(BaseScraper):
                 continue
         return ""
     
-    def _extract_technologies_from_text(self, job_title, qualifications_text):
+    def _extract_technologies_from_text(self, analyzed):
         """Extract technologies using the tech extractor"""
         try:
-            combined_text = f"{job_title} {qualifications_text}"
-            return extract_technologies(combined_text)
+            return extract_technologies(analyzed)
         except:
             return None
     
-    def _determine_remote_option(self, job_title, location, qualifications_text):
+    def _determine_remote_option(self, analyzed):
         """Determine remote work option"""
-        combined_text = f"{job_title.lower()} {location.lower()} {qualifications_text.lower()}"
-        
-        if "hybrid" in combined_text:
-            return "Hybrid"
-        elif any(k in combined_text for k in ["remote", "wfh", "work from home"]):
-            return "Remote"
-        
-        elif "onsite" in combined_text:
-            return "Onsite"
-        else:
-            return "Not Specified"
+        return analyzed.first_label(REMOTE_OPTION_MATCHER, "Not Specified", with_location=True)
     
     def _go_to_next_page(self):
         """Try to navigate to the next page"""
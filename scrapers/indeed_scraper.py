@@ -17,132 +17,202 @@ import re
 from scrapers.base_scraper import BaseScraper
 from utils.date_utils import convert_posted_date_indeed
 from utils.tech_extractor import extract_technologies
+from utils.text_analysis import AnalyzedJobText
+from utils.url_frontier import UrlFrontier
+from utils.keyword_matcher import KeywordMatcher
+from utils.seniority import infer_seniority_level
+
+# Remote option keywords, checked in this order; explicit "not remote"
+# phrases win over the words they contain. Default is On-site.
+REMOTE_OPTION_MATCHER = KeywordMatcher({
+    'On-site': [
+        "not remote", "not wfh", "not work from home", "not a hybrid role",
+        "must work in office", "in the office full time", "on-site only", 
+        "office based", "office base"
+    ],
+    'Hybrid': ["hybrid"],
+    'Remote': ["remote", "wfh", "work from home"],
+})
+
+# Reads every detail field in one round trip; mirrors _read_detail_page.
+# arguments are TITLE_, COMPANY_, LOCATION_ and DESCRIPTION_SELECTORS.
+INDEED_DETAIL_SCRIPT = """
+var firstWithText = function (selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var value = text(document.querySelector(selectors[i]));
+        if (value && value.trim()) return value;
+    }
+    return null;
+};
+var ldJson = document.querySelector('script[type="application/ld+json"]');
+var posted = findAll('span', function (el) {
+    var value = string(el);
+    return value !== null && value.toLowerCase().indexOf('ago') !== -1;
+})[0];
+return {
+    job_title: firstWithText(arguments[0]),
+    company_name: firstWithText(arguments[1]),
+    location: firstWithText(arguments[2]),
+    qualifications: joinedText(first(arguments[3])),
+    ld_json: ldJson ? ldJson.textContent : null,
+    posted_text: text(posted),
+    page_text: text(document.documentElement)
+};
+"""
 
 class IndeedScraper(BaseScraper):
     """Indeed job scraper implementation with manual setup"""
     
-    def __init__(self):
-        super().__init__("Indeed")
+    DETAIL_READY_SELECTORS = (
+        'h1[data-testid="jobsearch-JobInfoHeader-title"], h1.jobsearch-JobInfoHeader-title, .jobsearch-JobInfoHeader-title',
+        '#jobDescriptionText, [data-testid="jobsearch-jobDescriptionText"], .jobsearch-jobDescriptionText, .jobsearch-JobComponent-description',
+    )
+    
+    # Indeed rate-limits aggressively, so keep a longer pause between jobs
+    POLITENESS_JITTER = (2, 4)
+    
+    # Bot-check challenges on detail pages are image based
+    RESOURCE_ALLOWLIST = ('images',)
+    
+    # Detail page fields, tried in order
+    TITLE_SELECTORS = (
+        'h1[data-testid="jobsearch-JobInfoHeader-title"]',
+        'h1.jobsearch-JobInfoHeader-title',
+        '.jobsearch-JobInfoHeader-title',
+        'h1'
+    )
+    COMPANY_SELECTORS = (
+        '[data-testid="inlineHeader-companyName"]',
+        '.jobsearch-JobInfoHeader-subtitle a',
+        '.jobsearch-JobInfoHeader-subtitle',
+        '.jobsearch-CompanyInfoContainer a'
+    )
+    LOCATION_SELECTORS = (
+        '[data-testid="jobsearch-JobInfoHeader-companyLocation"]',
+        '.jobsearch-JobInfoHeader-subtitle div',
+        '[data-testid="job-location"]'
+    )
+    DESCRIPTION_SELECTORS = (
+        '#jobDescriptionText',
+        '[data-testid="jobsearch-jobDescriptionText"]',
+        '.jobsearch-jobDescriptionText',
+        '.jobsearch-JobComponent-description'
+    )
+    
+    DETAIL_EXTRACT_SCRIPT = INDEED_DETAIL_SCRIPT
+    
+    def __init__(self, **options):
+        super().__init__("Indeed", **options)
         self.base_url = "https://ph.indeed.com"
-        self.scraped_jobs = set()  # Track scraped jobs by hash
-        self.scraped_urls = set()  # Track scraped URLs
     
     def scrape_manual(self, max_jobs=500):
         """Scrape Indeed with manual filter setup"""
         print(f"\nManual Indeed IT Jobs Scraping")
         
         with self:
-            all_job_urls = []
-            
             try:
                 # Navigate to Indeed homepage
                 print("Navigating to Indeed...")
                 self.driver.get(self.base_url)
                 time.sleep(random.uniform(3, 5))
                 
-                # Manual setup instructions
-                print("\n" + "="*60)
-                print("MANUAL SETUP REQUIRED")
-                print("="*60)
-                print("Please do the following manually in the browser:")
-                print("1. Enter IT-related search terms (e.g., 'software developer', 'data analyst')")
-                print("2. Set Location to 'Philippines' if not already set")
-                print("3. Use any additional filters you want:")
-                print("   - Date posted")
-                print("   - Salary estimate")
-                print("   - Job type (Full-time, Part-time, etc.)")
-                print("   - Experience level")
-                print("   - Remote options")
-                print("4. Click 'Find jobs' and wait for results to load")
-                print("5. Make sure you can see job listings")
-                print("="*60)
-                
-                # Capture the search keyword from user
-                search_keyword = input("Please enter the search terms you used (this will be stored in the keyword column): ").strip()
-                if not search_keyword:
-                    search_keyword = "Manual Search"
-                
-                # Store the keyword in the instance for use during scraping
-                self.current_keyword = search_keyword
-                print(f"Using keyword: '{search_keyword}'")
-                
-                print("When you're ready for scraping to begin, press ENTER...")
-                
-                # Wait for user confirmation
-                input()
+                if not self.setup_search():
+                    return
                 
                 print("Starting automated scraping process...")
                 
-                # First stage: Collect job URLs from all pages
-                page = 0
-                consecutive_empty_pages = 0
-                max_pages = 100  # Safety limit
-                
-                while len(all_job_urls) < max_jobs and page < max_pages:
-                    print(f"\n=== Collecting URLs from page {page + 1} ===")
-                    time.sleep(random.uniform(2, 4))
-                    
-                    # Get job URLs from current page
-                    new_urls = self._collect_job_urls_from_page()
-                    print(f"Found {len(new_urls)} job URLs on page {page + 1}")
-                    
-                    if not new_urls:
-                        consecutive_empty_pages += 1
-                        if consecutive_empty_pages >= 3:
-                            print("No job URLs found for multiple pages. Ending collection.")
-                            break
-                    else:
-                        consecutive_empty_pages = 0
-                        # Add new unique URLs
-                        for url in new_urls:
-                            if url not in all_job_urls:
-                                all_job_urls.append(url)
-                    
-                    print(f"Total unique job URLs collected: {len(all_job_urls)}")
-                    
-                    if len(all_job_urls) >= max_jobs:
-                        print(f"Target reached! Collected {len(all_job_urls)} URLs (target: {max_jobs})")
-                        break
-                    
-                    # Try to go to next page
-                    if not self._go_to_next_page():
-                        print("No more pages available")
-                        break
-                    page += 1
-                
-                print(f"\nTotal unique job URLs collected: {len(all_job_urls)}")
-                
-                # Limit to max_jobs
-                if len(all_job_urls) > max_jobs:
-                    all_job_urls = all_job_urls[:max_jobs]
-                    print(f"Limited to first {max_jobs} URLs")
-                
             except Exception as e:
-                print(f"Error during URL collection: {e}")
+                print(f"Error during setup: {e}")
                 import traceback
                 traceback.print_exc()
                 return
             
-            # Second stage: Process individual job pages
-            if not all_job_urls:
-                print("No job URLs collected. Please check the manual setup and try again.")
-                return
-            
-            print(f"\nStarting detailed job information extraction...")
-            jobs_processed = 0
-            
-            for i, job_url in enumerate(all_job_urls, 1):
-                print(f"\nProcessing job {i}/{len(all_job_urls)}: {job_url}")
-                
-                if self._process_job_detail(job_url):
-                    jobs_processed += 1
-                
-                # Short delay between jobs
-                time.sleep(random.uniform(2, 4))
+            # Job pages are scraped while later result pages are still being collected
+            jobs_processed = self.run_pipeline(self._collect_job_urls(max_jobs), self._process_job_detail)
             
             print(f"\nIndeed scraping completed!")
             print(f"Total jobs processed: {jobs_processed}")
     
+    def manual_setup(self):
+        """Let the operator search and filter in the browser and enter the keyword used"""
+        # Manual setup instructions
+        print("\n" + "="*60)
+        print("MANUAL SETUP REQUIRED")
+        print("="*60)
+        print("Please do the following manually in the browser:")
+        print("1. Enter IT-related search terms (e.g., 'software developer', 'data analyst')")
+        print("2. Set Location to 'Philippines' if not already set")
+        print("3. Use any additional filters you want:")
+        print("   - Date posted")
+        print("   - Salary estimate")
+        print("   - Job type (Full-time, Part-time, etc.)")
+        print("   - Experience level")
+        print("   - Remote options")
+        print("4. Click 'Find jobs' and wait for results to load")
+        print("5. Make sure you can see job listings")
+        print("="*60)
+        
+        # Capture the search keyword from user
+        search_keyword = self.prompt("Please enter the search terms you used (this will be stored in the keyword column): ").strip()
+        if not search_keyword:
+            search_keyword = "Manual Search"
+        
+        # Store the keyword in the instance for use during scraping
+        self.current_keyword = search_keyword
+        print(f"Using keyword: '{search_keyword}'")
+        
+        print("When you're ready for scraping to begin, press ENTER...")
+        
+        # Wait for user confirmation
+        self.prompt()
+    
+    def _collect_job_urls(self, max_jobs):
+        """Listing producer: yield each result page's new job URLs, up to max_jobs in total"""
+        all_job_urls = UrlFrontier()
+        page = 0
+        consecutive_empty_pages = 0
+        max_pages = 100  # Safety limit
+        
+        while len(all_job_urls) < max_jobs and page < max_pages:
+            print(f"\n=== Collecting URLs from page {page + 1} ===")
+            time.sleep(random.uniform(2, 4))
+            
+            # Get job URLs from current page
+            page_urls = self._collect_job_urls_from_page()
+            print(f"Found {len(page_urls)} job URLs on page {page + 1}")
+            
+            new_urls = []
+            if not page_urls:
+                consecutive_empty_pages += 1
+                if consecutive_empty_pages >= 3:
+                    print("No job URLs found for multiple pages. Ending collection.")
+                    break
+            else:
+                consecutive_empty_pages = 0
+                # Add new unique URLs, up to max_jobs
+                for url in page_urls:
+                    if len(all_job_urls) < max_jobs and all_job_urls.add(url):
+                        new_urls.append(url)
+            
+            print(f"Total unique job URLs collected: {len(all_job_urls)}")
+            yield new_urls
+            
+            if len(all_job_urls) >= max_jobs:
+                print(f"Target reached! Collected {len(all_job_urls)} URLs (target: {max_jobs})")
+                self.listing_capped = True
+                break
+            
+            # Try to go to next page
+            if not self._go_to_next_page():
+                print("No more pages available")
+                break
+            page += 1
+            if page >= max_pages:
+                print(f"Stopping at the {max_pages} page limit")
+                self.listing_capped = True
+        
+        print(f"\nTotal unique job URLs collected: {len(all_job_urls)} ({all_job_urls.duplicates} duplicates skipped)")
+    
     def _collect_job_urls_from_page(self):
         """Collect all job URLs from the current page"""
         job_urls = []
@@ -192,12 +262,19 @@ class IndeedScraper(BaseScraper):
                             except:
                                 continue
                     
+                    # The job key gives a stable URL; redirect links carry
+                    # per-session parameters (sponsored ones may lack the key)
+                    job_key = card.get_attribute('data-jk') or (
+                        link_elem.get_attribute('data-jk') if job_link else None
+                    )
+                    if job_key:
+                        job_link = f"{self.base_url}/viewjob?jk={job_key}"
+                    
                     if job_link:
                         # Clean and validate URL
                         if not job_link.startswith('http'):
                             job_link = self.base_url + job_link
                         
-                        # Keep the URL as-is, including redirect URLs since they work
                         job_urls.append(job_link)
                         
                 except Exception as e:
@@ -214,25 +291,25 @@ class IndeedScraper(BaseScraper):
     def _process_job_detail(self, job_url):
         """Process individual job detail page"""
         try:
-            # Navigate to job page
+            # Navigate to job page (stored URLs were filtered out before this)
             self.driver.get(job_url)
-            time.sleep(random.uniform(4, 6))
+            self.wait_for_page()
+            self.polite_pause()
             
-            # Skip if this URL was already processed
-            if job_url in self.scraped_urls:
-                print(f"Skipping already processed URL: {job_url}")
-                return False
-            
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            fields = self.extract_detail_fields(
+                list(self.TITLE_SELECTORS), list(self.COMPANY_SELECTORS),
+                list(self.LOCATION_SELECTORS), list(self.DESCRIPTION_SELECTORS)
+            ) or self._read_detail_page()
             
             # Extract job details
-            job_title = self._extract_job_title(soup)
-            company_name = self._extract_company_name(soup)
-            location = self._extract_location(soup)
-            posted_date = self._extract_posted_date(soup)
-            employment_type = self._extract_employment_type(soup)
-            salary = self._extract_salary(soup)
-            qualifications_text = self._extract_qualifications(soup)
+            job_title = self.clean_text(fields['job_title'])
+            company_name = self.clean_text(fields['company_name'])
+            location = self.clean_text(fields['location'])
+            posted_date = self._extract_posted_date(fields)
+            qualifications_text = fields['qualifications'] or ""
+            analyzed = AnalyzedJobText(job_title, qualifications_text, location)
+            employment_type = self._extract_employment_type(analyzed)
+            salary = self._extract_salary(fields['page_text'])
             
             # Debug output
             print(f"Extracted data:")
@@ -242,33 +319,32 @@ class IndeedScraper(BaseScraper):
             print(f"  Qualifications length: {len(qualifications_text)}")
             
             # Extract technologies from job description
-            technologies = self._extract_technologies_from_text(job_title, qualifications_text)
+            technologies = self._extract_technologies_from_text(analyzed)
             
             # Determine remote option
-            remote_option = self._determine_remote_option(job_title, location, qualifications_text)
+            remote_option = self._determine_remote_option(analyzed)
             
-            # Extract and normalize seniority level
-            seniority_level = self._extract_seniority_level(job_title, qualifications_text)
-            normalized_seniority = self._normalize_seniority_level(seniority_level)
+            # Extract and normalize seniority level (shared with the backfill)
+            normalized_seniority = infer_seniority_level(analyzed)
             
-            # Validation
+            # Validation; a page that did not render is a failure to retry, not a skip
             if (job_title == "N/A" or 
                 len(qualifications_text) < 20):
-                print("Could not extract valid job info - skipping")
+                print("Could not extract valid job info")
                 return False
             
             # Create a unique identifier for this job
             job_hash = hashlib.md5(f"{job_title}|{company_name}|{qualifications_text[:100]}".encode()).hexdigest()
             
-            if job_hash in self.scraped_jobs:
+            if self.dedup.contains_key(job_hash):
                 print("Job already processed (duplicate content) - skipping")
-                return False
+                return self.SKIPPED
             
             # Use the captured keyword
             keyword_to_use = getattr(self, 'current_keyword', 'Manual Search')
             
             # Save job to database
-            self.save_job(
+            saved = self.save_job(
                 job_title=job_title,
                 company_name=company_name,
                 location=location,
@@ -282,15 +358,15 @@ class IndeedScraper(BaseScraper):
                 salary=salary,
                 technologies=technologies,
                 qualifications=qualifications_text,
-                scraped_at=datetime.now()
+                scraped_at=datetime.now(),
+                analyzed=analyzed
             )
             
-            # Track this job as processed
-            self.scraped_jobs.add(job_hash)
-            self.scraped_urls.add(job_url)
+            # Track this job as processed (save_job records its URL)
+            self.dedup.add_key(job_hash)
             
             print(f"Successfully processed: {job_title} at {company_name}")
-            return True
+            return saved
             
         except Exception as e:
             print(f"Error processing job detail: {e}")
@@ -298,66 +374,40 @@ class IndeedScraper(BaseScraper):
             traceback.print_exc()
             return False
     
-    def _extract_job_title(self, soup):
-        """Extract job title from the page"""
-        selectors = [
-            'h1[data-testid="jobsearch-JobInfoHeader-title"]',
-            'h1.jobsearch-JobInfoHeader-title',
-            '.jobsearch-JobInfoHeader-title',
-            'h1'
-        ]
+    def _read_detail_page(self):
+        """BeautifulSoup fallback returning the same fields as INDEED_DETAIL_SCRIPT"""
+        soup = BeautifulSoup(self.driver.page_source, "html.parser")
         
-        for selector in selectors:
-            try:
-                elem = soup.select_one(selector)
-                if elem and elem.get_text().strip():
-                    return elem.get_text().strip()
-            except:
-                continue
-        return "N/A"
-    
-    def _extract_company_name(self, soup):
-        """Extract company name from the page"""
-        selectors = [
-            '[data-testid="inlineHeader-companyName"]',
-            '.jobsearch-JobInfoHeader-subtitle a',
-            '.jobsearch-JobInfoHeader-subtitle',
-            '.jobsearch-CompanyInfoContainer a'
-        ]
+        script_tag = soup.find('script', type='application/ld+json')
+        posted_elem = soup.find('span', string=lambda x: x and 'ago' in x.lower())
         
-        for selector in selectors:
-            try:
-                elem = soup.select_one(selector)
-                if elem and elem.get_text().strip():
-                    return elem.get_text().strip()
-            except:
-                continue
-        return "N/A"
+        return {
+            'job_title': self._first_text(soup, self.TITLE_SELECTORS),
+            'company_name': self._first_text(soup, self.COMPANY_SELECTORS),
+            'location': self._first_text(soup, self.LOCATION_SELECTORS),
+            'qualifications': self._extract_qualifications(soup),
+            'ld_json': script_tag.text if script_tag else None,
+            'posted_text': self.soup_text(posted_elem),
+            'page_text': soup.get_text(),
+        }
     
-    def _extract_location(self, soup):
-        """Extract location from the page"""
-        selectors = [
-            '[data-testid="jobsearch-JobInfoHeader-companyLocation"]',
-            '.jobsearch-JobInfoHeader-subtitle div',
-            '[data-testid="job-location"]'
-        ]
-        
+    def _first_text(self, soup, selectors):
+        """Text of the first selector that matches a non-empty element"""
         for selector in selectors:
             try:
                 elem = soup.select_one(selector)
                 if elem and elem.get_text().strip():
-                    return elem.get_text().strip()
+                    return elem.get_text()
             except:
                 continue
-        return "N/A"
+        return None
     
-    def _extract_posted_date(self, soup):
-        """Extract posted date from the page"""
+    def _extract_posted_date(self, fields):
+        """Extract posted date from the page fields"""
         try:
             # Try JSON-LD first
-            script_tag = soup.find('script', type='application/ld+json')
-            if script_tag:
-                json_data = json.loads(script_tag.text)
+            if fields['ld_json']:
+                json_data = json.loads(fields['ld_json'])
                 posted_raw = json_data.get("datePosted")
                 if posted_raw:
                     return posted_raw[:10]  # format: YYYY-MM-DD
@@ -366,19 +416,18 @@ class IndeedScraper(BaseScraper):
         
         # Try text-based extraction
         try:
-            posted_elem = soup.find('span', string=lambda x: x and 'ago' in x.lower())
-            if posted_elem:
-                posted_text = posted_elem.get_text().strip()
+            if fields['posted_text'] is not None:
+                posted_text = fields['posted_text'].strip()
                 return convert_posted_date_indeed(posted_text)
         except:
             pass
         
         return None
     
-    def _extract_employment_type(self, soup):
+    def _extract_employment_type(self, analyzed):
         """Extract employment type from job description"""
         try:
-            job_desc_text = self._extract_qualifications(soup).lower()
+            job_desc_text = analyzed.description
             
             if any(term in job_desc_text for term in ['full-time', 'full time', 'fulltime']):
                 return "Full-time"
@@ -397,11 +446,10 @@ class IndeedScraper(BaseScraper):
         except:
             return "Not specified"
     
-    def _extract_salary(self, soup):
-        """Extract salary from the page"""
+    def _extract_salary(self, page_text):
+        """Extract salary from the page text"""
         try:
             # Look for salary patterns in the page text
-            page_text = soup.get_text()
             salary_patterns = [
                 r'₱[\d,]+(?:\s*-\s*₱[\d,]+)?(?:\s*(?:per\s*month|/month|monthly))?',
                 r'PHP\s*[\d,]+(?:\s*-\s*PHP\s*[\d,]+)?(?:\s*(?:per\s*month|/month|monthly))?',
@@ -420,76 +468,25 @@ class IndeedScraper(BaseScraper):
     
     def _extract_qualifications(self, soup):
         """Extract qualifications text from job description"""
-        selectors = [
-            '#jobDescriptionText',
-            '[data-testid="jobsearch-jobDescriptionText"]',
-            '.jobsearch-jobDescriptionText',
-            '.jobsearch-JobComponent-description'
-        ]
-        
-        for selector in selectors:
+        for selector in self.DESCRIPTION_SELECTORS:
             try:
                 elem = soup.select_one(selector)
                 if elem:
-                    text = elem.get_text(separator=' ', strip=True)
-                    text = re.sub(r'\s+', ' ', text)
-                    return text
+                    return self.soup_joined_text(elem)
             except:
                 continue
         return ""
     
-    def _extract_technologies_from_text(self, job_title, qualifications_text):
+    def _extract_technologies_from_text(self, analyzed):
         """Extract technologies using the tech extractor"""
         try:
-            combined_text = f"{job_title} {qualifications_text}"
-            return extract_technologies(combined_text)
+            return extract_technologies(analyzed)
         except:
             return None
     
-    def _determine_remote_option(self, job_title, location, qualifications_text):
+    def _determine_remote_option(self, analyzed):
         """Determine remote work option"""
-        combined_text = f"{job_title.lower()} {location.lower()} {qualifications_text.lower()}"
-        
-        # Check for explicit "not remote" indicators first
-        if any(term in combined_text for term in [
-            "not remote", "not wfh", "not work from home", "not a hybrid role",
-            "must work in office", "in the office full time", "on-site only", 
-            "office based", "office base"
-        ]):
-            return "On-site"
-        elif "hybrid" in combined_text:
-            return "Hybrid"
-        elif any(term in combined_text for term in ["remote", "wfh", "work from home"]):
-            return "Remote"
-        else:
-            return "On-site"
-    
-    def _extract_seniority_level(self, job_title, qualifications_text):
-        """Extract seniority level from job content"""
-        try:
-            combined_text = f"{job_title.lower()} {qualifications_text.lower()}"
-            
-            if any(term in combined_text for term in ['internship', 'intern', 'trainee']):
-                return "Internship"
-            elif any(term in combined_text for term in ['manager', 'director', 'lead', 'senior', 'head', 'executive', 'principal']):
-                return "Non-Entry Level"
-            elif any(term in combined_text for term in ['entry', 'junior', 'associate', 'fresh graduate', 'assistant']):
-                return "Entry Level"
-            else:
-                return "Non-Entry Level"
-        except:
-            return "Non-Entry Level"
-    
-    def _normalize_seniority_level(self, seniority_level):
-        """Normalize seniority level to standard categories"""
-        seniority_lower = seniority_level.lower()
-        
-        if 'internship' in seniority_lower or 'intern' in seniority_lower:
-            return "Internship"
-        elif any(indicator in seniority_lower for indicator in ['entry', 'junior', 'associate', 'fresh']):
-            return "Entry Level"
-        else:
-            return "Non-Entry Level"
+        return analyzed.first_label(REMOTE_OPTION_MATCHER, "On-site", with_location=True)
     
     def _go_to_next_page(self):
         """Try to navigate to the next page"""
@@ -13,12 +13,60 @@ import re
 from scrapers.base_scraper import BaseScraper
 from utils.date_utils import convert_posted_date_jobstreet
 from utils.tech_extractor import extract_technologies
+from utils.text_analysis import AnalyzedJobText
+from utils.url_frontier import UrlFrontier
+from utils.keyword_matcher import KeywordMatcher
+
+# Remote option keywords, checked in this order against the location and
+# then the whole page; default is On-site
+REMOTE_OPTION_MATCHER = KeywordMatcher({
+    'Remote': ["remote", "wfh", "work from home"],
+    'Hybrid': ["hybrid"],
+    'On-site': ["onsite", "on-site", "office"],
+})
+
+ENTRY_LEVEL_MATCHER = KeywordMatcher(
+    ["entry-level", "fresh graduate", "fresh grad", "entry level", "new graduate", "junior"],
+    whole_words=True
+)
+
+# Reads every detail field in one round trip; mirrors _read_detail_page.
+# arguments[0] is DESCRIPTION_SELECTORS.
+JOBSTREET_DETAIL_SCRIPT = """
+var workType = document.querySelector('span[data-automation="job-detail-work-type"]');
+var descriptionSelector = arguments[0].find(function (s) { return document.querySelector(s) !== null; }) || null;
+return {
+    job_title: text(document.querySelector('[data-automation="job-detail-title"]')),
+    company_name: text(document.querySelector('[data-automation="advertiser-name"]')),
+    location: text(document.querySelector('[data-automation="job-detail-location"]')),
+    employment_type: text(workType && workType.querySelector('a')),
+    salary: text(document.querySelector('span[data-automation="job-detail-salary"]')),
+    description_selector: descriptionSelector,
+    qualifications: descriptionSelector ? joinedText(document.querySelector(descriptionSelector)) : null,
+    page_text: text(document.documentElement)
+};
+"""
 
 class JobstreetScraper(BaseScraper):
     """JobStreet job scraper implementation with manual setup"""
     
-    def __init__(self):
-        super().__init__("JobStreet")
+    DETAIL_READY_SELECTORS = (
+        '[data-automation="job-detail-title"]',
+        'div[data-automation="jobAdDetails"], div._1lns5ab0.sye2ly0, div.job-description, div.FYwKg',
+    )
+    
+    # Job description containers, most specific first
+    DESCRIPTION_SELECTORS = (
+        'div._1lns5ab0.sye2ly0',
+        'div[data-automation="jobAdDetails"]',
+        'div.job-description',
+        'div.FYwKg',
+    )
+    
+    DETAIL_EXTRACT_SCRIPT = JOBSTREET_DETAIL_SCRIPT
+    
+    def __init__(self, **options):
+        super().__init__("JobStreet", **options)
         self.base_url = "https://ph.jobstreet.com"
     
     def scrape_manual(self, max_jobs=500):
@@ -26,199 +74,192 @@ class JobstreetScraper(BaseScraper):
         print(f"\nManual JobStreet IT Jobs Scraping")
         
         with self:
-            all_job_urls = []
-            
             try:
                 # Navigate to JobStreet Philippines
                 print("Navigating to JobStreet Philippines homepage...")
                 self.driver.get(self.base_url)
                 time.sleep(random.uniform(3, 5))
                 
-                # Manual setup instructions
-                print("\n" + "="*60)
-                print("MANUAL SETUP REQUIRED")
-                print("="*60)
-                print("Please do the following manually in the browser:")
-                print("1. Look for the search filters or advanced search options")
-                print("2. Find and click on 'Industry' or 'Job Category' filter")
-                print("3. Select 'Information Technology' or 'IT' related categories")
-                print("4. You can also set other filters like:")
-                print("   - Location (if you want specific cities)")
-                print("   - Experience level")
-                print("   - Posted date (for freshness)")
-                print("5. Click 'Search' or 'Apply Filters'")
-                print("6. Wait for the IT job results to load completely")
-                print("7. Make sure you can see the job listings")
-                print("="*60)
-                print("When you're ready for scraping to begin, press ENTER...")
-                
-                # Wait for user confirmation
-                input()
+                if not self.setup_search():
+                    return
                 
                 print("Starting automated scraping process...")
                 time.sleep(random.uniform(2, 4))
                 
-                # Collect job URLs with pagination
-                page = 1
-                consecutive_empty_pages = 0
-                
-                while len(all_job_urls) < max_jobs:
-                    print(f"\nProcessing page {page}...")
-                    time.sleep(random.uniform(2, 4))
-                    soup = BeautifulSoup(self.driver.page_source, "html.parser")
-                    
-                    # Extract job links from current page
-                    job_links = soup.select('a[data-automation="jobTitle"]')
-                    print(f"Found {len(job_links)} job links on page {page}")
-                    
-                    if not job_links:
-                        print(f"No job links found on page {page}. Might have reached the end.")
-                        break
-                    
-                    # Add new unique URLs with posted dates
-                    new_urls = []
-                    for job_link in job_links:
-                        try:
-                            href = job_link['href'].split("#")[0]
-                            job_url = "https://ph.jobstreet.com" + href
-                            
-                            # Extract posted date
-                            posted_tag = job_link.find_next('span', attrs={"data-automation": "jobListingDate"})
-                            raw_posted = posted_tag.text.strip().replace("Posted ", "") if posted_tag else "N/A"
-                            posted_date = convert_posted_date_jobstreet(raw_posted)
-                            
-                            if job_url not in [url for url, _ in all_job_urls]:
-                                new_urls.append((job_url, posted_date))
-                                all_job_urls.append((job_url, posted_date))
-                                
-                        except Exception as e:
-                            print(f"Error processing job link: {e}")
-                            continue
-                    
-                    print(f"Added {len(new_urls)} new unique job URLs. Total: {len(all_job_urls)}")
-                    
-                    if len(all_job_urls) >= max_jobs:
-                        break
-                    
-                    # Handle pagination
-                    if len(new_urls) == 0:
-                        consecutive_empty_pages += 1
-                        if consecutive_empty_pages >= 3:
-                            print("Found no new jobs for consecutive pages. Reached the end.")
-                            break
-                    else:
-                        consecutive_empty_pages = 0
+            except Exception as e:
+                print(f"Error during JobStreet setup: {e}")
+                return
+            
+            # Job pages are scraped while later result pages are still being collected
+            self.run_pipeline(
+                self._collect_job_urls(max_jobs),
+                lambda item: self._process_job_detail(*item),
+                key=lambda item: item[0]
+            )
+    
+    def manual_setup(self):
+        """Let the operator select the IT industry filter in the browser"""
+        # Manual setup instructions
+        print("\n" + "="*60)
+        print("MANUAL SETUP REQUIRED")
+        print("="*60)
+        print("Please do the following manually in the browser:")
+        print("1. Look for the search filters or advanced search options")
+        print("2. Find and click on 'Industry' or 'Job Category' filter")
+        print("3. Select 'Information Technology' or 'IT' related categories")
+        print("4. You can also set other filters like:")
+        print("   - Location (if you want specific cities)")
+        print("   - Experience level")
+        print("   - Posted date (for freshness)")
+        print("5. Click 'Search' or 'Apply Filters'")
+        print("6. Wait for the IT job results to load completely")
+        print("7. Make sure you can see the job listings")
+        print("="*60)
+        print("When you're ready for scraping to begin, press ENTER...")
+        
+        # Wait for user confirmation
+        self.prompt()
+    
+    def _collect_job_urls(self, max_jobs):
+        """Listing producer: yield each result page's new (job URL, posted date) pairs"""
+        all_job_urls = UrlFrontier()
+        page = 1
+        consecutive_empty_pages = 0
+        
+        while len(all_job_urls) < max_jobs:
+            print(f"\nProcessing page {page}...")
+            time.sleep(random.uniform(2, 4))
+            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            
+            # Extract job links from current page
+            job_links = soup.select('a[data-automation="jobTitle"]')
+            print(f"Found {len(job_links)} job links on page {page}")
+            
+            if not job_links:
+                print(f"No job links found on page {page}. Might have reached the end.")
+                break
+            
+            # Add new unique URLs with posted dates
+            new_urls = []
+            for job_link in job_links:
+                try:
+                    href = job_link['href'].split("#")[0]
+                    job_url = "https://ph.jobstreet.com" + href
                     
-                    # Try to navigate to next page
-                    try:
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, 'a[rel="nofollow next"]')
-                        if next_button and next_button.is_displayed() and next_button.is_enabled():
-                            print(f"Auto-navigating to page {page + 1}...")
-                            next_button.click()
-                            page += 1
-                            time.sleep(random.uniform(3, 5))
-                            continue
-                        else:
-                            print("No more pages found.")
-                            break
-                    except Exception as e:
-                        print(f"Error handling pagination: {e}")
-                        break
-                
-                print(f"Total unique job URLs collected: {len(all_job_urls)}")
-                
-                # Process individual jobs
-                for i, (job_url, posted_date) in enumerate(all_job_urls, 1):
-                    print(f"\nProcessing job {i}/{len(all_job_urls)}: {job_url}")
-                    self._process_job_detail(job_url, posted_date)
+                    # Extract posted date
+                    posted_tag = job_link.find_next('span', attrs={"data-automation": "jobListingDate"})
+                    raw_posted = posted_tag.text.strip().replace("Posted ", "") if posted_tag else "N/A"
+                    posted_date = convert_posted_date_jobstreet(raw_posted)
                     
+                    if all_job_urls.add(job_url, posted_date=posted_date):
+                        new_urls.append((job_url, posted_date))
+                        
+                except Exception as e:
+                    print(f"Error processing job link: {e}")
+                    continue
+            
+            print(f"Added {len(new_urls)} new unique job URLs. Total: {len(all_job_urls)}")
+            yield new_urls
+            
+            if len(all_job_urls) >= max_jobs:
+                self.listing_capped = True
+                break
+            
+            # Handle pagination
+            if len(new_urls) == 0:
+                consecutive_empty_pages += 1
+                if consecutive_empty_pages >= 3:
+                    print("Found no new jobs for consecutive pages. Reached the end.")
+                    break
+            else:
+                consecutive_empty_pages = 0
+            
+            # Try to navigate to next page
+            try:
+                next_button = self.driver.find_element(By.CSS_SELECTOR, 'a[rel="nofollow next"]')
+                if next_button and next_button.is_displayed() and next_button.is_enabled():
+                    print(f"Auto-navigating to page {page + 1}...")
+                    next_button.click()
+                    page += 1
+                    time.sleep(random.uniform(3, 5))
+                    continue
+                else:
+                    print("No more pages found.")
+                    break
             except Exception as e:
-                print(f"Error during JobStreet scraping: {e}")
+                print(f"Error handling pagination: {e}")
+                break
+        
+        print(f"Total unique job URLs collected: {len(all_job_urls)} ({all_job_urls.duplicates} duplicates skipped)")
+    
+    def _read_detail_page(self):
+        """BeautifulSoup fallback returning the same fields as JOBSTREET_DETAIL_SCRIPT"""
+        soup = BeautifulSoup(self.driver.page_source, "html.parser")
+        
+        work_type = soup.find('span', attrs={"data-automation": "job-detail-work-type"})
+        description_selector = next(
+            (selector for selector in self.DESCRIPTION_SELECTORS if soup.select_one(selector)), None
+        )
+        
+        return {
+            'job_title': self.soup_text(soup.select_one('[data-automation="job-detail-title"]')),
+            'company_name': self.soup_text(soup.select_one('[data-automation="advertiser-name"]')),
+            'location': self.soup_text(soup.select_one('[data-automation="job-detail-location"]')),
+            'employment_type': self.soup_text(work_type.a if work_type else None),
+            'salary': self.soup_text(soup.select_one('span[data-automation="job-detail-salary"]')),
+            'description_selector': description_selector,
+            'qualifications': self.soup_joined_text(soup.select_one(description_selector)) if description_selector else None,
+            'page_text': soup.get_text(),
+        }
     
     def _process_job_detail(self, job_url, posted_date):
         """Process individual job detail page"""
         try:
             self.driver.get(job_url)
-            time.sleep(random.uniform(4, 6))
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            self.wait_for_page()
+            self.polite_pause()
+            fields = self.extract_detail_fields(list(self.DESCRIPTION_SELECTORS)) or self._read_detail_page()
 
             # Extract job details
-            job_title = soup.select_one('[data-automation="job-detail-title"]').text.strip() if soup.select_one('[data-automation="job-detail-title"]') else "N/A"
-            company = soup.select_one('[data-automation="advertiser-name"]').text.strip() if soup.select_one('[data-automation="advertiser-name"]') else "N/A"
-            location = soup.select_one('[data-automation="job-detail-location"]').text.strip() if soup.select_one('[data-automation="job-detail-location"]') else "N/A"
-
-            work_type = soup.find('span', attrs={"data-automation": "job-detail-work-type"})
-            employment_type = work_type.a.text.strip() if work_type and work_type.a else "N/A"
+            job_title = self.clean_text(fields['job_title'])
+            company = self.clean_text(fields['company_name'])
+            location = self.clean_text(fields['location'])
+            employment_type = self.clean_text(fields['employment_type'])
 
-            # Extract salary
-            salary = None
-            try:
-                salary_elem = soup.select_one('span[data-automation="job-detail-salary"]')
-                if salary_elem:
-                    salary = salary_elem.text.strip()
-                    print(f"Found salary: {salary}")
-            except Exception as e:
-                print(f"Could not extract salary: {e}")
+            salary = self.clean_text(fields['salary'], None)
+            if salary is not None:
+                print(f"Found salary: {salary}")
 
             # Extract qualifications text
             qualifications_text = ""
-            try:
-                selectors_to_try = [
-                    'div._1lns5ab0.sye2ly0',
-                    'div[data-automation="jobAdDetails"]',
-                    'div.job-description',
-                    'div.FYwKg',
-                ]
-                
-                qualifications_elem = None
-                for selector in selectors_to_try:
-                    qualifications_elem = soup.select_one(selector)
-                    if qualifications_elem:
-                        print(f"Found qualifications using selector: {selector}")
-                        break
-                
-                if qualifications_elem:
-                    qualifications_text = qualifications_elem.get_text(separator=' ', strip=True)
-                    qualifications_text = re.sub(r'\s+', ' ', qualifications_text)
-                    print(f"Qualifications extracted: {len(qualifications_text)} characters")
-                else:
-                    print("No qualifications element found with any selector")
-                        
-            except Exception as e:
-                print(f"Error extracting qualifications: {e}")
+            if fields['description_selector']:
+                print(f"Found qualifications using selector: {fields['description_selector']}")
+                qualifications_text = fields['qualifications']
+                print(f"Qualifications extracted: {len(qualifications_text)} characters")
+            else:
+                print("No qualifications element found with any selector")
+
+            analyzed = AnalyzedJobText(job_title, qualifications_text, location)
 
             # Extract technologies
             technologies = None
             try:
-                combined_text_for_tech = f"{job_title} {qualifications_text}"
-                technologies = extract_technologies(combined_text_for_tech)
+                technologies = extract_technologies(analyzed)
                 if technologies:
                     print(f"Technologies found: {technologies}")
             except Exception as e:
                 print(f"Error extracting technologies: {e}")
 
+            # Remote option and seniority read the whole page, not just the
+            # description
+            page = AnalyzedJobText(job_title, fields['page_text'], location)
+
             # Determine remote option
-            location_lower = location.lower()
-            text = soup.get_text().lower()
-            combined_text = f"{job_title.lower()} {text}"
-            
-            if any(keyword in location_lower for keyword in ["remote", "wfh", "work from home"]):
-                remote_option = "Remote"
-            elif "hybrid" in location_lower:
-                remote_option = "Hybrid"
-            elif any(keyword in location_lower for keyword in ["onsite", "on-site", "office"]):
-                remote_option = "On-site"
-            elif any(k in combined_text for k in ["remote", "wfh", "work from home"]):
-                remote_option = "Remote"
-            elif "hybrid" in combined_text:
-                remote_option = "Hybrid"
-            else:
-                remote_option = "On-site"
+            remote_option = (REMOTE_OPTION_MATCHER.first_label(page.location)
+                             or page.first_label(REMOTE_OPTION_MATCHER, "On-site"))
 
             # Determine seniority level
-            entry_keywords = ["entry-level", "fresh graduate", "fresh grad", "entry level", "new graduate", "junior"]
-            
-            if self._contains_keyword(combined_text, entry_keywords):
+            if page.keywords(ENTRY_LEVEL_MATCHER):
                 seniority_level = "Entry Level"
             else:
                 seniority_level = "Non-Entry Level"
@@ -228,7 +269,7 @@ class JobstreetScraper(BaseScraper):
                 posted_date = None
 
             # Save job
-            self.save_job(
+            return self.save_job(
                 job_title=job_title,
                 company_name=company,
                 location=location,
@@ -242,13 +283,10 @@ class JobstreetScraper(BaseScraper):
                 salary=salary,
                 technologies=technologies,
                 qualifications=qualifications_text,
-                scraped_at=datetime.now()
+                scraped_at=datetime.now(),
+                analyzed=analyzed
             )
             
         except Exception as e:
             print(f"Error processing job detail: {e}")
-
-    def _contains_keyword(self, text, keywords):
-        """Helper method to check if text contains any of the keywords"""
-        import re
-        return any(re.search(rf"\b{k}\b", text) for k in keywords)
\ No newline at end of file
+            return False
\ No newline at end of file
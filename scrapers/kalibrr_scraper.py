@@ -13,12 +13,42 @@ import re
 from scrapers.base_scraper import BaseScraper
 from utils.date_utils import convert_posted_date_kalibrr
 from utils.tech_extractor import extract_technologies
+from utils.text_analysis import AnalyzedJobText
+from utils.url_frontier import UrlFrontier
+
+# Reads every detail field in one round trip; mirrors _read_detail_page
+KALIBRR_DETAIL_SCRIPT = """
+var seniority = document.querySelector('dd[class="k-inline-flex k-items-center"]');
+var salary = document.querySelector('li[class="md:k-list-disc md:k-ml-7"]');
+var matching = function (selector, pattern) {
+    return findAll(selector, function (el) { return pattern.test(string(el) || ''); })[0] || null;
+};
+return {
+    company_name: text(document.querySelector('h2.k-inline-block')),
+    job_title: text(document.querySelector('h1[itemprop="title"]')),
+    location: text(document.querySelector('span[itemscope][itemtype="http://schema.org/PostalAddress"]')),
+    employment_type: text(document.querySelector('a.k-text-grey-900[href*="/home/t/"]')),
+    remote_option: text(matching('span', /Remote|Hybrid|On-site/)),
+    date_posted: text(document.querySelector('span[itemprop="datePosted"]')),
+    posted_text: text(matching('p', /Posted.*ago/)),
+    seniority_level: text(seniority && seniority.querySelector('a')),
+    salary_spans: salary ? Array.prototype.map.call(salary.querySelectorAll('span'), text) : null,
+    qualifications: joinedText(document.querySelector('div[itemprop="qualifications"]'))
+};
+"""
 
 class KalibrrScraper(BaseScraper):
     """Kalibrr job scraper implementation with manual setup"""
     
-    def __init__(self):
-        super().__init__("Kalibrr")
+    DETAIL_READY_SELECTORS = (
+        'h1[itemprop="title"]',
+        'div[itemprop="qualifications"]',
+    )
+    
+    DETAIL_EXTRACT_SCRIPT = KALIBRR_DETAIL_SCRIPT
+    
+    def __init__(self, **options):
+        super().__init__("Kalibrr", **options)
         self.base_url = "https://www.kalibrr.com"
     
     def scrape_manual(self, max_jobs=500):
@@ -26,7 +56,7 @@ class KalibrrScraper(BaseScraper):
         print(f"\nManual Kalibrr IT Jobs Scraping")
         
         with self:
-            all_job_urls = []
+            all_job_urls = UrlFrontier()
             
             try:
                 # Step 1: Navigate to Kalibrr main page
@@ -34,22 +64,8 @@ class KalibrrScraper(BaseScraper):
                 self.driver.get(self.base_url)
                 time.sleep(random.uniform(3, 5))
                 
-                # Step 2: Wait for manual filter setup
-                print("\n" + "="*60)
-                print("MANUAL SETUP REQUIRED")
-                print("="*60)
-                print("Please do the following manually in the browser:")
-                print("1. Click the Filter button")
-                print("2. Click 'Job function' dropdown")
-                print("3. Check the 'IT and Software' checkbox")
-                print("4. Click the Search button")
-                print("5. Wait for the IT jobs to load completely")
-                print("6. Make sure you can see the job listings")
-                print("="*60)
-                print("When you're ready for scraping to begin, press ENTER...")
-                
-                # Wait for user confirmation
-                input()
+                if not self.setup_search():
+                    return
                 
                 print("Starting automated scraping process...")
                 print("Waiting for job content to load completely...")
@@ -69,15 +85,15 @@ class KalibrrScraper(BaseScraper):
                     new_urls = []
                     for job_link in job_links:
                         job_url = "https://www.kalibrr.com" + job_link.get('href')
-                        if job_url not in all_job_urls:
+                        if all_job_urls.add(job_url):
                             new_urls.append(job_url)
-                            all_job_urls.append(job_url)
                     
                     print(f"Added {len(new_urls)} new unique job URLs. Total: {len(all_job_urls)}")
                     
                     # Check if we've reached our target
                     if len(all_job_urls) >= max_jobs:
                         print(f"Target reached! Collected {len(all_job_urls)} jobs (target: {max_jobs})")
+                        self.listing_capped = True
                         break
                     
                     # If no new URLs found, check what to do next
@@ -88,12 +104,13 @@ class KalibrrScraper(BaseScraper):
                     # Simple break for now - you can add Load More logic later if needed
                     break
                 
-                print(f"Total unique job URLs collected: {len(all_job_urls)}")
+                print(f"Total unique job URLs collected: {len(all_job_urls)} ({all_job_urls.duplicates} duplicates skipped)")
+                all_job_urls = self.filter_known_urls(all_job_urls)
                 
-                # Ask user if they want to proceed with individual job scraping
+                # Ask user if they want to proceed with individual job scraping (saved searches run unattended)
                 if len(all_job_urls) > 0:
                     print(f"\nReady to scrape {len(all_job_urls)} individual job pages")
-                    proceed = input("Do you want to proceed with detailed job scraping? (y/n): ").lower().strip()
+                    proceed = 'y' if self.saved_search else self.prompt("Do you want to proceed with detailed job scraping? (y/n): ").lower().strip()
                     
                     if proceed != 'y':
                         print("Scraping cancelled by user")
@@ -109,9 +126,26 @@ class KalibrrScraper(BaseScraper):
             # Second stage: Visit individual job pages for detailed information
             print(f"\nStarting detailed job information extraction...")
             
-            for i, job_url in enumerate(all_job_urls, 1):
-                print(f"\nProcessing job {i}/{len(all_job_urls)}: {job_url}")
-                self._process_job_detail(job_url)
+            self.process_detail_pages(all_job_urls, self._process_job_detail)
+    
+    def manual_setup(self):
+        """Let the operator select the IT and Software job function in the browser"""
+        # Wait for manual filter setup
+        print("\n" + "="*60)
+        print("MANUAL SETUP REQUIRED")
+        print("="*60)
+        print("Please do the following manually in the browser:")
+        print("1. Click the Filter button")
+        print("2. Click 'Job function' dropdown")
+        print("3. Check the 'IT and Software' checkbox")
+        print("4. Click the Search button")
+        print("5. Wait for the IT jobs to load completely")
+        print("6. Make sure you can see the job listings")
+        print("="*60)
+        print("When you're ready for scraping to begin, press ENTER...")
+        
+        # Wait for user confirmation
+        self.prompt()
     
     def _normalize_seniority_level(self, seniority_level):
         """Normalize seniority level to Entry Level, Non-Entry Level, or Internship"""
@@ -135,66 +169,63 @@ class KalibrrScraper(BaseScraper):
         # Everything else becomes Non-Entry Level
         return "Non-Entry Level"
 
-    # Update your _process_job_detail method - replace the save_job section:
+    def _read_detail_page(self):
+        """BeautifulSoup fallback returning the same fields as KALIBRR_DETAIL_SCRIPT"""
+        soup = BeautifulSoup(self.driver.page_source, "html.parser")
+        
+        seniority_elem = soup.find('dd', class_='k-inline-flex k-items-center')
+        seniority_link = seniority_elem.find('a') if seniority_elem else None
+        salary_elem = soup.find('li', class_='md:k-list-disc md:k-ml-7')
+        
+        return {
+            'company_name': self.soup_text(soup.find('h2', class_='k-inline-block')),
+            'job_title': self.soup_text(soup.find('h1', attrs={'itemprop': 'title'})),
+            'location': self.soup_text(soup.find('span', attrs={'itemscope': True, 'itemtype': 'http://schema.org/PostalAddress'})),
+            'employment_type': self.soup_text(soup.find('a', class_='k-text-grey-900', href=re.compile(r'/home/t/'))),
+            'remote_option': self.soup_text(soup.find('span', string=re.compile(r'Remote|Hybrid|On-site'))),
+            'date_posted': self.soup_text(soup.find('span', attrs={'itemprop': 'datePosted'})),
+            'posted_text': self.soup_text(soup.find('p', string=re.compile(r'Posted.*ago'))),
+            'seniority_level': self.soup_text(seniority_link),
+            'salary_spans': [span.text for span in salary_elem.find_all('span')] if salary_elem else None,
+            'qualifications': self.soup_joined_text(soup.find('div', attrs={'itemprop': 'qualifications'})),
+        }
+
     def _process_job_detail(self, job_url):
         """Process individual job detail page"""
         try:
             self.driver.get(job_url)
-            time.sleep(random.uniform(4, 6))
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-
-            # Extract company name
-            company_elem = soup.find('h2', class_='k-inline-block')
-            company_name = company_elem.text.strip() if company_elem else "N/A"
-
-            # Extract job title
-            title_elem = soup.find('h1', attrs={'itemprop': 'title'})
-            job_title = title_elem.text.strip().replace('\xa0', ' ') if title_elem else "N/A"
-
-            # Extract location
-            location_elem = soup.find('span', attrs={'itemscope': True, 'itemtype': 'http://schema.org/PostalAddress'})
-            location = location_elem.text.strip() if location_elem else "N/A"
-
-            # Extract employment type
-            employment_elem = soup.find('a', class_='k-text-grey-900', href=re.compile(r'/home/t/'))
-            employment_type = employment_elem.text.strip() if employment_elem else "Not specified"
+            self.wait_for_page()
+            self.polite_pause()
+            fields = self.extract_detail_fields() or self._read_detail_page()
 
-            # Extract remote option
-            remote_elem = soup.find('span', string=re.compile(r'Remote|Hybrid|On-site'))
-            remote_option = remote_elem.text.strip() if remote_elem else "On-site"
+            company_name = self.clean_text(fields['company_name'])
+            job_title = self.clean_text(fields['job_title']).replace('\xa0', ' ')
+            location = self.clean_text(fields['location'])
+            employment_type = self.clean_text(fields['employment_type'], "Not specified")
+            remote_option = self.clean_text(fields['remote_option'], "On-site")
 
             # Extract posted date
             posted_date = None
             try:
-                date_elem = soup.find('span', attrs={'itemprop': 'datePosted'})
-                if date_elem:
-                    date_str = date_elem.text.strip()
+                if fields['date_posted'] is not None:
+                    date_str = fields['date_posted'].strip()
                     posted_date = date_str.split('T')[0]  # Extract YYYY-MM-DD part
-                else:
-                    posted_text_elem = soup.find('p', string=re.compile(r'Posted.*ago'))
-                    if posted_text_elem:
-                        posted_date = convert_posted_date_kalibrr(posted_text_elem.text.strip())
+                elif fields['posted_text'] is not None:
+                    posted_date = convert_posted_date_kalibrr(fields['posted_text'].strip())
             except Exception as e:
                 print(f"Could not extract posted date: {e}")
 
-            # Extract seniority level
-            seniority_elem = soup.find('dd', class_='k-inline-flex k-items-center')
-            seniority_level = "Not specified"
-            if seniority_elem:
-                seniority_link = seniority_elem.find('a')
-                if seniority_link:
-                    seniority_level = seniority_link.text.strip()
+            seniority_level = self.clean_text(fields['seniority_level'], "Not specified")
 
             # Extract salary
             salary = None
             try:
-                salary_elem = soup.find('li', class_='md:k-list-disc md:k-ml-7')
-                if salary_elem:
-                    salary_spans = salary_elem.find_all('span')
+                if fields['salary_spans'] is not None:
+                    salary_spans = [span.strip() for span in fields['salary_spans']]
                     if len(salary_spans) >= 3:
-                        potential_salary = f"{salary_spans[0].text.strip()}{salary_spans[1].text.strip()}{salary_spans[2].text.strip()}"
+                        potential_salary = f"{salary_spans[0]}{salary_spans[1]}{salary_spans[2]}"
                     elif len(salary_spans) >= 1:
-                        potential_salary = salary_spans[0].text.strip()
+                        potential_salary = salary_spans[0]
                     else:
                         potential_salary = ""
                     
@@ -205,22 +236,16 @@ class KalibrrScraper(BaseScraper):
             except Exception as e:
                 print(f"Could not extract salary: {e}")
 
-            # Extract qualifications text
-            qualifications_text = ""
-            try:
-                qualifications_elem = soup.find('div', attrs={'itemprop': 'qualifications'})
-                if qualifications_elem:
-                    qualifications_text = qualifications_elem.get_text(separator=' ', strip=True)
-                    qualifications_text = re.sub(r'\s+', ' ', qualifications_text)
-                    print(f"Qualifications extracted: {len(qualifications_text)} characters")
-            except Exception as e:
-                print(f"Error extracting qualifications: {e}")
+            qualifications_text = fields['qualifications'] or ""
+            if qualifications_text:
+                print(f"Qualifications extracted: {len(qualifications_text)} characters")
+
+            analyzed = AnalyzedJobText(job_title, qualifications_text)
 
             # Extract technologies
             technologies = None
             try:
-                combined_text_for_tech = f"{job_title} {qualifications_text}"
-                technologies = extract_technologies(combined_text_for_tech)
+                technologies = extract_technologies(analyzed)
                 
                 if technologies:
                     print(f"Technologies found: {technologies}")
@@ -234,7 +259,7 @@ class KalibrrScraper(BaseScraper):
             normalized_seniority = self._normalize_seniority_level(seniority_level)
 
             # Save job to database
-            self.save_job(
+            return self.save_job(
                 job_title=job_title,
                 company_name=company_name,
                 location=location,
@@ -248,8 +273,10 @@ class KalibrrScraper(BaseScraper):
                 salary=salary,
                 technologies=technologies,
                 qualifications=qualifications_text,
-                scraped_at=datetime.now()
+                scraped_at=datetime.now(),
+                analyzed=analyzed
             )
             
         except Exception as e:
-            print(f"Error scraping job details: {e}")
\ No newline at end of file
+            print(f"Error scraping job details: {e}")
+            return False
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Duplicate Index Tests
+BloomFilter membership and DedupIndex lookups, with and without the database
+"""
+
+import contextlib
+import hashlib
+
+import pytest
+
+psycopg2 = pytest.importorskip('psycopg2')
+
+from database import dedup_index
+from database.dedup_index import BloomFilter, DedupIndex
+
+
+def digest(text):
+    return hashlib.md5(text.encode('utf-8')).digest()
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for number in range(1000):
+        bloom.add(digest(f"job-{number}"))
+
+    assert all(digest(f"job-{number}") in bloom for number in range(1000))
+    false_positives = sum(digest(f"other-{number}") in bloom for number in range(10000))
+    assert false_positives < 300
+
+
+def test_exact_index_matches_canonical_url_variants_hashes_and_keys():
+    index = DedupIndex()
+    index.add_url('https://ph.jobstreet.com/job/1?ref=search')
+    index.add_hash('0' * 32)
+    index.add_key('Developer|Acme')
+
+    assert not index.use_bloom
+    assert index.contains_url('HTTP://ph.jobstreet.com/job/1/#apply')
+    assert not index.contains_url('https://ph.jobstreet.com/job/2')
+    assert index.contains_hash('0' * 32)
+    assert not index.contains_hash('1' * 32)
+    assert index.contains_key('Developer|Acme')
+    assert len(index) == 3
+
+
+def test_bloom_positives_are_confirmed_in_the_database(monkeypatch):
+    lookups = []
+    stored = {'https://ph.jobstreet.com/job/1'}
+
+    def exists_in_db(column, value):
+        lookups.append((column, value))
+        return value in stored
+
+    monkeypatch.setattr(dedup_index, '_exists_in_db', exists_in_db)
+    index = DedupIndex(expected_rows=10, bloom_threshold=5, error_rate=0.01)
+    for url in ('https://ph.jobstreet.com/job/1', 'https://ph.jobstreet.com/job/2'):
+        index._add('url', index.url_digest(url), preloaded=True)
+
+    assert index.use_bloom
+    assert index.contains_url('https://ph.jobstreet.com/job/1')
+    # A filter positive the database does not confirm is a new job
+    assert not index.contains_url('https://ph.jobstreet.com/job/2')
+    assert lookups == [('canonical_url', 'https://ph.jobstreet.com/job/1'), ('canonical_url', 'https://ph.jobstreet.com/job/2')]
+
+    # Jobs added during the run are known without a query
+    index.add_url('https://ph.jobstreet.com/job/3')
+    assert index.contains_url('https://ph.jobstreet.com/job/3')
+    assert len(lookups) == 2
+
+
+class BrokenCursor:
+    def execute(self, sql, params):
+        raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+
+class BrokenConnection:
+    def cursor(self):
+        return BrokenCursor()
+
+
+def test_failed_lookup_is_rolled_back_and_not_a_duplicate(monkeypatch):
+    conn = BrokenConnection()
+    rolled_back = []
+    monkeypatch.setattr(dedup_index, 'pooled_connection', lambda: contextlib.nullcontext(conn))
+    monkeypatch.setattr(dedup_index, 'safe_rollback', rolled_back.append)
+
+    assert dedup_index._exists_in_db('canonical_url', 'https://ph.jobstreet.com/job/1') is False
+    assert rolled_back == [conn]
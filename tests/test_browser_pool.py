@@ -0,0 +1,132 @@
+"""
+Browser Pool Tests
+Launch failures and crashed-browser replacement in BrowserPool
+"""
+
+import pytest
+
+pytest.importorskip('undetected_chromedriver')
+pytest.importorskip('selenium_stealth')
+
+from utils import browser
+from utils.browser import BrowserPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.visited = []
+        self.cookies = []
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("browser gone")
+        return 'about:blank'
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        if cookie['domain'] != '.indeed.com':
+            raise RuntimeError("invalid cookie domain")
+        self.cookies.append(cookie)
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def launches(monkeypatch):
+    """Fake drivers in launch order; launches whose index is in fail_at raise"""
+    launched = []
+    fail_at = set()
+
+    def get_chrome_driver(**options):
+        if len(launched) in fail_at:
+            launched.append(None)
+            raise RuntimeError("Chrome did not start")
+        driver = FakeDriver()
+        launched.append(driver)
+        return driver
+
+    monkeypatch.setattr(browser, 'get_chrome_driver', get_chrome_driver)
+    return launched, fail_at
+
+
+def test_failed_start_quits_launched_browsers(launches):
+    launched, fail_at = launches
+    fail_at.add(2)
+
+    with pytest.raises(RuntimeError):
+        with BrowserPool(3):
+            pass
+
+    assert [driver.quit_called for driver in launched[:2]] == [True, True]
+
+
+def test_crashed_browser_is_replaced(launches):
+    launched, _ = launches
+    with BrowserPool(1) as pool:
+        with pool.driver() as driver:
+            driver.alive = False
+        with pool.driver() as replacement:
+            assert replacement is launched[1]
+    assert launched[0].quit_called
+
+
+def test_pool_shrinks_and_then_raises_when_replacements_fail(launches):
+    launched, fail_at = launches
+    fail_at.add(1)
+
+    with BrowserPool(1) as pool:
+        with pool.driver() as driver:
+            driver.alive = False
+        # No browser left: borrowing fails at once instead of waiting forever
+        with pytest.raises(RuntimeError):
+            with pool.driver():
+                pass
+
+
+def test_session_cookies_are_copied_into_new_browsers(monkeypatch):
+    monkeypatch.setattr(FakeDriver, 'current_url', 'https://ph.indeed.com/jobs?q=developer')
+    main = FakeDriver()
+    main.cookies = [{'name': 'cf_clearance', 'value': 'x', 'domain': '.indeed.com'},
+                    {'name': 'other', 'value': 'y', 'domain': '.example.com'}]
+    session = browser.browser_session(main)
+
+    copy = FakeDriver()
+    browser.copy_session(copy, session)
+    assert copy.visited == ['https://ph.indeed.com/']
+    assert copy.cookies == main.cookies[:1]
+
+
+def test_no_session_from_a_blank_page():
+    assert browser.browser_session(FakeDriver()) is None
+
+
+def test_chrome_is_launched_under_the_launch_lock(monkeypatch):
+    held = []
+
+    class RecordingLock:
+        locked = False
+
+        def __enter__(self):
+            self.locked = True
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.locked = False
+
+    lock = RecordingLock()
+    monkeypatch.setattr(browser, '_launch_lock', None)
+    browser.set_launch_lock(lock)
+    monkeypatch.setattr(browser.uc, 'Chrome', lambda options: held.append(lock.locked) or FakeDriver())
+    monkeypatch.setattr(browser, 'stealth', lambda driver, **settings: None)
+
+    browser.get_chrome_driver()
+    assert held == [True]
+    assert not lock.locked
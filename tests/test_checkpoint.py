@@ -0,0 +1,91 @@
+"""
+Checkpoint Tests
+Saving, resuming and cleaning up RunCheckpoint files
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from config.scraper import CHECKPOINT_CONFIG
+from utils.checkpoint import RunCheckpoint
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(CHECKPOINT_CONFIG, 'dir', str(tmp_path))
+    return tmp_path
+
+
+def new_checkpoint():
+    return RunCheckpoint.create('JobStreet', datetime(2025, 10, 1, 9, 30), saved_search='jobstreet-it')
+
+
+def test_run_id_is_platform_and_start_time():
+    assert new_checkpoint().run_id == 'jobstreet-20251001-093000'
+
+
+def test_resume_restores_pending_items_cursor_and_failures():
+    checkpoint = new_checkpoint()
+    items = [('https://ph.jobstreet.com/job/1', '2025-09-30'), ('https://ph.jobstreet.com/job/2', None),
+             ('https://ph.jobstreet.com/job/3', None)]
+    assert checkpoint.add_items(items) == items
+    checkpoint.set_cursor(page=2, url='https://ph.jobstreet.com/jobs?page=2')
+    checkpoint.mark_processed('https://ph.jobstreet.com/job/1')
+    checkpoint.mark_failed('https://ph.jobstreet.com/job/2', 'timeout')
+    checkpoint.save(keyword='IT and Software')
+
+    resumed = RunCheckpoint.load(checkpoint.run_id)
+    # Failed items are retried; tuple items come back as tuples
+    assert resumed.pending() == items[1:]
+    assert resumed.cursor == {'page': 2, 'url': 'https://ph.jobstreet.com/jobs?page=2'}
+    assert resumed.failed == {'https://ph.jobstreet.com/job/2': 'timeout'}
+    assert resumed.state['keyword'] == 'IT and Software'
+    assert resumed.state['saved_search'] == 'jobstreet-it'
+    assert resumed.is_processed('https://ph.jobstreet.com/job/1')
+    assert not resumed.state['listing_complete']
+
+
+def test_items_collected_again_are_dropped():
+    checkpoint = new_checkpoint()
+    checkpoint.add_items(['https://ph.jobstreet.com/job/1'])
+    checkpoint.save()
+
+    resumed = RunCheckpoint.load(checkpoint.run_id)
+    new_items = resumed.add_items(['https://ph.jobstreet.com/job/1?ref=search', 'https://ph.jobstreet.com/job/4'])
+    assert new_items == ['https://ph.jobstreet.com/job/4']
+
+
+def test_complete_after_listing_and_every_item_processed():
+    checkpoint = new_checkpoint()
+    checkpoint.add_items(['https://ph.jobstreet.com/job/1', 'https://ph.jobstreet.com/job/2'])
+    checkpoint.mark_processed('https://ph.jobstreet.com/job/1')
+    checkpoint.mark_failed('https://ph.jobstreet.com/job/2', 'timeout')
+    checkpoint.complete_listing()
+    assert not checkpoint.is_complete()
+
+    # A retry that succeeds clears the failure
+    checkpoint.mark_processed('https://ph.jobstreet.com/job/2')
+    assert checkpoint.is_complete()
+    assert checkpoint.failed == {}
+
+
+def test_save_replaces_the_file_and_remove_deletes_it(checkpoint_dir):
+    checkpoint = new_checkpoint()
+    checkpoint.save()
+    checkpoint.add_items(['https://ph.jobstreet.com/job/1'])
+    checkpoint.save()
+    assert os.listdir(checkpoint_dir) == [f"{checkpoint.run_id}.json"]
+    assert len(RunCheckpoint.load(checkpoint.run_id).frontier) == 1
+
+    checkpoint.remove()
+    assert os.listdir(checkpoint_dir) == []
+    # Removing twice is harmless
+    checkpoint.remove()
+
+
+def test_missing_or_corrupt_checkpoint_loads_as_none(checkpoint_dir):
+    assert RunCheckpoint.load('indeed-20251001-093000') is None
+    (checkpoint_dir / 'indeed-20251001-093000.json').write_text('{"run_id": ', encoding='utf-8')
+    assert RunCheckpoint.load('indeed-20251001-093000') is None
@@ -0,0 +1,66 @@
+"""
+Date Utility Tests
+Relative posted dates parsed by parse_posted_date
+"""
+
+from datetime import datetime
+
+import pytest
+
+from utils import date_utils
+from utils.date_utils import parse_posted_date, parse_posted_dates
+
+NOW = datetime(2025, 10, 1, 9, 0)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5 minutes ago', '2025-10-01'),
+    ('10 mins ago', '2025-10-01'),
+    ('5m ago', '2025-10-01'),
+    ('12 hours ago', '2025-09-30'),
+    ('3 hrs ago', '2025-10-01'),
+    ('10h ago', '2025-09-30'),
+    ('1 day ago', '2025-09-30'),
+    ('Posted 3d ago', '2025-09-28'),
+    ('Posted 30+ days ago', '2025-09-01'),
+    ('30d+ ago', '2025-09-01'),
+    ('2 weeks ago', '2025-09-17'),
+    ('1 wk ago', '2025-09-24'),
+    ('Active 2w ago', '2025-09-17'),
+    ('2 months ago', '2025-08-02'),
+    ('1 mo ago', '2025-09-01'),
+])
+def test_units_and_their_aliases(text, expected):
+    assert parse_posted_date(text, NOW) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Today', '2025-10-01'),
+    ('Posted today', '2025-10-01'),
+    ('Just posted', '2025-10-01'),
+    ('just now', '2025-10-01'),
+    ('yesterday', '2025-09-30'),
+    ('Posted Yesterday', '2025-09-30'),
+])
+def test_today_and_yesterday(text, expected):
+    assert parse_posted_date(text, NOW) == expected
+
+
+@pytest.mark.parametrize('text', [
+    'apply within 3 days',
+    '2 weeks notice required',
+    'Start in 1 month',
+    '5 days a week',
+    'Posted few hours ago',
+    'N/A',
+    '',
+])
+def test_text_without_a_posted_date_counts_as_today(text):
+    assert parse_posted_date(text, NOW) == '2025-10-01'
+
+
+def test_run_clock_is_the_default_reference_time(monkeypatch):
+    monkeypatch.setattr(date_utils, '_run_clock', None)
+    date_utils.set_run_clock(NOW)
+    assert parse_posted_date('1 day ago') == '2025-09-30'
+    assert parse_posted_dates(['1 day ago', 'today', '1 day ago']) == ['2025-09-30', '2025-10-01', '2025-09-30']
@@ -0,0 +1,84 @@
+"""
+Job Writer Tests
+Flush counters and batch duplicate handling of JobWriter
+"""
+
+import pytest
+
+pytest.importorskip('psycopg2')
+
+from database import job_writer
+from database.job_writer import JOB_COLUMNS, JobWriter
+
+
+def job(url, qualifications_hash=None):
+    return {'job_url': url, 'canonical_url': url, 'qualifications_hash': qualifications_hash}
+
+
+@pytest.fixture
+def writer():
+    writer = JobWriter(batch_size=100, max_latency=60)
+    yield writer
+    writer._write_rows = lambda rows: (0, 0, 0)
+    writer.close()
+
+
+def test_flush_counts_repeated_urls_as_duplicates(writer):
+    written = []
+
+    def write_rows(rows):
+        written.extend(rows)
+        # One new, one update, one qualifications duplicate, one failure
+        return 1, 1, 1
+
+    writer._write_rows = write_rows
+    for url in ('https://a', 'https://b', 'https://a', 'https://c', 'https://d', 'https://b'):
+        writer.add(job(url))
+
+    assert writer.flush() == 2
+    assert len(written) == 4
+    assert (writer.saved_count, writer.updated_count) == (1, 1)
+    assert writer.duplicate_count == 1 + 2
+    assert writer.failed_count == 1
+
+
+def test_flush_without_rows_writes_nothing(writer):
+    writer._write_rows = lambda rows: pytest.fail("no rows to write")
+    assert writer.flush() == 0
+    assert writer.failed_count == 0
+
+
+class FakeCursor:
+    """Cursor answering the hash owner lookup with stored (hash, URL) pairs"""
+
+    def __init__(self, owners):
+        self.owners = owners
+        self.queries = []
+
+    def execute(self, sql, params):
+        self.queries.append(params)
+
+    def fetchall(self):
+        return list(self.owners.items())
+
+
+def test_rows_with_hashes_of_other_urls_are_dropped():
+    rows = [
+        tuple(job(url, qualifications_hash).get(column) for column in JOB_COLUMNS)
+        for url, qualifications_hash in [
+            ('https://a', 'h1'),   # stored under its own URL: an update
+            ('https://b', 'h2'),   # stored under https://x: duplicate
+            ('https://c', 'h3'),   # new hash
+            ('https://d', 'h3'),   # same hash earlier in the batch: duplicate
+            ('https://e', None),   # no qualifications
+        ]
+    ]
+    cursor = FakeCursor({'h1': 'https://a', 'h2': 'https://x'})
+
+    kept, duplicates = job_writer._drop_hash_duplicates(cursor, rows)
+
+    url_position = JOB_COLUMNS.index('canonical_url')
+    assert [row[url_position] for row in kept] == ['https://a', 'https://c', 'https://e']
+    assert duplicates == 2
+    assert len(cursor.queries) == 1
+    assert sorted(cursor.queries[0][0]) == ['h1', 'h2', 'h3']
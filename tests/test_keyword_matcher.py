@@ -0,0 +1,49 @@
+"""
+Keyword Matcher Tests
+Overlapping hits, whole-word matching and label priority of KeywordMatcher
+"""
+
+from utils.keyword_matcher import KeywordMatcher
+
+
+def test_overlapping_keywords_are_all_found_in_text_order():
+    matcher = KeywordMatcher(['java', 'javascript', 'script', 'sql'])
+    assert list(matcher.finditer('javascript and sql')) == [
+        (0, 'javascript'), (0, 'java'), (4, 'script'), (15, 'sql')
+    ]
+    assert matcher.search('no match here') is None
+    assert matcher.search('mysql') == (2, 'sql')
+
+
+def test_whole_words_need_boundaries_on_both_sides():
+    matcher = KeywordMatcher(['go', 'golang', 'c++', 'node.js'], whole_words=True)
+    assert matcher.keywords('we use go, golang and c++') == {'go', 'golang', 'c++'}
+    assert matcher.keywords('google good going') == set()
+    # A prefix of the longest hit only counts where it ends a word too
+    assert matcher.keywords('node.js') == {'node.js'}
+
+
+def test_keywords_are_escaped():
+    matcher = KeywordMatcher(['c#', '.net', 'a+b'])
+    assert matcher.keywords('c# on .net') == {'c#', '.net'}
+    assert matcher.keywords('cx xnet aab') == set()
+
+
+def test_labels_and_first_label_follow_group_order():
+    matcher = KeywordMatcher({
+        'Internship': ['intern', 'ojt'],
+        'Senior': ['senior', 'lead'],
+        'Junior': ['junior', 'entry level'],
+    }, whole_words=True)
+    title = 'junior developer (senior mentor)'
+
+    assert matcher.labels(title) == {'Senior', 'Junior'}
+    assert matcher.first_label(title) == 'Senior'
+    assert matcher.first_label('internal tools developer', 'Unknown') == 'Unknown'
+    assert matcher.first_label_of({'ojt', 'lead'}) == 'Internship'
+
+
+def test_keyword_in_several_groups_has_every_label():
+    matcher = KeywordMatcher({'Backend': ['python', 'go'], 'Data': ['python', 'sql']})
+    assert matcher.labels_of({'python'}) == {'Backend', 'Data'}
+    assert matcher.labels('sql') == {'Data'}
@@ -0,0 +1,146 @@
+"""
+Detail Pipeline Tests
+Handler results, checkpoint bookkeeping and resume of BaseScraper.run_pipeline
+"""
+
+import contextlib
+import os
+
+import pytest
+
+pytest.importorskip('selenium')
+pytest.importorskip('psycopg2')
+
+from config.scraper import CHECKPOINT_CONFIG
+from database.dedup_index import DedupIndex
+from scrapers import base_scraper
+from scrapers.base_scraper import BaseScraper
+
+URLS = ['https://www.kalibrr.com/job/1', 'https://www.kalibrr.com/job/2', 'https://www.kalibrr.com/job/3']
+
+
+class FakeWriter:
+    saved_count = updated_count = duplicate_count = failed_count = 0
+
+    def add(self, job):
+        pass
+
+    def touch(self, canonical_url, seen_at):
+        pass
+
+    def flush(self):
+        pass
+
+
+class FakeDriver:
+    current_url = 'https://www.kalibrr.com/jobs'
+
+    def get_cookies(self):
+        return [{'name': 'session', 'value': 'abc'}]
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path, monkeypatch):
+    """Scrapers with a temporary checkpoint directory and no browser or database"""
+    monkeypatch.setitem(CHECKPOINT_CONFIG, 'dir', str(tmp_path))
+    monkeypatch.setattr(base_scraper, 'get_job_writer', FakeWriter)
+    monkeypatch.setattr(base_scraper, 'get_dedup_index', DedupIndex)
+    monkeypatch.setattr(base_scraper, 'get_chrome_driver', FakeDriver)
+    monkeypatch.setattr(base_scraper, 'mark_unseen_jobs', lambda *args: None)
+
+
+def run(handler, resume=None, items=URLS):
+    """Process items on the main browser the way Kalibrr does; returns (scraper, jobs saved)"""
+    scraper = BaseScraper('Kalibrr', workers=0, block_resources=False, resume=resume)
+    with scraper:
+        saved = scraper.process_detail_pages(items, handler)
+    return scraper, saved
+
+
+def test_saved_and_skipped_jobs_complete_the_run():
+    results = {URLS[0]: True, URLS[1]: BaseScraper.SKIPPED, URLS[2]: True}
+    scraper, saved = run(results.get)
+
+    assert saved == 2
+    assert not os.path.exists(scraper.checkpoint.path)
+
+
+def test_failed_jobs_keep_the_checkpoint_for_resume():
+    def handler(url):
+        if url == URLS[1]:
+            return False
+        if url == URLS[2]:
+            raise RuntimeError("page crashed")
+        return True
+
+    scraper, saved = run(handler)
+    checkpoint = scraper.checkpoint
+
+    assert saved == 1
+    assert os.path.exists(checkpoint.path)
+    assert checkpoint.failed == {URLS[1]: "job detail not scraped", URLS[2]: "page crashed"}
+
+    # The resumed run only retries the failed jobs, then cleans up
+    retried = []
+    resumed, saved = run(lambda url: retried.append(url) or True, resume=checkpoint.run_id, items=[])
+    assert retried == URLS[1:]
+    assert saved == 2
+    assert not os.path.exists(resumed.checkpoint.path)
+
+
+def test_resume_of_another_platform_is_rejected():
+    scraper, _ = run(lambda url: False)
+    with pytest.raises(ValueError):
+        BaseScraper('Indeed', resume=scraper.checkpoint.run_id)
+
+
+@pytest.mark.parametrize('capped', [False, True])
+def test_only_a_listing_read_to_its_end_ages_out_unseen_jobs(monkeypatch, capped):
+    aged_out = []
+    monkeypatch.setattr(base_scraper, 'mark_unseen_jobs', lambda *args: aged_out.append(args))
+    scraper = BaseScraper('Kalibrr', workers=0, block_resources=False)
+
+    def listing():
+        yield URLS
+        # The collector stopped at max_jobs with more results left
+        scraper.listing_capped = capped
+
+    with scraper:
+        scraper.run_pipeline(listing(), lambda url: scraper._count_seen() or True, filter_known=False)
+
+    assert scraper.checkpoint.state['listing_capped'] == capped
+    assert len(aged_out) == (0 if capped else 1)
+
+
+class EmptyPool:
+    """BrowserPool whose browsers all failed to relaunch"""
+
+    def __init__(self, size, **driver_options):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    @contextlib.contextmanager
+    def driver(self):
+        raise RuntimeError("no browsers left in the pool")
+        yield
+
+
+def test_jobs_without_a_browser_fail_instead_of_blocking(monkeypatch):
+    monkeypatch.setattr(base_scraper, 'BrowserPool', EmptyPool)
+    # More jobs than the bounded queue holds, so a stuck worker would hang the listing
+    urls = [f"https://www.kalibrr.com/job/{number}" for number in range(120)]
+    scraper = BaseScraper('Kalibrr', workers=1, block_resources=False)
+    with scraper:
+        saved = scraper.run_pipeline([urls], lambda url: True, filter_known=False)
+
+    assert saved == 0
+    assert len(scraper.checkpoint.failed) == len(urls)
+    assert os.path.exists(scraper.checkpoint.path)
@@ -0,0 +1,84 @@
+"""
+Technology Taxonomy Tests
+Validation of the taxonomy file and invalidation of the compiled matcher cache
+"""
+
+import json
+
+import pytest
+
+from utils import tech_extractor
+from utils.tech_extractor import load_taxonomy, load_tech_matcher
+
+
+def write_taxonomy(path, *entries):
+    path.write_text(json.dumps({'version': 1, 'technologies': list(entries)}), encoding='utf-8')
+
+
+PYTHON = {'name': 'Python', 'category': 'Programming Languages', 'aliases': ['python']}
+RUST = {'name': 'Rust', 'category': 'Programming Languages', 'aliases': ['rust', 'rustlang']}
+
+
+@pytest.fixture
+def taxonomy(tmp_path):
+    path = tmp_path / 'technologies.json'
+    write_taxonomy(path, PYTHON)
+    return path
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Number of TechMatchers compiled from the file rather than loaded from the cache"""
+    count = []
+    monkeypatch.setattr(tech_extractor, 'load_taxonomy', lambda path: count.append(path) or load_taxonomy(path))
+    return count
+
+
+def test_unchanged_file_is_loaded_from_the_cache(taxonomy, tmp_path, builds):
+    cache_dir = tmp_path / 'cache'
+    first = load_tech_matcher(taxonomy, cache_dir)
+    second = load_tech_matcher(taxonomy, cache_dir)
+
+    assert len(builds) == 1
+    assert len(list(cache_dir.iterdir())) == 1
+    assert first.find('Python and Rust') == second.find('Python and Rust') == {'Python'}
+
+
+def test_edited_file_rebuilds_the_matcher(taxonomy, tmp_path, builds):
+    cache_dir = tmp_path / 'cache'
+    load_tech_matcher(taxonomy, cache_dir)
+    write_taxonomy(taxonomy, PYTHON, RUST)
+
+    matcher = load_tech_matcher(taxonomy, cache_dir)
+    assert len(builds) == 2
+    assert matcher.find('python with rustlang') == {'Python', 'Rust'}
+
+
+def test_new_cache_format_rebuilds_the_matcher(taxonomy, tmp_path, builds, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    load_tech_matcher(taxonomy, cache_dir)
+    monkeypatch.setattr(tech_extractor, 'CACHE_FORMAT', tech_extractor.CACHE_FORMAT + 1)
+
+    load_tech_matcher(taxonomy, cache_dir)
+    assert len(builds) == 2
+
+
+def test_unreadable_cache_is_rebuilt(taxonomy, tmp_path, builds):
+    cache_dir = tmp_path / 'cache'
+    load_tech_matcher(taxonomy, cache_dir)
+    cache_file, = cache_dir.iterdir()
+    cache_file.write_bytes(b'not a pickle')
+
+    assert load_tech_matcher(taxonomy, cache_dir).find('python') == {'Python'}
+    assert len(builds) == 2
+
+
+@pytest.mark.parametrize('entry', [
+    {'name': 'Rust', 'aliases': []},
+    {'name': '', 'aliases': ['rust']},
+    {'name': 'Rust', 'aliases': ['Rust']},
+])
+def test_invalid_entries_are_rejected(taxonomy, entry):
+    write_taxonomy(taxonomy, PYTHON, entry)
+    with pytest.raises(ValueError):
+        load_taxonomy(taxonomy)
@@ -0,0 +1,46 @@
+"""
+URL Frontier Tests
+Duplicate detection, ordering and metadata of UrlFrontier
+"""
+
+from utils.url_frontier import UrlFrontier
+
+
+def test_variants_of_a_url_are_duplicates():
+    frontier = UrlFrontier()
+    assert frontier.add('https://ph.indeed.com/viewjob?jk=1')
+    assert not frontier.add('http://PH.indeed.com/viewjob/?jk=1&from=serp&utm_source=x')
+    assert not frontier.add('https://ph.indeed.com/viewjob?jk=1#apply')
+    assert frontier.add('https://ph.indeed.com/viewjob?jk=2')
+
+    assert len(frontier) == 2
+    assert frontier.duplicates == 2
+    assert 'https://ph.indeed.com/viewjob?jk=1&trk=abc' in frontier
+    assert frontier.stats() == {'unique': 2, 'duplicates': 2, 'duplicate_rate': 0.5}
+
+
+def test_first_form_and_order_are_kept():
+    frontier = UrlFrontier(['https://example.com/b/', 'https://example.com/a', 'https://example.com/b'])
+    assert list(frontier) == ['https://example.com/b/', 'https://example.com/a']
+    assert frontier.add_many(['https://example.com/a', 'https://example.com/c']) == ['https://example.com/c']
+
+
+def test_empty_urls_are_ignored():
+    frontier = UrlFrontier()
+    assert not frontier.add('')
+    assert not frontier.add(None)
+    assert len(frontier) == 0
+    assert frontier.duplicates == 0
+
+
+def test_duplicates_fill_metadata_and_raise_priority():
+    frontier = UrlFrontier()
+    frontier.add('https://example.com/a', posted_date=None)
+    frontier.add('https://example.com/b', priority=1)
+    frontier.add('https://example.com/a?utm_campaign=x', priority=5, posted_date='2025-10-01', title='Dev')
+
+    # Metadata from the first sighting wins; missing names are filled in
+    assert frontier.get('https://example.com/a') == {'posted_date': None, 'title': 'Dev'}
+    assert frontier.get('https://example.com/a', 'title') == 'Dev'
+    assert frontier.get('https://example.com/missing', 'title', 'N/A') == 'N/A'
+    assert frontier.by_priority() == ['https://example.com/a', 'https://example.com/b']
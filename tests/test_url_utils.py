@@ -0,0 +1,37 @@
+"""
+URL Utility Tests
+Canonical forms of job URLs from canonicalize_url
+"""
+
+from utils.url_utils import canonicalize_url
+
+
+def test_tracking_parameters_fragments_and_case_are_dropped():
+    assert canonicalize_url('HTTP://Ph.JobStreet.com:80/job/123/?ref=search&utm_source=x&b=2&a=1#apply') == \
+        'https://ph.jobstreet.com/job/123?a=1&b=2'
+    assert canonicalize_url('https://www.linkedin.com/jobs/view/42/?trackingId=abc&refId=def') == \
+        'https://www.linkedin.com/jobs/view/42'
+
+
+def test_empty_urls_have_no_canonical_form():
+    assert canonicalize_url('') is None
+    assert canonicalize_url(None) is None
+
+
+def test_indeed_listing_links_reduce_to_the_job_key():
+    expected = 'https://ph.indeed.com/viewjob?jk=5c1f0d3a9b7e2f41'
+    hrefs = [
+        'https://ph.indeed.com/rc/clk?jk=5c1f0d3a9b7e2f41&bb=Hq0pX3uZ1mK9bT-7vG4aQw%3D%3D&xkcb=SoDv67M3Bp9Yb2Ax4R0LbzkdCdPP'
+        '&fccid=2b6f1e0c8d4a7b93&vjs=3',
+        'https://ph.indeed.com/pagead/clk?mo=r&ad=-6NYlbfkN0Dq1p7Q&vjs=3&tk=1hb2c3d4e5f6g7h8&jk=5c1f0d3a9b7e2f41'
+        '&advn=1234567890123456&p=0&fvj=0&sjdu=QwErTy',
+        'https://ph.indeed.com/viewjob?jk=5c1f0d3a9b7e2f41&from=serp&tk=1hb2c3d4e5f6g7h8&vjs=3',
+        'https://ph.indeed.com/jobs?q=software+developer&l=Philippines&vjk=5c1f0d3a9b7e2f41',
+        'http://PH.Indeed.com/viewjob/?jk=5c1f0d3a9b7e2f41#apply',
+    ]
+    assert {canonicalize_url(href) for href in hrefs} == {expected}
+
+
+def test_indeed_links_without_a_job_key_drop_session_parameters():
+    assert canonicalize_url('https://ph.indeed.com/pagead/clk?mo=r&ad=-6NYlbfkN0Dq1p7Q&xkcb=SoDv67&p=2&cmp=acme') == \
+        'https://ph.indeed.com/pagead/clk?cmp=acme'
@@ -3,19 +3,45 @@ Browser Utilities
 Chrome driver setup and browser-related functions
 """
 
+import queue
 import random
+import threading
 import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 import undetected_chromedriver as uc
 from selenium_stealth import stealth
+from config.scraper import RESOURCE_BLOCKING
 
-def get_chrome_driver(load_cookies_from=None):
-    """Create and configure Chrome driver with stealth settings"""
+# undetected_chromedriver patches its binary on startup, so Chrome is
+# launched by one thread at a time; the orchestrator swaps in a lock shared
+# by its platform processes
+_launch_lock = threading.Lock()
+
+def set_launch_lock(lock):
+    """Hold lock (e.g. a multiprocessing.Lock) around every Chrome launch of this process"""
+    global _launch_lock
+    _launch_lock = lock
+
+def get_chrome_driver(load_cookies_from=None, blocked_url_patterns=None, block_images=False):
+    """
+    Create and configure Chrome driver with stealth settings.
+    blocked_url_patterns (e.g. ['*.png', '*doubleclick.net*']) are blocked
+    from the start; see set_request_blocking. block_images also turns images
+    off in Chrome's content settings, catching images served without a
+    file extension. load_cookies_from is a browser_session snapshot whose
+    cookies are copied in, so the driver shares that browser's login and
+    clearance cookies.
+    """
     options = uc.ChromeOptions()
     options.add_argument("--ignore-certificate-errors")
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_argument("--start-maximized")
+    if block_images:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
-    driver = uc.Chrome(options=options)
+    with _launch_lock:
+        driver = uc.Chrome(options=options)
 
     # Random configurations for stealth
     languages = [["en-US", "en"], ["en-GB", "en"], ["en"], ["en-US"]]
@@ -32,8 +58,162 @@ def get_chrome_driver(load_cookies_from=None):
         fix_hairline=True,
     )
 
+    if blocked_url_patterns:
+        set_request_blocking(driver, blocked_url_patterns)
+
+    if load_cookies_from:
+        copy_session(driver, load_cookies_from)
+
     return driver
 
+def browser_session(driver):
+    """Snapshot of the site driver is on and its cookies, or None if there is none to copy"""
+    try:
+        parts = urlsplit(driver.current_url)
+        if parts.scheme not in ('http', 'https'):
+            return None
+        return {'url': f"{parts.scheme}://{parts.netloc}/", 'cookies': driver.get_cookies()}
+    except Exception as e:
+        print(f"Could not read the browser session: {e}")
+        return None
+
+def copy_session(driver, session):
+    """Open the session's site in driver and add its cookies"""
+    try:
+        driver.get(session['url'])
+    except Exception as e:
+        print(f"Could not open {session['url']} to copy the session: {e}")
+        return
+    failed = 0
+    for cookie in session['cookies']:
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            failed += 1
+    if failed:
+        print(f"Could not copy {failed} of {len(session['cookies'])} cookies")
+
+def set_request_blocking(driver, blocked_url_patterns):
+    """
+    Block requests matching URL patterns via the Chrome DevTools Protocol.
+    Can be changed at any time; an empty list lifts the block.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(blocked_url_patterns)})
+        if blocked_url_patterns:
+            print(f"Blocking {len(blocked_url_patterns)} resource URL patterns")
+    except Exception as e:
+        print(f"Could not set request blocking: {e}")
+
+def get_blocked_url_patterns(allowlist=()):
+    """
+    URL patterns to block from RESOURCE_BLOCKING. allowlist entries may name
+    a whole group ('images', 'fonts', 'media', 'trackers') or one pattern.
+    """
+    if not RESOURCE_BLOCKING['enabled']:
+        return []
+
+    patterns = []
+    for group, group_patterns in RESOURCE_BLOCKING['blocked_resources'].items():
+        if group in allowlist:
+            continue
+        patterns.extend(pattern for pattern in group_patterns if pattern not in allowlist)
+    return patterns
+
+class BrowserPool:
+    """
+    Fixed set of stealth-configured Chrome drivers shared by worker threads.
+    Drivers are launched one at a time (see set_launch_lock).
+    A crashed driver is replaced; if the replacement cannot launch, the
+    pool shrinks, and once it is empty driver() raises instead of waiting.
+    """
+
+    def __init__(self, size, **driver_options):
+        self.size = size
+        self.driver_options = driver_options
+        self._drivers = []
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Launch all drivers; if one fails, quit those already launched"""
+        try:
+            for i in range(self.size):
+                print(f"Launching browser {i + 1}/{self.size}...")
+                self._add_driver()
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def _add_driver(self):
+        driver = get_chrome_driver(**self.driver_options)
+        with self._lock:
+            self._drivers.append(driver)
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self):
+        """Borrow an idle driver, waiting until one is free; raises RuntimeError once the pool is empty"""
+        while True:
+            with self._lock:
+                if not self._drivers:
+                    raise RuntimeError("no browsers left in the pool")
+            try:
+                driver = self._idle.get(timeout=1)
+                break
+            except queue.Empty:
+                pass
+        try:
+            yield driver
+        finally:
+            # A crashed browser is replaced so the pool keeps its size
+            if _is_alive(driver):
+                self._idle.put(driver)
+            else:
+                self._replace(driver)
+
+    def _replace(self, driver):
+        print("Browser crashed - launching a replacement")
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        try:
+            self._add_driver()
+        except Exception as e:
+            with self._lock:
+                remaining = len(self._drivers)
+            print(f"Could not launch a replacement browser - continuing with {remaining}: {e}")
+
+    def close(self):
+        """Quit every driver"""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+def _is_alive(driver):
+    """Check whether a driver's browser session still responds"""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
 def human_like_scroll(driver):
     """Perform human-like scrolling"""
     total_height = driver.execute_script("return document.body.scrollHeight")
@@ -3,155 +3,185 @@ Job Categorization Utilities
 Functions to categorize job titles into Philippine IT Market categories
 """
 
+import re
+from functools import lru_cache
+
+from config.scraper import CATEGORIZER_CONFIG
+from utils.keyword_matcher import KeywordMatcher
+from utils.text_analysis import AnalyzedJobText
+
+# 1. DevOps and Platform Engineering
+DEVOPS_KEYWORDS = [
+    'devops', 'platform engineer', 'site reliability', 'sre', 
+    'infrastructure engineer', 'terraform', 'kubernetes', 'docker',
+    'ci/cd', 'pipeline', 'release engineer',
+    'infrastructure automation', 'deployment engineer', 'platform architect'
+]
+
+# 2. Quality Assurance and Testing  
+QA_KEYWORDS = [
+    'qa engineer', 'quality assurance', 'test', 'tester',
+    'qa analyst', 'testing', 'automation tester', 'test planning',
+    'functional test', 'tester', 'quality',
+    'test automation', 'qa specialist', 'qa automation', 'qa' 
+]
+
+# 3. Database Administration
+DB_KEYWORDS = [
+    'database administrator', 'dba', 'database',
+    'sql administrator', 'metadata', "db administrator","sql server","migration",'extract transform','data architect','data administrator'
+]
+
+# 4. Cloud Computing
+CLOUD_KEYWORDS = [
+    'cloud', 'cloud specialist', 'aws', 'azure', 'gcp', 'solutions architect'
+]
+
+# 5. Cybersecurity
+SECURITY_KEYWORDS = [
+    'security', 'security officer', 'cybersecurity', 'penetration', 
+    'application security', 'infosec', 'cyber security', 'cyber', 'it security'
+]
+
+# 6. Data Science and Analysis
+DATA_KEYWORDS = [
+    'data scientist', 'data analyst', 'data eng', 'business intelligence',
+    'machine learning', 'analytics', 'bi analyst', 'reporting analyst', 'data conversion',
+    'ml', 'web analyst','sql','data visualization','analyst','data annotator','data specialist','powerbi','data workflow analyst',
+    'data strategy','sql analyst', 'sql', 'bi reporting', 
+]
+
+# 7. Software, Web, and Mobile Development (COMBINED CATEGORY)
+SOFTWARE_WEB_MOBILE_KEYWORDS = [
+    # Web Development
+    'web developer', 'frontend developer', 'backend developer',
+    'full stack', 'fullstack', 'angular developer', 'react developer',
+    'vue', 'nodejs', 'web engineer', 'wordpress', 'ui developer', 
+    'web designer', 'frontend engineer', 'ui/ux developer',
+    'javascript developer', 'html', 'css developer', 'java enterprise','java','ui/ux','ui','ux','next.js',
+    # Mobile Development
+    'mobile developer', 'android developer', 
+    'app developer', 'android', 'mobile app', 'cobol',
+    # Software Development
+    'software developer', 'software engineer', 'programmer',
+    'application developer',
+    'java developer', 'python developer', 'golang developer',
+    'developer', 'engineer', '.net developer', 'php developer',
+    'c++ developer', 'technical developer', 'kong developer',
+    'backend engineer', 'application engineer', 'systems developer', 
+    'solutions engineer', 'solutions', 'product designer','building tool', 'website', 'website administrator',
+    'software development','software architect','ai & automation','ai architect','nodejs'
+]
+
+# 8. Network and Systems Administration  
+SYSADMIN_KEYWORDS = [
+    'system administrator', 'systems administrator', 'sysadmin',
+    'network administrator', 'it administrator', 'server administrator',
+    'system analyst', 'it officer', 'system i', 'infrastructure specialist',
+    'systems engineer', 'network engineer', 'server engineer', 'ip telephony', 'telephony', 'system','technology architecture'
+]
+
+# 9. Business and Systems Analysis
+BUSINESS_KEYWORDS = [
+    'business analyst', 'systems analyst', 'functional analyst',
+    'process analyst', 'business systems analyst',
+    'requirements analyst', 'system analyst', 'functional',
+    'business systems', 'process improvement', 'presales', 'payroll','sap','enterprise','sap consultant','sap fico', 'sap associate',
+    'sap administrator', 'technical consultant', 
+]
+
+# 10. IT Management and Operations
+IT_MANAGEMENT_KEYWORDS = [
+    'it project manager', 'project manager', 'owner',
+    'it strategic business partner', 'business partner manager',
+    'billing consultant', 'technical project manager',
+    'business development', 
+    'manager', 'project management', 'itsm', 'director', 'governance', 'compliance', 'management', 'it operations','it project coordinator','chief technology officer',
+    'it supervisor','chief transformation officer', 'it project lead', 'it project', 'it lead', 'project administrator','it specialist','scrum', 'enterprise solutions', 
+]
+
+# 11. IT Support and Helpdesk
+SUPPORT_KEYWORDS = [
+    'it support', 'technical support', 'help desk', 'desktop support',
+    'support', 'support analyst', 'it technician',
+    'computer technician', 'user productivity', 'end user', 
+    'contact center', 'field support',
+    'helpdesk', 'technical', 'support lead', 'deskside support', 'it staff', 'it service', 'it desk','service desk','computer operator','assistant', 
+    'information technology','information staff','technology staff', "it intern", 'it specialist'
+]
+
+# Categories in order of specificity; a title gets the first one that matches
+CATEGORY_KEYWORDS = {
+    'DevOps and Platform Engineering': DEVOPS_KEYWORDS,
+    'Quality Assurance and Testing': QA_KEYWORDS,
+    'Database Administration': DB_KEYWORDS,
+    'Business and Systems Analysis': BUSINESS_KEYWORDS,
+    'Cloud Computing': CLOUD_KEYWORDS,
+    'Cybersecurity': SECURITY_KEYWORDS,
+    'IT Support and Helpdesk': SUPPORT_KEYWORDS,
+    'Data Science and Analysis': DATA_KEYWORDS,
+    'Software, Web, and Mobile Development': SOFTWARE_WEB_MOBILE_KEYWORDS,
+    'Network and Systems Administration': SYSADMIN_KEYWORDS,
+    'IT Management and Operations': IT_MANAGEMENT_KEYWORDS
+}
+
+_category_matcher = KeywordMatcher(CATEGORY_KEYWORDS)
+
+# One substring alternation per category, in the same order, for categorize_series
+_category_patterns = [re.compile('|'.join(map(re.escape, keywords))) for keywords in CATEGORY_KEYWORDS.values()]
+
 def categorize_job_title(job_title):
     """
     Categorize job title based on the 11 Philippine IT Market Analysis categories
-    Returns category name or 'Excluded - Non IT' if no match found
+    job_title is a string or an AnalyzedJobText
+    Returns category name or 'Other IT' if no keyword matches
     """
+    if isinstance(job_title, AnalyzedJobText):
+        return _categorize_clean_title(job_title.title_clean)
+
     title_lower = job_title.lower().strip()
     title_clean = title_lower.replace('|', '').replace('-', ' ')
     
-    # 1. DevOps and Platform Engineering
-    devops_keywords = [
-        'devops', 'platform engineer', 'site reliability', 'sre', 
-        'infrastructure engineer', 'terraform', 'kubernetes', 'docker',
-        'ci/cd', 'pipeline', 'release engineer',
-        'infrastructure automation', 'deployment engineer', 'platform architect'
-    ]
-    
-    # 2. Quality Assurance and Testing  
-    qa_keywords = [
-        'qa engineer', 'quality assurance', 'test', 'tester',
-        'qa analyst', 'testing', 'automation tester', 'test planning',
-        'functional test', 'tester', 'quality',
-        'test automation', 'qa specialist', 'qa automation', 'qa' 
-    ]
-    
-    # 3. Database Administration
-    db_keywords = [
-        'database administrator', 'dba', 'database',
-        'sql administrator', 'metadata', "db administrator","sql server","migration",'extract transform','data architect','data administrator'
-    ]
-    
-    # 4. Cloud Computing
-    cloud_keywords = [
-        'cloud', 'cloud specialist', 'aws', 'azure', 'gcp', 'solutions architect'
-    ]
-    
-    # 5. Cybersecurity
-    security_keywords = [
-        'security', 'security officer', 'cybersecurity', 'penetration', 
-        'application security', 'infosec', 'cyber security', 'cyber', 'it security'
-    ]
-    
-    # 6. Data Science and Analysis
-    data_keywords = [
-        'data scientist', 'data analyst', 'data eng', 'business intelligence',
-        'machine learning', 'analytics', 'bi analyst', 'reporting analyst', 'data conversion',
-        'ml', 'web analyst','sql','data visualization','analyst','data annotator','data specialist','powerbi','data workflow analyst',
-        'data strategy','sql analyst', 'sql', 'bi reporting', 
-    ]
-    
-    # 7. Software, Web, and Mobile Development (COMBINED CATEGORY)
-    software_web_mobile_keywords = [
-        # Web Development
-        'web developer', 'frontend developer', 'backend developer',
-        'full stack', 'fullstack', 'angular developer', 'react developer',
-        'vue', 'nodejs', 'web engineer', 'wordpress', 'ui developer', 
-        'web designer', 'frontend engineer', 'ui/ux developer',
-        'javascript developer', 'html', 'css developer', 'java enterprise','java','ui/ux','ui','ux','next.js',
-        # Mobile Development
-        'mobile developer', 'android developer', 
-        'app developer', 'android', 'mobile app', 'cobol',
-        # Software Development
-        'software developer', 'software engineer', 'programmer',
-        'application developer',
-        'java developer', 'python developer', 'golang developer',
-        'developer', 'engineer', '.net developer', 'php developer',
-        'c++ developer', 'technical developer', 'kong developer',
-        'backend engineer', 'application engineer', 'systems developer', 
-        'solutions engineer', 'solutions', 'product designer','building tool', 'website', 'website administrator',
-        'software development','software architect','ai & automation','ai architect','nodejs'
-    ]
-    
-    # 8. Network and Systems Administration  
-    sysadmin_keywords = [
-        'system administrator', 'systems administrator', 'sysadmin',
-        'network administrator', 'it administrator', 'server administrator',
-        'system analyst', 'it officer', 'system i', 'infrastructure specialist',
-        'systems engineer', 'network engineer', 'server engineer', 'ip telephony', 'telephony', 'system','technology architecture'
-    ]
-    
-    # 9. Business and Systems Analysis
-    business_keywords = [
-        'business analyst', 'systems analyst', 'functional analyst',
-        'process analyst', 'business systems analyst',
-        'requirements analyst', 'system analyst', 'functional',
-        'business systems', 'process improvement', 'presales', 'payroll','sap','enterprise','sap consultant','sap fico', 'sap associate',
-        'sap administrator', 'technical consultant', 
-    ]
-    
-    # 10. IT Management and Operations
-    it_management_keywords = [
-        'it project manager', 'project manager', 'owner',
-        'it strategic business partner', 'business partner manager',
-        'billing consultant', 'technical project manager',
-        'business development', 
-        'manager', 'project management', 'itsm', 'director', 'governance', 'compliance', 'management', 'it operations','it project coordinator','chief technology officer',
-        'it supervisor','chief transformation officer', 'it project lead', 'it project', 'it lead', 'project administrator','it specialist','scrum', 'enterprise solutions', 
-    ]
-    
-    # 11. IT Support and Helpdesk
-    support_keywords = [
-        'it support', 'technical support', 'help desk', 'desktop support',
-        'support', 'support analyst', 'it technician',
-        'computer technician', 'user productivity', 'end user', 
-        'contact center', 'field support',
-        'helpdesk', 'technical', 'support lead', 'deskside support', 'it staff', 'it service', 'it desk','service desk','computer operator','assistant', 
-        'information technology','information staff','technology staff', "it intern", 'it specialist'
-    ]
+    return _categorize_clean_title(title_clean)
 
-    
-    # Check categories in order of specificity
-
-    if any(keyword in title_clean for keyword in devops_keywords):
-        return 'DevOps and Platform Engineering'
-    
-    if any(keyword in title_clean for keyword in qa_keywords):
-        return 'Quality Assurance and Testing'
-    
-    if any(keyword in title_clean for keyword in db_keywords):
-        return 'Database Administration'
-    
-    if any(keyword in title_clean for keyword in business_keywords):
-        return 'Business and Systems Analysis'
-    
-    if any(keyword in title_clean for keyword in cloud_keywords):
-        return 'Cloud Computing'
-    
-    if any(keyword in title_clean for keyword in security_keywords):
-        return 'Cybersecurity'
-    
-    if any(keyword in title_clean for keyword in support_keywords):
-        return 'IT Support and Helpdesk'
-
-    if any(keyword in title_clean for keyword in data_keywords):
-        return 'Data Science and Analysis'
-    
-    if any(keyword in title_clean for keyword in software_web_mobile_keywords):
-        return 'Software, Web, and Mobile Development'
-    
-    if any(keyword in title_clean for keyword in sysadmin_keywords):
-        return 'Network and Systems Administration'
-    
-    if any(keyword in title_clean for keyword in it_management_keywords):
-        return 'IT Management and Operations'
-    
+@lru_cache(maxsize=CATEGORIZER_CONFIG['cache_size'])
+def _categorize_clean_title(title_clean):
+    """Category for an already cleaned title; titles repeat heavily across platforms"""
     # If no match found, still consider it IT-related since it passed the non-IT filter
-    return 'Other IT'
+    return _category_matcher.first_label(title_clean, 'Other IT')
+
+def categorize_cache_info():
+    """Hits, misses and size of the title cache (a functools CacheInfo)"""
+    return _categorize_clean_title.cache_info()
 
+def categorize_cache_clear():
+    """Empty the title cache, e.g. before timing a cold pass"""
+    _categorize_clean_title.cache_clear()
 
+def categorize_series(job_titles):
+    """
+    Categorize a pandas Series (or any sequence) of job titles with the same
+    rules and priority as categorize_job_title. Titles are factorized so each
+    distinct title is cleaned and matched once with vectorized string
+    operations, then the categories are mapped back. Missing titles stay None.
+    Returns a Series aligned with job_titles.
+    """
+    import numpy as np
+    import pandas as pd
 
+    if not isinstance(job_titles, pd.Series):
+        job_titles = pd.Series(job_titles, dtype=object)
 
+    codes, uniques = pd.factorize(job_titles)
+    titles_clean = (
+        pd.Series(uniques, dtype=object).str.lower().str.strip()
+        .str.replace('|', '', regex=False).str.replace('-', ' ', regex=False)
+    )
 
+    # np.select takes the first true condition, matching CATEGORY_KEYWORDS order
+    conditions = [titles_clean.str.contains(pattern, na=False).to_numpy(dtype=bool) for pattern in _category_patterns]
+    categories = np.select(conditions, list(CATEGORY_KEYWORDS), default='Other IT').astype(object)
 
+    # Missing titles have code -1, which picks the None appended at the end
+    categories = np.append(categories, None)
+    return pd.Series(categories[codes], index=job_titles.index, name='category')
@@ -0,0 +1,168 @@
+"""
+Checkpoint Utilities
+Crash-safe per-run record of collected URLs, progress and the listing position
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from config.scraper import CHECKPOINT_CONFIG
+from utils.url_frontier import UrlFrontier
+
+class RunCheckpoint:
+    """
+    State of one scraper run, kept in CHECKPOINT_CONFIG['dir']/<run_id>.json:
+    the frontier (every collected item, in order), the processed and
+    failed keys, the listing cursor (page number and URL) and the run's
+    keyword and saved search. Every write goes to a temporary file that
+    replaces the checkpoint in one step, so a crash leaves either the old
+    or the new state, never a partial file.
+    Items are job URLs or tuples that start with the job URL, such as
+    (job URL, posted date); the frontier is a UrlFrontier holding each item
+    under its URL, so an item collected again, even under another form of
+    its URL, is recognized. Methods are thread-safe, since detail workers
+    report their results concurrently.
+    """
+
+    def __init__(self, run_id, state):
+        self.run_id = run_id
+        self.path = self.path_for(run_id)
+        self.state = state
+        self.frontier = UrlFrontier()
+        self._processed = set(state['processed'])
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._saved_at = 0
+        for item in state.pop('frontier'):
+            # JSON has no tuples; tuple items come back as lists
+            item = tuple(item) if isinstance(item, list) else item
+            self.frontier.add(_item_url(item), item=item)
+
+    @staticmethod
+    def path_for(run_id):
+        return os.path.join(CHECKPOINT_CONFIG['dir'], f"{run_id}.json")
+
+    @classmethod
+    def create(cls, platform, started_at, saved_search=None):
+        """Start the checkpoint of a new run; its id is the platform and start time"""
+        run_id = f"{platform.lower()}-{started_at:%Y%m%d-%H%M%S}"
+        return cls(run_id, {
+            'run_id': run_id,
+            'platform': platform,
+            'started_at': started_at.isoformat(),
+            'updated_at': None,
+            'saved_search': saved_search,
+            'keyword': None,
+            'cursor': {},
+            'listing_complete': False,
+            'listing_capped': False,
+            'frontier': [],
+            'processed': [],
+            'failed': {},
+        })
+
+    @classmethod
+    def load(cls, run_id):
+        """The stored checkpoint of run_id, or None if there is none or it cannot be read"""
+        try:
+            with open(cls.path_for(run_id), encoding='utf-8') as f:
+                return cls(run_id, json.load(f))
+        except FileNotFoundError:
+            print(f"No checkpoint found for run {run_id}")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not read checkpoint of run {run_id}: {e}")
+        return None
+
+    @property
+    def cursor(self):
+        return self.state['cursor']
+
+    @property
+    def failed(self):
+        return self.state['failed']
+
+    def add_items(self, items):
+        """Record collected items and return the ones not collected before (by this run or the one it resumes)"""
+        new_items = []
+        with self._lock:
+            for item in items:
+                if self.frontier.add(_item_url(item), item=item):
+                    new_items.append(item)
+        return new_items
+
+    def pending(self):
+        """Collected items not processed yet, failed ones included, in collection order"""
+        with self._lock:
+            return [metadata['item'] for url, metadata in self.frontier.items() if url not in self._processed]
+
+    def is_processed(self, url):
+        return url in self._processed
+
+    def mark_processed(self, url):
+        with self._lock:
+            if url not in self._processed:
+                self._processed.add(url)
+                self.state['processed'].append(url)
+            self.state['failed'].pop(url, None)
+
+    def mark_failed(self, url, error):
+        with self._lock:
+            self.state['failed'][url] = error
+
+    def set_cursor(self, **cursor):
+        """Record the listing position, e.g. page=3, url=<results page URL>"""
+        with self._lock:
+            self.state['cursor'] = cursor
+
+    def complete_listing(self, capped=False):
+        """Record that the listing was read to its end, or up to the scraper's limit (capped)"""
+        with self._lock:
+            self.state['listing_complete'] = True
+            self.state['listing_capped'] = capped
+
+    def is_complete(self):
+        """Listing read to the end and every collected item processed"""
+        with self._lock:
+            return self.state['listing_complete'] and all(url in self._processed for url in self.frontier)
+
+    def due(self):
+        """True once save_interval seconds have passed since the last save"""
+        return time.monotonic() - self._saved_at >= CHECKPOINT_CONFIG['save_interval']
+
+    def save(self, **fields):
+        """Atomically write the checkpoint, updating any given fields (e.g. keyword) first"""
+        # Saves write one at a time, so an older snapshot never replaces a newer one
+        with self._write_lock:
+            with self._lock:
+                self.state.update(fields)
+                self.state['updated_at'] = datetime.now().isoformat(timespec='seconds')
+                frontier = [metadata['item'] for _, metadata in self.frontier.items()]
+                data = json.dumps({**self.state, 'frontier': frontier}, ensure_ascii=False)
+                self._saved_at = time.monotonic()
+
+            os.makedirs(CHECKPOINT_CONFIG['dir'], exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            try:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Could not write checkpoint of run {self.run_id}: {e}")
+
+    def remove(self):
+        """Delete the checkpoint of a run that finished"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not remove checkpoint of run {self.run_id}: {e}")
+
+def _item_url(item):
+    """Job URL of a frontier item"""
+    return item[0] if isinstance(item, tuple) else item
@@ -3,105 +3,86 @@ Date Utilities
 Functions to convert posted dates from various job platforms
 """
 
+import re
 from datetime import datetime, timedelta
 
+# Relative posted dates in every platform's phrasing: "today", "just posted",
+# "yesterday", "5 minutes ago", "3h ago", "2d ago", "30+ days ago",
+# "30d+ ago", "1 week ago", "2 months ago". Counts need the trailing "ago",
+# so "apply within 3 days" or "2 weeks notice" are not dates.
+RELATIVE_DATE_PATTERN = re.compile(
+    r'\b(?:(?P<today>today|just\s+(?:posted|now))'
+    r'|(?P<yesterday>yesterday)'
+    r'|(?P<count>\d+)\s*\+?\s*(?P<unit>minutes?|mins?|hours?|hrs?|days?|weeks?|wks?|months?|mos?|m|h|d|w)\+?\s*ago)\b',
+    re.IGNORECASE
+)
+
+# Length of one unit, keyed by 'mo' for months and the first letter otherwise
+UNIT_DELTAS = {
+    'm': timedelta(minutes=1),
+    'h': timedelta(hours=1),
+    'd': timedelta(days=1),
+    'w': timedelta(weeks=1),
+    'mo': timedelta(days=30),
+}
+
+# Reference time relative dates are counted back from; set once per run so a
+# multi-hour run dates every job against the same moment
+_run_clock = None
+
+def set_run_clock(now=None):
+    """Fix the reference time for relative dates (the current time by default)"""
+    global _run_clock
+    _run_clock = now or datetime.now()
+    return _run_clock
+
+def parse_posted_date(text, now=None):
+    """
+    Convert a relative posted date to YYYY-MM-DD, counted back from now,
+    the run clock, or the current time, in that order. Text without a
+    recognizable date counts as posted today.
+    """
+    now = now or _run_clock or datetime.now()
+    return (now - _posted_age(text)).strftime("%Y-%m-%d")
+
+def parse_posted_dates(texts, now=None):
+    """parse_posted_date for many texts against one reference time; repeated texts are parsed once"""
+    now = now or _run_clock or datetime.now()
+    dates = {}
+    results = []
+    for text in texts:
+        if text not in dates:
+            dates[text] = parse_posted_date(text, now)
+        results.append(dates[text])
+    return results
+
+def _posted_age(text):
+    """How long ago text says the job was posted"""
+    match = RELATIVE_DATE_PATTERN.search(text)
+    if not match or match.group('today'):
+        return timedelta(0)
+    if match.group('yesterday'):
+        return timedelta(days=1)
+
+    unit = match.group('unit').lower()
+    return int(match.group('count')) * UNIT_DELTAS['mo' if unit.startswith('mo') else unit[0]]
+
 def convert_posted_date_indeed(text):
     """Convert Indeed posted date format to YYYY-MM-DD"""
-    now = datetime.now()
-    text = text.lower()
-    if "today" in text or "just posted" in text: 
-        return now.strftime("%Y-%m-%d")
-    if "day" in text: 
-        return (now - timedelta(days=int(text.split()[0]))).strftime("%Y-%m-%d")
-    if "week" in text: 
-        return (now - timedelta(weeks=int(text.split()[0]))).strftime("%Y-%m-%d")
-    if "month" in text: 
-        return (now - timedelta(days=30 * int(text.split()[0]))).strftime("%Y-%m-%d")
-    return now.strftime("%Y-%m-%d")
+    return parse_posted_date(text)
 
 def convert_posted_date_jobstreet(text):
     """Convert JobStreet posted date format to YYYY-MM-DD"""
-    now = datetime.now()
-    if "day" in text or "d" in text:
-        days = int(''.join(filter(str.isdigit, text)))
-        return (now - timedelta(days=days)).strftime("%Y-%m-%d")
-    return now.strftime("%Y-%m-%d")
+    return parse_posted_date(text)
 
 def linkedin_format_posted_date(text):
     """Convert LinkedIn posted date format to YYYY-MM-DD"""
-    now = datetime.now()
-    if "today" in text or "just now" in text: 
-        return now.strftime("%Y-%m-%d")
-    if "yesterday" in text: 
-        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    if "day" in text: 
-        return (now - timedelta(days=int(text.split()[0]))).strftime("%Y-%m-%d")
-    if "week" in text: 
-        return (now - timedelta(weeks=int(text.split()[0]))).strftime("%Y-%m-%d")
-    if "month" in text: 
-        return (now - timedelta(days=30 * int(text.split()[0]))).strftime("%Y-%m-%d")
-    return now.strftime("%Y-%m-%d")
+    return parse_posted_date(text)
 
 def convert_posted_date_kalibrr(text):
     """Convert Kalibrr posted date format to YYYY-MM-DD"""
-    now = datetime.now()
-    text = text.lower()
-    
-    if "today" in text or "just posted" in text:
-        return now.strftime("%Y-%m-%d")
-    elif "yesterday" in text:
-        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    elif "day" in text:
-        days = int(''.join(filter(str.isdigit, text)))
-        return (now - timedelta(days=days)).strftime("%Y-%m-%d")
-    elif "week" in text:
-        weeks = int(''.join(filter(str.isdigit, text)))
-        return (now - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
-    elif "month" in text:
-        months = int(''.join(filter(str.isdigit, text)))
-        return (now - timedelta(days=30 * months)).strftime("%Y-%m-%d")
-    
-    return now.strftime("%Y-%m-%d")
+    return parse_posted_date(text)
 
 def convert_posted_date_foundit(text):
     """Convert Foundit posted date format to YYYY-MM-DD"""
-    from datetime import datetime, timedelta
-    import re
-    
-    now = datetime.now()
-    text_lower = text.lower().strip()
-    
-    # Handle "today"
-    if "today" in text_lower:
-        return now.strftime("%Y-%m-%d")
-    
-    # Handle "yesterday"
-    if "yesterday" in text_lower:
-        return (now - timedelta(days=1)).strftime("%Y-%m-%d")
-    
-    # Handle "X days ago"
-    days_match = re.search(r'(\d+)\s+days?\s+ago', text_lower)
-    if days_match:
-        days_ago = int(days_match.group(1))
-        return (now - timedelta(days=days_ago)).strftime("%Y-%m-%d")
-    
-    # Handle "X hours ago"
-    hours_match = re.search(r'(\d+)\s+hours?\s+ago', text_lower)
-    if hours_match:
-        hours_ago = int(hours_match.group(1))
-        return (now - timedelta(hours=hours_ago)).strftime("%Y-%m-%d")
-    
-    # Handle "X weeks ago"
-    weeks_match = re.search(r'(\d+)\s+weeks?\s+ago', text_lower)
-    if weeks_match:
-        weeks_ago = int(weeks_match.group(1))
-        return (now - timedelta(weeks=weeks_ago)).strftime("%Y-%m-%d")
-    
-    # Handle "X months ago"
-    months_match = re.search(r'(\d+)\s+months?\s+ago', text_lower)
-    if months_match:
-        months_ago = int(months_match.group(1))
-        return (now - timedelta(days=30 * months_ago)).strftime("%Y-%m-%d")
-    
-    # Fallback to today if no pattern matches
-    return now.strftime("%Y-%m-%d")
\ No newline at end of file
+    return parse_posted_date(text)
@@ -0,0 +1,105 @@
+"""
+Keyword Matching Utilities
+Single-pass matching of many keywords against job text
+"""
+
+import re
+
+class KeywordMatcher:
+    """
+    Finds every occurrence of a set of keywords in one scan of the text.
+    The keywords are compiled into one trie-shaped regex that is tried at
+    every position through a lookahead, so overlapping hits ('java' inside
+    'javascript') are all reported and the cost grows with the text, not
+    with the number of keywords.
+
+    keywords is either a list of keywords or a dict mapping a label to its
+    keywords; labels keep the dict's order, which first_label treats as
+    priority. Matching is case-sensitive; callers pass lowercased text.
+    With whole_words=True a keyword only matches where it does not touch
+    other word characters (like \\b around word-character keywords).
+    """
+
+    def __init__(self, keywords, whole_words=False):
+        groups = keywords if isinstance(keywords, dict) else {keyword: [keyword] for keyword in keywords}
+        self.whole_words = whole_words
+        self.labels_by_keyword = {}
+        for label, group in groups.items():
+            for keyword in group:
+                self.labels_by_keyword.setdefault(keyword, [])
+                if label not in self.labels_by_keyword[keyword]:
+                    self.labels_by_keyword[keyword].append(label)
+        self.label_order = list(groups)
+
+        # Every keyword that is a prefix of a longer one also matched when
+        # the longer one did; precompute those lists longest first
+        keywords = sorted(self.labels_by_keyword, key=len, reverse=True)
+        self.prefixes = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+
+        body = _trie_pattern(keywords)
+        if whole_words:
+            body = rf'(?<!\w){body}(?!\w)'
+        self.pattern = re.compile(rf'(?=({body}))')
+
+    def finditer(self, text):
+        """Yield (start, keyword) for every keyword occurrence, in text order"""
+        for match in self.pattern.finditer(text):
+            start = match.start()
+            longest = match.group(1)
+            for keyword in self.prefixes[longest]:
+                if self.whole_words and keyword != longest and _is_word_char(text, start + len(keyword)):
+                    continue
+                yield start, keyword
+
+    def search(self, text):
+        """Return the first (start, keyword) hit in text, or None"""
+        return next(self.finditer(text), None)
+
+    def keywords(self, text):
+        """Return the set of keywords that occur in text"""
+        return {keyword for _, keyword in self.finditer(text)}
+
+    def labels(self, text):
+        """Return the set of labels with at least one keyword in text"""
+        return self.labels_of(self.keywords(text))
+
+    def labels_of(self, keywords):
+        """Return the set of labels of keywords already found by keywords()"""
+        return {label for keyword in keywords for label in self.labels_by_keyword[keyword]}
+
+    def first_label(self, text, default=None):
+        """Return the highest-priority label found in text, or default"""
+        return self.first_label_of(self.keywords(text), default)
+
+    def first_label_of(self, keywords, default=None):
+        """Return the highest-priority label of keywords already found, or default"""
+        found = self.labels_of(keywords)
+        return next((label for label in self.label_order if label in found), default)
+
+def _is_word_char(text, position):
+    return position < len(text) and (text[position].isalnum() or text[position] == '_')
+
+def _trie_pattern(keywords):
+    """Regex alternation with shared prefixes factored out, longest match first"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here; trying the longer branches first keeps the
+        # regex greedy
+        if '' in node:
+            pattern = f'(?:{pattern})?'
+        return pattern
+
+    return build(trie)
@@ -0,0 +1,36 @@
+"""
+Seniority Utilities
+Seniority rules that only need the job title and description text
+"""
+
+from utils.keyword_matcher import KeywordMatcher
+
+# Platforms whose stored seniority_level comes from infer_seniority_level
+# alone; the others read it from page fields that are not stored
+TEXT_SENIORITY_PLATFORMS = ('Indeed',)
+
+# Seniority keywords, checked in this order; default is Non-Entry Level
+SENIORITY_MATCHER = KeywordMatcher({
+    'Internship': ['internship', 'intern', 'trainee'],
+    'Non-Entry Level': ['manager', 'director', 'lead', 'senior', 'head', 'executive', 'principal'],
+    'Entry Level': ['entry', 'junior', 'associate', 'fresh graduate', 'assistant'],
+})
+
+def extract_seniority_level(analyzed):
+    """Extract seniority level from keywords in an AnalyzedJobText's title and description"""
+    return analyzed.first_label(SENIORITY_MATCHER, "Non-Entry Level")
+
+def normalize_seniority_level(seniority_level):
+    """Normalize seniority level to standard categories"""
+    seniority_lower = seniority_level.lower()
+
+    if 'internship' in seniority_lower or 'intern' in seniority_lower:
+        return "Internship"
+    elif any(indicator in seniority_lower for indicator in ['entry', 'junior', 'associate', 'fresh']):
+        return "Entry Level"
+    else:
+        return "Non-Entry Level"
+
+def infer_seniority_level(analyzed):
+    """Normalized seniority level from an AnalyzedJobText's title and description"""
+    return normalize_seniority_level(extract_seniority_level(analyzed))
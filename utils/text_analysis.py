@@ -0,0 +1,46 @@
+"""
+Text Analysis Utilities
+Job text normalized once and shared by every field derived from it
+"""
+
+from functools import cached_property
+
+class AnalyzedJobText:
+    """
+    Title, description and location of one job, lowercased once.
+    The technology extractor, categorizer, seniority and remote option
+    checks all read this instead of rebuilding and lowercasing their own
+    copies, and each KeywordMatcher scans the text at most once per job:
+    its hits are kept in a per-matcher index.
+
+    text is "title description", the text the keyword checks have always
+    read; text_with_location is "title location description", which the
+    remote option checks read.
+    """
+
+    def __init__(self, job_title, description="", location=""):
+        self.title = (job_title or "").lower()
+        self.description = (description or "").lower()
+        self.location = (location or "").lower()
+        self.text = f"{self.title} {self.description}"
+        self._hits = {}
+
+    @cached_property
+    def text_with_location(self):
+        return f"{self.title} {self.location} {self.description}"
+
+    @cached_property
+    def title_clean(self):
+        """Title as the categorizer matches it"""
+        return self.title.strip().replace('|', '').replace('-', ' ')
+
+    def keywords(self, matcher, with_location=False):
+        """Keywords of matcher found in the text, scanned on first use"""
+        key = (matcher, with_location)
+        if key not in self._hits:
+            self._hits[key] = matcher.keywords(self.text_with_location if with_location else self.text)
+        return self._hits[key]
+
+    def first_label(self, matcher, default=None, with_location=False):
+        """Highest-priority label of matcher found in the text, or default"""
+        return matcher.first_label_of(self.keywords(matcher, with_location), default)
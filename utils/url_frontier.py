@@ -0,0 +1,81 @@
+"""
+URL Frontier
+Ordered set of collected job URLs with per-URL metadata and duplicate counts
+"""
+
+from utils.url_utils import canonicalize_url
+
+class UrlFrontier:
+    """
+    Job URLs collected by a run, in insertion order, indexed by canonical
+    URL: a URL seen again with a different tracking parameter, scheme or
+    trailing slash is a duplicate, found with one dict lookup instead of a
+    scan of every URL collected so far. Each URL keeps the form it was
+    first added in, a priority and free-form metadata (e.g. posted_date).
+    """
+
+    def __init__(self, urls=()):
+        self._entries = {}  # canonical URL -> [url, priority, metadata], in insertion order
+        self.duplicates = 0
+        for url in urls:
+            self.add(url)
+
+    def add(self, url, priority=0, **metadata):
+        """
+        Add url with its metadata and return True, or count a duplicate and
+        return False. A duplicate can still raise the stored priority and
+        fill in metadata the first sighting lacked.
+        """
+        canonical_url = canonicalize_url(url)
+        if canonical_url is None:
+            return False
+
+        entry = self._entries.get(canonical_url)
+        if entry is None:
+            self._entries[canonical_url] = [url, priority, metadata]
+            return True
+
+        self.duplicates += 1
+        entry[1] = max(entry[1], priority)
+        for name, value in metadata.items():
+            entry[2].setdefault(name, value)
+        return False
+
+    def add_many(self, urls):
+        """Add every URL and return the new ones, in order"""
+        return [url for url in urls if self.add(url)]
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        """URLs in insertion order"""
+        return (entry[0] for entry in self._entries.values())
+
+    def get(self, url, name=None, default=None):
+        """Metadata of url (one value with name), or default if url was never added"""
+        entry = self._entries.get(canonicalize_url(url))
+        if entry is None:
+            return default
+        return entry[2] if name is None else entry[2].get(name, default)
+
+    def items(self):
+        """(url, metadata) pairs in insertion order"""
+        return ((entry[0], entry[2]) for entry in self._entries.values())
+
+    def by_priority(self):
+        """URLs from highest to lowest priority; equal priorities keep insertion order"""
+        entries = sorted(self._entries.values(), key=lambda entry: -entry[1])
+        return [entry[0] for entry in entries]
+
+    def stats(self):
+        """Unique URLs, duplicates seen and the share of sightings that were duplicates"""
+        seen = len(self._entries) + self.duplicates
+        return {
+            'unique': len(self._entries),
+            'duplicates': self.duplicates,
+            'duplicate_rate': self.duplicates / seen if seen else 0.0,
+        }
@@ -0,0 +1,54 @@
+"""
+URL Utilities
+Functions to normalize job URLs so the same posting always maps to one key
+"""
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the visit and never identify the posting
+TRACKING_PARAMS = {
+    'ref', 'refid', 'trackingid', 'trk', 'trkinfo', 'from', 'tk', 'sid',
+    'origin', 'position', 'pagenum', 'cs', 'vjs', 'fbclid', 'gclid', 'msclkid'
+}
+
+# Indeed links are /rc/clk or /pagead/clk redirects with per-session
+# parameters; the job key (jk, or vjk on search pages) alone identifies
+# the posting, so they all map to /viewjob?jk=<key>
+INDEED_JOB_KEY_PARAMS = ('jk', 'vjk')
+INDEED_SESSION_PARAMS = {'bb', 'xkcb', 'fccid', 'advn', 'tk', 'ad', 'mo', 'p', 'fvj', 'sjdu', 'acatk', 'pub'}
+
+def canonicalize_url(url):
+    """
+    Return the canonical form of a job URL:
+    https scheme, lowercase host, no fragment, no trailing slash,
+    tracking parameters removed and remaining parameters sorted.
+    Indeed job links become https://<host>/viewjob?jk=<job key>.
+    """
+    if not url:
+        return None
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme in ('', 'http'):
+        scheme = 'https'
+
+    netloc = parts.netloc.lower()
+    if netloc.endswith(':443') or netloc.endswith(':80'):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path.rstrip('/') or '/'
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    ignored = TRACKING_PARAMS
+    if netloc == 'indeed.com' or netloc.endswith('.indeed.com'):
+        job_key = next((value for key, value in params if key.lower() in INDEED_JOB_KEY_PARAMS and value), None)
+        if job_key:
+            return urlunsplit(('https', netloc, '/viewjob', urlencode({'jk': job_key}), ''))
+        ignored = TRACKING_PARAMS | INDEED_SESSION_PARAMS
+
+    query = sorted(
+        (key, value) for key, value in params
+        if key.lower() not in ignored and not key.lower().startswith('utm_')
+    )
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))